@@ -0,0 +1,233 @@
+"""
+Mede os codecs de compressão sobre um conjunto de imagens e emite um relatório
+JSON, para comparar versões.
+
+Para cada imagem e codec são registrados a taxa de compressão, a vazão de
+codificação e de decodificação (MB/s, melhor de algumas repetições) e o pico de
+memória: o pico alocado durante a ida e volta, medido com `tracemalloc` em uma
+execução à parte (o rastreamento deixa as alocações mais lentas), e o maior RSS
+do processo até aquele momento.
+
+O conjunto reúne as imagens de `src/main/resources` e imagens geradas: ruído
+uniforme sorteado por `generators/ppm.py` com uma semente fixa (as execuções
+medem sempre os mesmos pixels), blocos planos como `bclc.ppm` e o
+conjunto sintético de `generators/corpus.py` (gradientes, tabuleiros, ruído
+gaussiano, baixo contraste e texto) em 8 e 16 bits.
+
+    PYTHONPATH=src/main/python python src/main/python/benchmarks/bench_compress.py --output compress.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+
+import numpy as np
+
+from compress.band_codecs import CODECS, compress, decompress
+from compress.compress import rle_compress, rle_decompress
+from generators.corpus import corpus
+from generators.ppm import random_bands
+from netpbm import read_image
+
+RESOURCES = "src/main/resources"
+
+
+def load_resources(directory: str = RESOURCES) -> Iterator[tuple[str, np.ndarray, int]]:
+    """
+    Carrega as imagens Netpbm e TIFF de um diretório.
+
+    Args:
+        directory (str): diretório das imagens.
+
+    Yields:
+        tuple[str, np.ndarray, int]: nome, pixels e intensidade máxima.
+    """
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if name.endswith((".pbm", ".pgm", ".ppm")):
+            _, _, maxval, pixels = read_image(path)
+            yield name, np.asarray(pixels), maxval
+        elif name.endswith(".tif"):
+            from PIL import Image
+
+            with Image.open(path) as image:
+                yield name, np.asarray(image.convert("L")), 255
+
+
+def generated_images(seed: int = 0) -> Iterator[tuple[str, np.ndarray, int]]:
+    """
+    Gera as imagens sintéticas do conjunto.
+
+    Args:
+        seed (int): semente do gerador.
+
+    Yields:
+        tuple[str, np.ndarray, int]: nome, pixels e intensidade máxima.
+    """
+    # As mesmas imagens de generators/ppm.py, sorteadas com a semente
+    for width, bits in ((100, 16), (1000, 256)):
+        noise = np.concatenate(list(random_bands(width, width, bits - 1, seed)))
+        yield f"ruido_{width}x{width}_{bits}.ppm", noise, bits - 1
+
+    flat = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    flat[:, 960:] = (200, 30, 30)
+    flat[540:, :480] = (20, 120, 240)
+    yield "blocos_1920x1080.ppm", flat, 255
+
+    gradient = np.linspace(0, 65535, 1024, dtype=np.uint16)
+    yield "gradiente_1024x256_16bits.pgm", np.tile(gradient, (256, 1)), 65535
+
+    yield from corpus(512, 512, 255, "P5", seed)
+    yield from corpus(512, 512, 255, "P6", seed, ["gradiente", "ruido_snr20", "baixo_contraste"])
+    yield from corpus(512, 512, 65535, "P5", seed, ["gradiente", "ruido_snr40", "escura"])
+
+
+def _rle_codec() -> tuple[Callable[[np.ndarray, int], bytes], Callable[[bytes, np.ndarray, int], np.ndarray]]:
+    # RLE de compress.py, sem o contêiner .rle
+    def encode(image: np.ndarray, maxval: int) -> bytes:
+        return rle_compress(image.shape[1], image.shape[0], image, maxval)[2]
+
+    def decode(data: bytes, image: np.ndarray, maxval: int) -> np.ndarray:
+        channels = image.shape[2] if image.ndim == 3 else 1
+        return rle_decompress(image.shape[1], image.shape[0], data, maxval, channels).reshape(image.shape)
+
+    return encode, decode
+
+
+def _registry_codec(name: str) -> tuple[Callable[[np.ndarray, int], bytes], Callable[[bytes, np.ndarray, int], np.ndarray]]:
+    # Codec de compress/band_codecs.py (ou "auto")
+    def encode(image: np.ndarray, maxval: int) -> bytes:
+        return compress(image, name, maxval)
+
+    def decode(data: bytes, image: np.ndarray, maxval: int) -> np.ndarray:
+        return decompress(data)[3]
+
+    return encode, decode
+
+
+def codecs() -> dict[str, tuple[Callable[[np.ndarray, int], bytes], Callable[[bytes, np.ndarray, int], np.ndarray]]]:
+    """
+    Lista os codecs medidos: o RLE de `compress.py` e os de `compress.band_codecs`.
+
+    Returns:
+        dict: nome -> (codificação, decodificação).
+    """
+    available = {"compress.rle": _rle_codec()}
+    for name in [*CODECS, "auto"]:
+        available[name] = _registry_codec(name)
+    return available
+
+
+def _peak_rss() -> int | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Em kB no Linux, em bytes no macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(image: np.ndarray, maxval: int, encode: Callable, decode: Callable, repeat: int = 3) -> dict:
+    """
+    Mede um codec sobre uma imagem e confere a ida e volta.
+
+    Args:
+        image (np.ndarray): pixels.
+        maxval (int): intensidade máxima.
+        encode (Callable): codificação (imagem, maxval) -> bytes.
+        decode (Callable): decodificação (bytes, imagem, maxval) -> pixels.
+        repeat (int): repetições cronometradas (vale o menor tempo).
+
+    Returns:
+        dict: tamanho comprimido, taxa, MB/s de codificação e decodificação e picos de memória.
+    """
+    encode_time = decode_time = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = encode(image, maxval)
+        encode_time = min(encode_time, time.perf_counter() - start)
+        start = time.perf_counter()
+        restored = decode(data, image, maxval)
+        decode_time = min(decode_time, time.perf_counter() - start)
+    if not np.array_equal(restored, image):
+        raise AssertionError("A imagem descomprimida difere da original.")
+
+    tracemalloc.start()
+    decode(encode(image, maxval), image, maxval)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    mb = image.nbytes / 1e6
+    return {
+        "compressed_bytes": len(data),
+        "ratio": round(image.nbytes / len(data), 4),
+        "encode_mb_s": round(mb / encode_time, 3),
+        "decode_mb_s": round(mb / decode_time, 3),
+        "peak_tracemalloc_bytes": peak,
+        "peak_rss_bytes": _peak_rss(),
+    }
+
+
+def run(names: list[str] | None = None, repeat: int = 3, resources: str = RESOURCES) -> dict:
+    """
+    Executa o benchmark sobre todo o conjunto de imagens.
+
+    Args:
+        names (list[str] | None): codecs a medir (padrão: todos).
+        repeat (int): repetições cronometradas.
+        resources (str): diretório das imagens do projeto.
+
+    Returns:
+        dict: relatório, com o ambiente e um resultado por imagem e codec.
+    """
+    available = codecs()
+    names = names or list(available)
+    unknown = set(names) - set(available)
+    if unknown:
+        raise ValueError(f"Codecs desconhecidos: {', '.join(sorted(unknown))}.")
+
+    results = []
+    for image_name, image, maxval in [*load_resources(resources), *generated_images()]:
+        for name in names:
+            result = measure(image, maxval, *available[name], repeat=repeat)
+            results.append({
+                "image": image_name,
+                "shape": list(image.shape),
+                "maxval": maxval,
+                "raw_bytes": image.nbytes,
+                "codec": name,
+                **result,
+            })
+            print(f"{image_name:<32} {name:<16} taxa {result['ratio']:7.2f}  "
+                  f"cod. {result['encode_mb_s']:7.1f} MB/s  dec. {result['decode_mb_s']:7.1f} MB/s",
+                  file=sys.stderr)
+
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--codecs", nargs="+", help="codecs a medir (padrão: todos)")
+    parser.add_argument("--repeat", type=int, default=3, help="repetições cronometradas")
+    parser.add_argument("--output", help="arquivo JSON de saída (padrão: saída padrão)")
+    args = parser.parse_args()
+
+    report = run(args.codecs, args.repeat)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
@@ -0,0 +1,48 @@
+"""
+Mede o ganho do redimensionamento em faixas paralelas (`resize_image(...,
+workers=N)`) ao ampliar a imagem de entrada para 8K, de 1 a 16 processos.
+"""
+
+import os
+import time
+
+from netpbm import read_pgm
+from resize.resize import resize_image
+
+WORKERS = [1, 2, 4, 8, 16]
+
+
+def measure(data, width: int, height: int, mode: str, workers: int, repeat: int = 3) -> float:
+    """
+    Mede o menor tempo de redimensionamento entre algumas repetições.
+
+    Args:
+        data (np.ndarray): imagem de origem.
+        width (int): largura de saída.
+        height (int): altura de saída.
+        mode (str): método de interpolação.
+        workers (int): número de processos.
+        repeat (int): número de repetições.
+
+    Returns:
+        float: menor tempo em segundos.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resize_image(data, width, height, mode=mode, workers=workers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    width, height, bits, data = read_pgm("src/main/resources/Entrada_EscalaCinza.pgm")
+    print(f"Origem {width}x{height}, saída 7680x4320, {os.cpu_count()} núcleos disponíveis")
+
+    for mode in ("nearest", "bilinear", "area"):
+        print(mode)
+        baseline = None
+        for workers in WORKERS:
+            seconds = measure(data, 7680, 4320, mode, workers)
+            baseline = baseline or seconds
+            print(f"  {workers:>2} processos  {seconds:7.3f} s  {baseline / seconds:5.2f}x")
@@ -0,0 +1,54 @@
+"""
+Mede a vazão de codificação e decodificação do codec RLE de `compress.py`, em
+MB/s. A ida e volta do codec é verificada em `src/main/test/test_rle.py`.
+"""
+
+import time
+
+import numpy as np
+
+from compress.compress import rle_compress, rle_decompress
+from generators.corpus import corpus
+from netpbm import read_pgm
+
+
+def throughput(image: np.ndarray, maxval: int, repeat: int = 3) -> tuple[float, float, float]:
+    """
+    Mede a vazão do codec sobre uma imagem.
+
+    Args:
+        image (np.ndarray): imagem (altura x largura x 3).
+        maxval (int): valor máximo de intensidade.
+        repeat (int): número de repetições (vale o menor tempo).
+
+    Returns:
+        tuple[float, float, float]: taxa de compressão, MB/s de codificação e de decodificação.
+    """
+    height, width = image.shape[:2]
+    encode = decode = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compressed = rle_compress(width, height, image, maxval)[2]
+        encode = min(encode, time.perf_counter() - start)
+        start = time.perf_counter()
+        rle_decompress(width, height, compressed, maxval)
+        decode = min(decode, time.perf_counter() - start)
+    mb = image.nbytes / 1e6
+    return image.nbytes / len(compressed), mb / encode, mb / decode
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    photo = read_pgm("src/main/resources/Entrada_EscalaCinza.pgm")[3]
+    flat = np.zeros((1080, 1920, 3), dtype=np.uint8)
+    flat[:, 960:] = (200, 30, 30)
+    cases = [
+        ("blocos planos 1920x1080", flat),
+        ("foto 800x800 (cinza em RGB)", np.repeat(photo[:, :, np.newaxis], 3, axis=2)),
+        ("ruído 1920x1080", rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8)),
+        *((name, image) for name, image, _ in corpus(1920, 1080, 255, "P6",
+                                                     patterns=["gradiente", "tabuleiro", "ruido_snr20", "texto"])),
+    ]
+    for name, image in cases:
+        ratio, encode, decode = throughput(image, 255)
+        print(f"{name:<30} taxa {ratio:6.2f}  codificação {encode:7.1f} MB/s  decodificação {decode:7.1f} MB/s")
@@ -0,0 +1,112 @@
+"""
+Compara o escritor ASCII do pacote `netpbm` com os escritores usados antes
+nos scripts (uma f-string por pixel, um `join` por linha e `np.savetxt`).
+"""
+
+import os
+import tempfile
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from netpbm import write_pgm, write_ppm
+
+
+def legacy_write_ppm(file_path: str, pixels: np.ndarray, max_color: int) -> None:
+    """
+    Escritor PPM original de `compress.py`: uma f-string por pixel.
+
+    Args:
+        file_path (str): caminho do arquivo de saída.
+        pixels (np.ndarray): pixels, altura x largura x 3.
+        max_color (int): intensidade máxima.
+    """
+    height, width = pixels.shape[:2]
+    image_data = pixels.tolist()
+    with open(file_path, 'w') as file:
+        file.write("P3\n")
+        file.write(f"{width} {height}\n")
+        file.write(f"{max_color}\n")
+
+        for row in image_data:
+            for pixel in row:
+                file.write(f"{pixel[0]} {pixel[1]} {pixel[2]} ")
+            file.write("\n")
+
+
+def legacy_save_image(file_path: str, pixels: np.ndarray, bits: int) -> None:
+    """
+    Escritor PGM original dos scripts: um `join` por linha da imagem.
+
+    Args:
+        file_path (str): caminho do arquivo de saída.
+        pixels (np.ndarray): pixels, altura x largura.
+        bits (int): valor máximo (intensidade).
+    """
+    height, width = pixels.shape[:2]
+    data = pixels.ravel().tolist()
+    with open(file_path, 'w') as f:
+        f.write(f"P2\n{width} {height}\n{bits}\n")
+        for i in range(height):
+            f.write(" ".join(map(str, data[i * width:(i + 1) * width])) + "\n")
+
+
+def savetxt_write(file_path: str, pixels: np.ndarray, maxval: int) -> None:
+    """
+    Escritor baseado em `np.savetxt`, uma linha de texto por linha da imagem.
+
+    Args:
+        file_path (str): caminho do arquivo de saída.
+        pixels (np.ndarray): pixels (altura x largura [x 3]).
+        maxval (int): valor máximo de intensidade.
+    """
+    height, width = pixels.shape[:2]
+    magic = "P3" if pixels.ndim == 3 else "P2"
+    with open(file_path, "wb") as f:
+        f.write(f"{magic}\n{width} {height}\n{maxval}\n".encode("ascii"))
+        np.savetxt(f, pixels.reshape(height, -1), fmt="%d")
+
+
+def measure(writer: Callable[[str, np.ndarray, int], None], pixels: np.ndarray, maxval: int,
+            repeat: int = 3) -> tuple[float, int]:
+    """
+    Mede o menor tempo de escrita de uma imagem entre algumas repetições.
+
+    Args:
+        writer (Callable[[str, np.ndarray, int], None]): função de escrita.
+        pixels (np.ndarray): pixels.
+        maxval (int): valor máximo de intensidade.
+        repeat (int): número de repetições.
+
+    Returns:
+        tuple[float, int]: menor tempo em segundos e tamanho do arquivo em bytes.
+    """
+    best = float("inf")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            writer(path, pixels, maxval)
+            best = min(best, time.perf_counter() - start)
+        size = os.path.getsize(path)
+    return best, size
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    cases = [
+        ("PGM 1920x1080", rng.integers(0, 256, (1080, 1920), dtype=np.uint8),
+         [("join por linha", legacy_save_image), ("np.savetxt", savetxt_write), ("netpbm", write_pgm)]),
+        ("PGM 7680x4320", rng.integers(0, 256, (4320, 7680), dtype=np.uint8),
+         [("join por linha", legacy_save_image), ("netpbm", write_pgm)]),
+        ("PPM 1280x720", rng.integers(0, 256, (720, 1280, 3), dtype=np.uint8),
+         [("f-string por pixel", legacy_write_ppm), ("np.savetxt", savetxt_write), ("netpbm", write_ppm)]),
+    ]
+
+    for name, pixels, writers in cases:
+        print(name)
+        mb = pixels.size / 1e6
+        for label, writer in writers:
+            seconds, size = measure(writer, pixels, 255, repeat=1 if pixels.size > 1e7 else 3)
+            print(f"  {label:<20} {seconds:8.3f} s  {mb / seconds:8.1f} Mamostras/s  {size / 1e6:7.1f} MB")
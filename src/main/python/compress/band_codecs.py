@@ -0,0 +1,623 @@
+"""
+Codecs sem perdas para blocos de linhas, com um registro de codecs.
+
+Um codec combina um preditor por linha (como no PNG: nenhum, Sub, Up ou Paeth),
+que troca cada amostra pelo resíduo da predição, com um codificador: o RLE de
+`compress.py`, Huffman canônico ou uma variante de LZ77. Os codecs ficam em
+`CODECS`, indexados pelo nome ("rle", "paeth+huffman", ...), e outros podem ser
+adicionados com `register_codec`.
+
+`compress` divide a imagem em blocos de linhas e grava, para cada bloco, o
+identificador do codec usado; com codec="auto", cada bloco usa o codec que
+gera o menor fluxo em uma amostra das suas linhas.
+"""
+
+import heapq
+import struct
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import NamedTuple
+
+import numpy as np
+
+from compress.compress import _chain, rle_decode, rle_encode
+from netpbm import dtype_for_maxval, read_pgm
+
+# Linhas por bloco e linhas da amostra usada na escolha automática do codec
+BAND_ROWS = 64
+SAMPLE_ROWS = 16
+
+# Maior comprimento de um código de Huffman (define o tamanho da tabela de decodificação)
+HUFFMAN_MAX_LENGTH = 15
+
+# LZ77: menor e maior repetição codificada, maior distância e maior sequência literal
+LZ_MIN_MATCH = 4
+LZ_MAX_MATCH = LZ_MIN_MATCH + 127
+LZ_WINDOW = 65535
+LZ_MAX_LITERALS = 128
+
+
+def _to_bytes(samples: np.ndarray) -> np.ndarray:
+    # Amostras de 16 bits viram dois bytes, em big-endian
+    samples = np.ascontiguousarray(samples).ravel()
+    if samples.dtype.itemsize == 1:
+        return samples.view(np.uint8)
+    return samples.astype(">u2").view(np.uint8)
+
+
+def _from_bytes(data: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    if dtype.itemsize == 1:
+        return data.astype(dtype, copy=False)
+    return (data[0::2].astype(np.uint16) << 8) | data[1::2]
+
+
+# Preditores: operam sobre blocos (linhas x canais x largura), com aritmética
+# modular no tipo das amostras; a primeira linha e a primeira coluna de cada
+# bloco são previstas a partir de zero, então os blocos são independentes
+
+def _sub(band: np.ndarray) -> np.ndarray:
+    residual = band.copy()
+    residual[..., 1:] -= band[..., :-1]
+    return residual
+
+
+def _unsub(residual: np.ndarray) -> np.ndarray:
+    return np.cumsum(residual, axis=2, dtype=residual.dtype)
+
+
+def _up(band: np.ndarray) -> np.ndarray:
+    residual = band.copy()
+    residual[1:] -= band[:-1]
+    return residual
+
+
+def _unup(residual: np.ndarray) -> np.ndarray:
+    return np.cumsum(residual, axis=0, dtype=residual.dtype)
+
+
+def _paeth_predict(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    # Vizinho (esquerda, acima ou diagonal) mais próximo de a + b - c
+    pa = np.abs(b - c)
+    pb = np.abs(a - c)
+    pc = np.abs(a + b - 2 * c)
+    return np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+
+
+def _paeth(band: np.ndarray) -> np.ndarray:
+    padded = np.zeros((band.shape[0] + 1, band.shape[1], band.shape[2] + 1), dtype=np.int64)
+    padded[1:, :, 1:] = band
+    prediction = _paeth_predict(padded[1:, :, :-1], padded[:-1, :, 1:], padded[:-1, :, :-1])
+    return band - prediction.astype(band.dtype)
+
+
+def _unpaeth(residual: np.ndarray) -> np.ndarray:
+    # Cada amostra depende da esquerda e da linha de cima: as amostras de uma
+    # mesma antidiagonal são independentes e reconstruídas juntas
+    rows, _, width = residual.shape
+    modulus = 1 << (8 * residual.dtype.itemsize)
+    padded = np.zeros((rows + 1, residual.shape[1], width + 1), dtype=np.int64)
+    for diagonal in range(rows + width - 1):
+        row = np.arange(max(0, diagonal - width + 1), min(rows, diagonal + 1))
+        col = diagonal - row
+        prediction = _paeth_predict(padded[row + 1, :, col], padded[row, :, col + 1], padded[row, :, col])
+        padded[row + 1, :, col + 1] = (residual[row, :, col] + prediction) % modulus
+    return padded[1:, :, 1:].astype(residual.dtype)
+
+
+# Preditores disponíveis: (aplicação, inversa)
+PREDICTORS: dict[str, tuple[Callable[[np.ndarray], np.ndarray], Callable[[np.ndarray], np.ndarray]]] = {
+    "none": (np.copy, np.copy),
+    "sub": (_sub, _unsub),
+    "up": (_up, _unup),
+    "paeth": (_paeth, _unpaeth),
+}
+
+
+def _huffman_tree_lengths(counts: np.ndarray) -> np.ndarray:
+    lengths = np.zeros(256, dtype=np.int64)
+    symbols = np.flatnonzero(counts)
+    if symbols.size == 1:
+        lengths[symbols] = 1
+        return lengths
+    heap = [(int(counts[s]), i, [int(s)]) for i, s in enumerate(symbols)]
+    heapq.heapify(heap)
+    order = len(heap)
+    while len(heap) > 1:
+        count_a, _, group_a = heapq.heappop(heap)
+        count_b, _, group_b = heapq.heappop(heap)
+        # Cada fusão aprofunda em um nível todos os símbolos das duas subárvores
+        lengths[group_a + group_b] += 1
+        heapq.heappush(heap, (count_a + count_b, order, group_a + group_b))
+        order += 1
+    return lengths
+
+
+def huffman_lengths(counts: np.ndarray) -> np.ndarray:
+    """
+    Calcula o comprimento do código de Huffman de cada byte, limitado a
+    `HUFFMAN_MAX_LENGTH` bits.
+
+    Se a árvore ótima passar do limite, as frequências são reduzidas à metade
+    (sem zerar nenhuma) até que caiba.
+
+    Args:
+        counts (np.ndarray): frequência de cada um dos 256 bytes.
+
+    Returns:
+        np.ndarray: comprimento de cada código (0 para bytes ausentes).
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    while True:
+        lengths = _huffman_tree_lengths(counts)
+        if lengths.max() <= HUFFMAN_MAX_LENGTH:
+            return lengths
+        counts = np.where(counts > 0, (counts + 1) // 2, 0)
+
+
+def canonical_codes(lengths: np.ndarray) -> np.ndarray:
+    """
+    Atribui os códigos canônicos: em ordem de (comprimento, símbolo), cada código
+    é o anterior mais um, deslocado para o novo comprimento.
+
+    Args:
+        lengths (np.ndarray): comprimento do código de cada byte.
+
+    Returns:
+        np.ndarray: código de cada byte.
+    """
+    order = np.lexsort((np.arange(lengths.size), lengths))
+    codes = np.zeros(lengths.size, dtype=np.int64)
+    code = 0
+    previous = 0
+    for symbol in order[lengths[order] > 0]:
+        length = int(lengths[symbol])
+        code <<= length - previous
+        codes[symbol] = code
+        code += 1
+        previous = length
+    return codes
+
+
+def huffman_encode(data: np.ndarray) -> bytes:
+    """
+    Codifica bytes com um código de Huffman canônico.
+
+    O fluxo começa com os 256 comprimentos de código (um byte cada), seguidos
+    dos bits dos códigos, do mais significativo para o menos significativo.
+
+    Args:
+        data (np.ndarray): bytes (uint8).
+
+    Returns:
+        bytes: fluxo comprimido.
+    """
+    lengths = huffman_lengths(np.bincount(data, minlength=256))
+    codes = canonical_codes(lengths)
+    size = lengths[data]
+    value = codes[data]
+    start = np.cumsum(size) - size
+    bits = np.zeros(int(size.sum()), dtype=np.uint8)
+    # Uma passada por posição de bit, para todos os códigos que a possuem
+    for k in range(int(lengths.max())):
+        has_bit = size > k
+        bits[start[has_bit] + k] = (value[has_bit] >> (size[has_bit] - 1 - k)) & 1
+    return lengths.astype(np.uint8).tobytes() + np.packbits(bits).tobytes()
+
+
+def huffman_decode(data: bytes, count: int) -> np.ndarray:
+    """
+    Decodifica um fluxo produzido por `huffman_encode`.
+
+    Para cada posição de bit, os próximos bits são consultados em uma tabela que
+    devolve o símbolo e o comprimento do código que começaria ali; os códigos de
+    fato presentes são encontrados seguindo esses saltos com `_chain`.
+
+    Args:
+        data (bytes): fluxo comprimido.
+        count (int): número de bytes esperado.
+
+    Returns:
+        np.ndarray: bytes decodificados.
+    """
+    stream = np.frombuffer(data, dtype=np.uint8)
+    if stream.size < 256:
+        raise ValueError("Fluxo Huffman truncado.")
+    if count == 0:
+        return np.empty(0, dtype=np.uint8)
+    lengths = stream[:256].astype(np.int64)
+    limit = int(lengths.max())
+    used = np.flatnonzero(lengths)
+    span = 1 << (limit - lengths[used])
+    if not 0 < limit <= HUFFMAN_MAX_LENGTH or span.sum() > 1 << limit:
+        raise ValueError("Tabela Huffman inválida.")
+
+    # Tabela indexada pelos próximos `limit` bits; prefixos sem código ficam com -1
+    codes = canonical_codes(lengths)
+    first = np.cumsum(span) - span
+    entry = np.repeat((codes[used] << (limit - lengths[used])) - first, span) + np.arange(int(span.sum()))
+    table_symbol = np.full(1 << limit, -1, dtype=np.int64)
+    table_length = np.ones(1 << limit, dtype=np.int64)
+    table_symbol[entry] = np.repeat(used, span)
+    table_length[entry] = np.repeat(lengths[used], span)
+
+    bits = np.unpackbits(stream[256:])
+    n = bits.size
+    padded = np.concatenate([bits, np.zeros(limit, dtype=np.uint8)]).astype(np.int32)
+    window = np.zeros(n, dtype=np.int32)
+    for k in range(limit):
+        window = (window << 1) | padded[k:k + n]
+
+    position = _chain(np.arange(n) + table_length[window])[:count]
+    if position.size < count or position[-1] + table_length[window[position[-1]]] > n:
+        raise ValueError("Fluxo Huffman truncado.")
+    symbols = table_symbol[window[position]]
+    if (symbols < 0).any():
+        raise ValueError("Fluxo Huffman corrompido.")
+    return symbols.astype(np.uint8)
+
+
+def _match_lengths(data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Para cada posição, a ocorrência anterior mais próxima dos mesmos 4 bytes
+    # e quantos bytes coincidem a partir dela
+    n = data.size
+    length = np.zeros(n, dtype=np.int64)
+    previous = np.full(n, -1, dtype=np.int64)
+    if n < LZ_MIN_MATCH:
+        return length, previous
+    wide = data.astype(np.int64)
+    key = (wide[:-3] << 24) | (wide[1:-2] << 16) | (wide[2:-1] << 8) | wide[3:]
+    order = np.argsort(key, kind="stable")
+    same = key[order[1:]] == key[order[:-1]]
+    previous[order[1:][same]] = order[:-1][same]
+    valid = (previous >= 0) & (np.arange(n) - previous <= LZ_WINDOW)
+    length[valid] = LZ_MIN_MATCH
+
+    # Estende as repetições de 4 em 4 bytes (comparando as chaves) e depois byte a byte
+    active = np.flatnonzero(valid)
+    while active.size:
+        k = length[active]
+        ok = (k + 4 <= LZ_MAX_MATCH) & (active + k <= n - 4)
+        ok[ok] = key[active[ok] + k[ok]] == key[previous[active[ok]] + k[ok]]
+        active = active[ok]
+        length[active] += 4
+    active = np.flatnonzero(valid)
+    for _ in range(3):
+        k = length[active]
+        ok = (k < LZ_MAX_MATCH) & (active + k < n)
+        ok[ok] = data[active[ok] + k[ok]] == data[previous[active[ok]] + k[ok]]
+        active = active[ok]
+        length[active] += 1
+    return length, previous
+
+
+def lz77_encode(data: np.ndarray) -> bytes:
+    """
+    Codifica bytes com uma variante de LZ77 de análise gulosa.
+
+    Cada pacote começa com um byte de controle: c < 128 indica c + 1 bytes
+    literais a seguir; c >= 128 indica uma repetição de c - 128 + 4 bytes,
+    seguida da distância (2 bytes, big-endian) até a ocorrência anterior. As
+    repetições candidatas são encontradas ordenando as chaves de 4 bytes, e a
+    análise gulosa é resolvida com `_chain`.
+
+    Args:
+        data (np.ndarray): bytes (uint8).
+
+    Returns:
+        bytes: fluxo comprimido.
+    """
+    n = data.size
+    if n == 0:
+        return b""
+    length, previous = _match_lengths(data)
+    token = _chain(np.arange(n) + np.maximum(length, 1))
+    literal = length[token] < LZ_MIN_MATCH
+
+    # Literais consecutivos são agrupados em pacotes de até 128
+    new_stretch = np.ones(token.size, dtype=bool)
+    new_stretch[1:] = ~(literal[:-1] & literal[1:])
+    index = np.arange(token.size)
+    position = index - np.maximum.accumulate(np.where(new_stretch, index, 0))
+    packet_first = np.flatnonzero(new_stretch | (position % LZ_MAX_LITERALS == 0))
+    packet_literal = literal[packet_first]
+    packet_units = np.diff(np.append(packet_first, token.size))
+    packet_start = token[packet_first]
+
+    size = np.where(packet_literal, 1 + packet_units, 3)
+    offset = np.cumsum(size) - size
+    stream = np.empty(int(size.sum()), dtype=np.uint8)
+    match_length = length[packet_start]
+    stream[offset] = np.where(packet_literal, packet_units - 1, 128 + match_length - LZ_MIN_MATCH)
+
+    distance = (packet_start - previous[packet_start])[~packet_literal]
+    stream[offset[~packet_literal] + 1] = distance >> 8
+    stream[offset[~packet_literal] + 2] = distance & 0xFF
+
+    units = packet_units[packet_literal]
+    first = np.cumsum(units) - units
+    run = np.arange(int(units.sum()))
+    stream[np.repeat(offset[packet_literal] + 1 - first, units) + run] = \
+        data[np.repeat(packet_start[packet_literal] - first, units) + run]
+    return stream.tobytes()
+
+
+def lz77_decode(data: bytes, count: int) -> np.ndarray:
+    """
+    Decodifica um fluxo produzido por `lz77_encode`.
+
+    Cada byte de uma repetição aponta para um byte anterior da saída; essas
+    referências são resolvidas por duplicação de ponteiros até chegarem a um
+    byte literal.
+
+    Args:
+        data (bytes): fluxo comprimido.
+        count (int): número de bytes esperado.
+
+    Returns:
+        np.ndarray: bytes decodificados.
+    """
+    stream = np.frombuffer(data, dtype=np.uint8)
+    if stream.size == 0:
+        if count:
+            raise ValueError("Fluxo LZ77 vazio.")
+        return np.empty(0, dtype=np.uint8)
+
+    code = stream.astype(np.int64)
+    literal_code = code < 128
+    jump = np.arange(1, stream.size + 1) + np.where(literal_code, code + 1, 2)
+    packet = _chain(jump)
+    if jump[packet[-1]] != stream.size:
+        raise ValueError("Fluxo LZ77 corrompido.")
+    literal = literal_code[packet]
+    length = np.where(literal, code[packet] + 1, code[packet] - 128 + LZ_MIN_MATCH)
+    if int(length.sum()) != count:
+        raise ValueError(f"Fluxo LZ77 com {int(length.sum())} bytes, esperado {count}.")
+
+    out_start = np.cumsum(length) - length
+    match = packet[~literal]
+    distance = np.zeros(packet.size, dtype=np.int64)
+    distance[~literal] = (code[match + 1] << 8) | code[match + 2]
+    if (distance[~literal] == 0).any() or (out_start - distance < 0).any():
+        raise ValueError("Fluxo LZ77 corrompido.")
+
+    # Bytes literais apontam para si mesmos; os demais, para `distance` bytes antes
+    within = np.arange(count) - np.repeat(out_start, length)
+    reference = np.arange(count) - np.repeat(distance, length)
+    source = np.zeros(count, dtype=np.int64)
+    is_literal = np.repeat(literal, length)
+    source[is_literal] = (np.repeat(packet + 1, length) + within)[is_literal]
+    while True:
+        resolved = reference[reference]
+        if np.array_equal(resolved, reference):
+            break
+        reference = resolved
+    return stream[source[reference]]
+
+
+def _store(data: np.ndarray) -> bytes:
+    return data.tobytes()
+
+
+def _unstore(data: bytes, count: int) -> np.ndarray:
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def _encode_bytes(samples: np.ndarray, encode: Callable[[np.ndarray], bytes]) -> bytes:
+    return encode(_to_bytes(samples))
+
+
+def _decode_bytes(data: bytes, count: int, dtype: np.dtype, decode: Callable[[bytes, int], np.ndarray]) -> np.ndarray:
+    raw = decode(data, count * dtype.itemsize)
+    if raw.size != count * dtype.itemsize:
+        raise ValueError(f"Bloco com {raw.size} bytes, esperado {count * dtype.itemsize}.")
+    return _from_bytes(raw, dtype)
+
+
+def _rle_samples(samples: np.ndarray) -> bytes:
+    # Os resíduos ocupam toda a faixa do tipo, não só até o valor máximo da imagem
+    return rle_encode(samples, max(samples.size, 1), np.iinfo(samples.dtype).max)
+
+
+def _unrle_samples(data: bytes, count: int, dtype: np.dtype) -> np.ndarray:
+    return rle_decode(data, count, np.iinfo(dtype).max)
+
+
+# Codificadores: (codificação de amostras, decodificação de `count` amostras do tipo dado)
+CODERS: dict[str, tuple[Callable[[np.ndarray], bytes], Callable[[bytes, int, np.dtype], np.ndarray]]] = {
+    "raw": (partial(_encode_bytes, encode=_store), partial(_decode_bytes, decode=_unstore)),
+    "rle": (_rle_samples, _unrle_samples),
+    "huffman": (partial(_encode_bytes, encode=huffman_encode), partial(_decode_bytes, decode=huffman_decode)),
+    "lz77": (partial(_encode_bytes, encode=lz77_encode), partial(_decode_bytes, decode=lz77_decode)),
+}
+
+
+class Codec(NamedTuple):
+    """
+    Codec registrado.
+
+    Attributes:
+        codec_id (int): identificador gravado no fluxo de cada bloco.
+        encode (Callable[[np.ndarray], bytes]): comprime um bloco (linhas x canais x largura).
+        decode (Callable[[bytes, tuple[int, int, int], np.dtype], np.ndarray]): reconstrói
+            um bloco a partir do fluxo, do formato e do tipo das amostras.
+    """
+    codec_id: int
+    encode: Callable[[np.ndarray], bytes]
+    decode: Callable[[bytes, tuple[int, int, int], np.dtype], np.ndarray]
+
+
+CODECS: dict[str, Codec] = {}
+
+
+def register_codec(name: str, codec_id: int, encode: Callable[[np.ndarray], bytes],
+                   decode: Callable[[bytes, tuple[int, int, int], np.dtype], np.ndarray]) -> None:
+    """
+    Registra um codec de blocos.
+
+    Args:
+        name (str): nome do codec.
+        codec_id (int): identificador (0 a 255), único.
+        encode (Callable[[np.ndarray], bytes]): comprime um bloco.
+        decode (Callable[[bytes, tuple[int, int, int], np.dtype], np.ndarray]): descomprime um bloco.
+    """
+    if name in CODECS or name == "auto":
+        raise ValueError(f"Codec já registrado: {name}.")
+    if not 0 <= codec_id < 256 or any(codec.codec_id == codec_id for codec in CODECS.values()):
+        raise ValueError(f"Identificador de codec inválido ou em uso: {codec_id}.")
+    CODECS[name] = Codec(codec_id, encode, decode)
+
+
+def _encode_pipeline(band: np.ndarray, predictor: str, coder: str) -> bytes:
+    return CODERS[coder][0](PREDICTORS[predictor][0](band).ravel())
+
+
+def _decode_pipeline(data: bytes, shape: tuple[int, int, int], dtype: np.dtype, predictor: str,
+                     coder: str) -> np.ndarray:
+    residual = CODERS[coder][1](data, shape[0] * shape[1] * shape[2], dtype)
+    return PREDICTORS[predictor][1](residual.reshape(shape))
+
+
+# Codecs embutidos: cada codificador, sozinho ou precedido de um preditor
+for _coder in CODERS:
+    for _predictor in PREDICTORS:
+        if _coder == "raw" and _predictor != "none":
+            continue
+        register_codec(_coder if _predictor == "none" else f"{_predictor}+{_coder}", len(CODECS),
+                       partial(_encode_pipeline, predictor=_predictor, coder=_coder),
+                       partial(_decode_pipeline, predictor=_predictor, coder=_coder))
+
+
+def _sample(band: np.ndarray) -> np.ndarray:
+    # Até 4 trechos de linhas consecutivas espalhados pelo bloco (o preditor Up
+    # precisa de linhas vizinhas)
+    rows = band.shape[0]
+    if rows <= SAMPLE_ROWS:
+        return band
+    chunk = SAMPLE_ROWS // 4
+    starts = np.linspace(0, rows - chunk, 4).astype(int)
+    return np.concatenate([band[start:start + chunk] for start in starts])
+
+
+def choose_codec(band: np.ndarray) -> str:
+    """
+    Escolhe o codec que gera o menor fluxo para uma amostra das linhas do bloco.
+
+    Args:
+        band (np.ndarray): bloco (linhas x canais x largura).
+
+    Returns:
+        str: nome do codec escolhido.
+    """
+    sample = _sample(band)
+    return min(CODECS, key=lambda name: len(CODECS[name].encode(sample)))
+
+
+# Fluxo comprimido: cabeçalho e, para cada bloco, o identificador do codec,
+# o tamanho e os dados comprimidos
+CODEC_MAGIC = b"PCDC"
+CODEC_VERSION = 1
+CODEC_HEADER = struct.Struct("<4sBBxxIIII")
+BAND_HEADER = struct.Struct("<BI")
+
+
+def compress(image_data: np.ndarray, codec: str = "auto", maxval: int = 255, rows: int = BAND_ROWS) -> bytes:
+    """
+    Comprime uma imagem em blocos de linhas, cada um com o seu codec.
+
+    Args:
+        image_data (np.ndarray): Dados da imagem (altura x largura [x canais]).
+        codec (str): Nome de um codec de `CODECS`, ou "auto" para escolher por bloco.
+        maxval (int): Intensidade máxima da imagem.
+        rows (int): Linhas por bloco.
+
+    Returns:
+        bytes: Imagem comprimida.
+    """
+    if codec != "auto" and codec not in CODECS:
+        raise ValueError(f"Codec desconhecido: {codec}.")
+    image_data = np.asarray(image_data)
+    height, width = image_data.shape[:2]
+    channels = image_data.shape[2] if image_data.ndim == 3 else 1
+    # Blocos em disposição planar: linha, canal, coluna
+    planar = image_data.reshape(height, width, channels).transpose(0, 2, 1)
+    planar = planar.astype(dtype_for_maxval(maxval), copy=False)
+
+    parts = [CODEC_HEADER.pack(CODEC_MAGIC, CODEC_VERSION, channels, width, height, maxval, rows)]
+    for start in range(0, height, rows):
+        band = np.ascontiguousarray(planar[start:start + rows])
+        name = choose_codec(band) if codec == "auto" else codec
+        data = CODECS[name].encode(band)
+        parts.append(BAND_HEADER.pack(CODECS[name].codec_id, len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def _bands(data: bytes) -> tuple[tuple[int, int, int, int, int], Iterator[tuple[str, int, int, bytes]]]:
+    if len(data) < CODEC_HEADER.size:
+        raise ValueError("Fluxo comprimido truncado.")
+    magic, version, channels, width, height, maxval, rows = CODEC_HEADER.unpack_from(data)
+    if magic != CODEC_MAGIC or version != CODEC_VERSION or rows == 0:
+        raise ValueError("Fluxo comprimido inválido ou de versão não suportada.")
+    names = {codec.codec_id: name for name, codec in CODECS.items()}
+
+    def bands() -> Iterator[tuple[str, int, int, bytes]]:
+        offset = CODEC_HEADER.size
+        for start in range(0, height, rows):
+            if offset + BAND_HEADER.size > len(data):
+                raise ValueError("Fluxo comprimido truncado.")
+            codec_id, size = BAND_HEADER.unpack_from(data, offset)
+            offset += BAND_HEADER.size
+            if codec_id not in names or offset + size > len(data):
+                raise ValueError(f"Bloco inválido na linha {start}.")
+            yield names[codec_id], start, min(start + rows, height), data[offset:offset + size]
+            offset += size
+
+    return (width, height, maxval, channels, rows), bands()
+
+
+def band_codecs(data: bytes) -> list[str]:
+    """
+    Lista o codec usado em cada bloco de um fluxo produzido por `compress`.
+
+    Args:
+        data (bytes): Imagem comprimida.
+
+    Returns:
+        list[str]: nome do codec de cada bloco, em ordem.
+    """
+    return [name for name, _, _, _ in _bands(data)[1]]
+
+
+def decompress(data: bytes) -> tuple[int, int, int, np.ndarray]:
+    """
+    Descomprime uma imagem produzida por `compress`.
+
+    Args:
+        data (bytes): Imagem comprimida.
+
+    Returns:
+        tuple[int, int, int, np.ndarray]: largura, altura, intensidade máxima e os
+        pixels (altura x largura [x canais]).
+    """
+    (width, height, maxval, channels, _), bands = _bands(data)
+    dtype = dtype_for_maxval(maxval)
+    image = np.empty((height, width, channels), dtype=dtype)
+    for name, start, stop, chunk in bands:
+        band = CODECS[name].decode(chunk, (stop - start, channels, width), dtype)
+        image[start:stop] = band.transpose(0, 2, 1)
+    if channels == 1:
+        image = image[:, :, 0]
+    return width, height, maxval, image
+
+
+if __name__ == "__main__":
+    pgm_file = "src/main/resources/EntradaEscalaCinza.pgm"
+
+    width, height, max_gray, image_data = read_pgm(pgm_file)
+    print(f"Imagem carregada: {width}x{height}, Max Gray: {max_gray}")
+
+    for name in ("rle", "paeth+rle", "huffman", "paeth+huffman", "lz77", "auto"):
+        compressed = compress(image_data, name, max_gray)
+        assert np.array_equal(decompress(compressed)[3], image_data)
+        print(f"{name:>14}: {len(compressed)} bytes ({image_data.nbytes / len(compressed):.2f}:1)")
+    print(f"Codecs escolhidos por bloco: {band_codecs(compress(image_data, 'auto', max_gray))}")
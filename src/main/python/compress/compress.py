@@ -1,171 +1,531 @@
-def read_ppm(filename: str) -> tuple[int, int, int, list[list[list[int]]]]:
+import os
+import struct
+import zlib
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, NamedTuple
+
+import numpy as np
+
+from netpbm import read_bands, read_ppm, write_ppm
+
+# Maior repetição ou sequência literal representável por um código de controle
+MAX_PACKET = 127
+
+
+def _sample_dtype(maxval: int) -> np.dtype:
     """
-    Lê uma imagem no formato PPM e retorna o cabeçalho e os dados da imagem.
-    
+    Tipo usado para gravar as amostras no fluxo comprimido.
+
     Args:
-        filename (str): Caminho para o arquivo de imagem.
-    
+        maxval (int): valor máximo de intensidade.
+
     Returns:
-        tuple[int, int, int, list[list[list[int]]]]: Uma tupla contendo a largura, altura, intensidade máxima e os dados da imagem.
+        np.dtype: uint8 até 255, uint16 big-endian acima disso.
     """
-    with open(filename, 'r') as f:
-        if f.readline().strip() != 'P3':
-            raise ValueError("Apenas o formato P3 é suportado.")
+    return np.dtype(np.uint8) if maxval < 256 else np.dtype(">u2")
 
-        dimensions = f.readline().strip()
-        while dimensions.startswith('#'):
-            dimensions = f.readline().strip()
 
-        width, height = map(int, dimensions.split())
-        
-        bits = int(f.readline().strip())
+def _encode(x: np.ndarray, segment: int, maxval: int) -> tuple[bytes, np.ndarray, np.ndarray]:
+    """
+    Codifica amostras em RLE e localiza cada pacote no fluxo (veja `rle_encode`).
+
+    Args:
+        x (np.ndarray): amostras (1D).
+        segment (int): tamanho de cada segmento codificado de forma independente.
+        maxval (int): valor máximo de intensidade.
+
+    Returns:
+        tuple[bytes, np.ndarray, np.ndarray]: fluxo comprimido, índice da primeira
+        amostra de cada pacote e posição (em bytes) de cada pacote no fluxo.
+    """
+    n = x.size
+    if n == 0:
+        return b"", np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    # Início de cada sequência de valores iguais (nova sequência também a cada segmento)
+    boundary = np.empty(n, dtype=bool)
+    boundary[0] = True
+    np.not_equal(x[1:], x[:-1], out=boundary[1:])
+    boundary[::segment] = True
+    run_start = np.flatnonzero(boundary)
+    run_length = np.diff(np.append(run_start, n))
+
+    if run_length.max() <= MAX_PACKET:
+        unit_start, unit_length = run_start, run_length
+    else:
+        # Sequências longas são divididas em unidades de até 127 amostras
+        units_per_run = -(-run_length // MAX_PACKET)
+        run_of_unit = np.repeat(np.arange(run_start.size), units_per_run)
+        first_unit = np.cumsum(units_per_run) - units_per_run
+        k = np.arange(run_of_unit.size) - first_unit[run_of_unit]
+        unit_start = run_start[run_of_unit] + k * MAX_PACKET
+        unit_length = np.minimum(run_length[run_of_unit] - k * MAX_PACKET, MAX_PACKET)
+
+    # Unidades de uma amostra são literais; as consecutivas (no mesmo segmento)
+    # são agrupadas em pacotes de até 127
+    literal = unit_length == 1
+    new_stretch = np.ones(unit_start.size, dtype=bool)
+    new_stretch[1:] = ~(literal[:-1] & literal[1:]) | (unit_start[1:] % segment == 0)
+    index = np.arange(unit_start.size)
+    position = index - np.maximum.accumulate(np.where(new_stretch, index, 0))
+    new_packet = new_stretch | (position % MAX_PACKET == 0)
+
+    packet_first = np.flatnonzero(new_packet)
+    packet_start = unit_start[packet_first]
+    packet_literal = literal[packet_first]
+    packet_units = np.diff(np.append(packet_first, unit_start.size))
+    # Pacote literal: -n seguido de n amostras; repetição: n seguido de uma amostra
+    control = np.where(packet_literal, -packet_units, unit_length[packet_first])
+    payload = np.where(packet_literal, packet_units, 1)
+
+    # Posição de cada pacote no fluxo, em tokens (controle + amostras)
+    tokens = 1 + payload
+    token_offset = np.cumsum(tokens) - tokens
+    is_payload = np.ones(int(tokens.sum()), dtype=bool)
+    is_payload[token_offset] = False
+    payload_first = np.cumsum(payload) - payload
+    source = np.repeat(packet_start - payload_first, payload) + np.arange(int(payload.sum()))
+
+    # Converte os tokens em bytes: controle com 1 byte, amostras com 1 ou 2
+    dtype = _sample_dtype(maxval)
+    stream = np.empty((is_payload.size, dtype.itemsize), dtype=np.uint8)
+    stream[token_offset, 0] = control.astype(np.int8).view(np.uint8)
+    stream[is_payload] = x[source].astype(dtype).view(np.uint8).reshape(-1, dtype.itemsize)
+    packet_offset = token_offset + (dtype.itemsize - 1) * payload_first
+    if dtype.itemsize == 1:
+        return stream.tobytes(), packet_start, packet_offset
+    # O controle ocupa só o primeiro byte da sua linha
+    mask = np.repeat(is_payload[:, np.newaxis], dtype.itemsize, axis=1)
+    mask[:, 0] = True
+    return stream[mask].tobytes(), packet_start, packet_offset
+
+
+def rle_encode(samples: np.ndarray, segment: int, maxval: int = 255) -> bytes:
+    """
+    Codifica amostras em RLE no estilo PackBits, sem laços por amostra.
+
+    Cada pacote começa com um código de controle de um byte com sinal: um valor
+    positivo n (2 a 127) indica que a próxima amostra se repete n vezes; um valor
+    negativo -n (1 a 127) indica que as n amostras seguintes são literais. Os
+    pacotes nunca atravessam o limite de um segmento (uma linha de um canal).
+
+    Args:
+        samples (np.ndarray): amostras, em ordem, com tamanho múltiplo de `segment`.
+        segment (int): tamanho de cada segmento codificado de forma independente.
+        maxval (int): valor máximo de intensidade (define 1 ou 2 bytes por amostra).
+
+    Returns:
+        bytes: fluxo comprimido.
+    """
+    return _encode(np.ascontiguousarray(samples).ravel(), segment, maxval)[0]
+
+
+def rle_encode_rows(samples: np.ndarray, segment: int, maxval: int = 255) -> tuple[bytes, np.ndarray]:
+    """
+    Codifica amostras em RLE e devolve a posição de cada linha no fluxo.
+
+    Args:
+        samples (np.ndarray): amostras organizadas em linhas (linhas x amostras por linha),
+            com o tamanho da linha múltiplo de `segment`.
+        segment (int): tamanho de cada segmento codificado de forma independente.
+        maxval (int): valor máximo de intensidade.
+
+    Returns:
+        tuple[bytes, np.ndarray]: fluxo comprimido e a posição, em bytes, do início
+        de cada linha (com uma entrada final igual ao tamanho do fluxo).
+    """
+    samples = np.ascontiguousarray(samples)
+    rows = samples.shape[0]
+    data, packet_start, packet_offset = _encode(samples.ravel(), segment, maxval)
+    # Toda linha começa em um limite de segmento, e portanto em um pacote
+    row_start = np.arange(rows) * (samples.size // max(rows, 1))
+    offsets = np.empty(rows + 1, dtype=np.uint64)
+    offsets[:rows] = packet_offset[np.searchsorted(packet_start, row_start)]
+    offsets[rows] = len(data)
+    return data, offsets
+
+
+def _chain(jump: np.ndarray) -> np.ndarray:
+    """
+    Encontra as posições alcançadas a partir de 0 seguindo `jump`, por duplicação
+    de ponteiros (log2(n) passadas vetorizadas em vez de um laço por pacote).
+
+    Args:
+        jump (np.ndarray): próxima posição a partir de cada posição (n = fim).
+
+    Returns:
+        np.ndarray: posições visitadas, em ordem.
+    """
+    n = jump.size
+    step = np.append(np.minimum(jump, n), n)
+    visited = np.zeros(n + 1, dtype=bool)
+    visited[0] = True
+    while not visited[n]:
+        # Após k passadas, visited contém os 2^k primeiros saltos
+        visited[step[visited]] = True
+        step = step[step]
+    return np.flatnonzero(visited[:n])
+
+
+def rle_decode(data: bytes, count: int, maxval: int = 255) -> np.ndarray:
+    """
+    Decodifica um fluxo produzido por `rle_encode`.
+
+    Os códigos de controle são localizados com `_chain` e as amostras expandidas
+    com `np.repeat`.
+
+    Args:
+        data (bytes): fluxo comprimido.
+        count (int): número de amostras esperado.
+        maxval (int): valor máximo de intensidade.
+
+    Returns:
+        np.ndarray: amostras decodificadas (1D).
+    """
+    dtype = _sample_dtype(maxval)
+    width = dtype.itemsize
+    stream = np.frombuffer(data, dtype=np.uint8)
+    if stream.size == 0:
+        if count:
+            raise ValueError("Fluxo RLE vazio.")
+        return np.empty(0, dtype=dtype.newbyteorder("="))
+
+    # Supondo que cada byte fosse um controle, onde estaria o próximo pacote
+    code = stream.view(np.int8).astype(np.int64)
+    jump = np.arange(1, stream.size + 1) + np.where(code > 0, 1, -code) * width
+    control_at = _chain(jump)
+    control = code[control_at]
+    if (control == 0).any() or jump[control_at[-1]] != stream.size:
+        raise ValueError("Fluxo RLE corrompido.")
+
+    repeat = control > 0
+    length = np.where(repeat, control, -control)
+    if int(length.sum()) != count:
+        raise ValueError(f"Fluxo RLE com {int(length.sum())} amostras, esperado {count}.")
+
+    # Posição no fluxo da amostra de origem de cada amostra decodificada:
+    # avança `width` bytes dentro de um literal, fica parada em uma repetição
+    # e salta para o próximo pacote no início de cada um
+    stride = np.where(repeat, 0, width)
+    start = control_at + 1
+    last = start + (length - 1) * stride
+    increment = np.repeat(stride, length)
+    first = np.cumsum(length) - length
+    increment[first[1:]] = start[1:] - last[:-1]
+    increment[0] = start[0]
+    source = np.cumsum(increment)
+    if width == 1:
+        return stream[source]
+    return (stream[source].astype(np.uint16) << 8) | stream[source + 1]
 
-        pixels = []
-        for line in f:
-            pixels.extend(map(int, line.split()))
 
-        # Converter a lista de pixels em uma matriz 3D (altura x largura x 3)
-        image_data = []
-        for i in range(height):
-            row = []
-            for j in range(width):
-                idx = (i * width + j) * 3
-                row.append(pixels[idx:idx + 3])
-            image_data.append(row)
+def _planar(image_data: np.ndarray, width: int, height: int) -> np.ndarray:
+    # Reorganiza para linha, canal, coluna (canais explícitos: -1 falha em imagens vazias)
+    image_data = np.asarray(image_data)
+    if image_data.ndim == 3:
+        channels = image_data.shape[2]
+    else:
+        channels = image_data.size // (height * width) if height * width else 1
+    return image_data.reshape(height, width, channels).transpose(0, 2, 1)
 
-        return (width, height, bits, image_data)
 
-def rle_compress(width: int, height: int, image_data: list[list[list[int]]]) -> tuple[int, int, list[int]]:
+def rle_compress(width: int, height: int, image_data: np.ndarray, maxval: int = 255) -> tuple[int, int, bytes]:
     """
     Aplica compressão RLE nos dados da imagem.
+
+    Cada linha é codificada canal a canal (R, G e B), como um segmento independente.
     
     Args:
         width (int): Largura da imagem.
         height (int): Altura da imagem.
-        image_data (list[list[list[int]]]): Dados da imagem.
+        image_data (np.ndarray): Dados da imagem (altura x largura x canais).
+        maxval (int): Intensidade máxima da imagem.
     
     Returns:
-        tuple[int, int, list[int]]: Uma tupla contendo a largura, altura e os dados comprimidos da imagem.
-    """
-    compressed_data = []
-
-    for row in image_data:
-        for channel in zip(*row):
-            i = 0
-            while i < len(channel):
-                # Contar valores repetidos
-                run_length = 1
-                while (i + run_length < len(channel) and 
-                       channel[i] == channel[i + run_length] and 
-                       run_length < 127):
-                    run_length += 1
-
-                if run_length > 1:
-                    # Adicionar sequência comprimida
-                    compressed_data.append(run_length)
-                    compressed_data.append(channel[i])
-                    i += run_length
-                else:
-                    # Encontrar valores únicos consecutivos
-                    start = i
-                    while (i < len(channel) and 
-                           (i + 1 == len(channel) or 
-                            channel[i] != channel[i + 1]) and 
-                           i - start < 127):
-                        i += 1
-
-                    compressed_data.append(-(i - start))  # Número negativo para valores únicos
-                    compressed_data.extend(channel[start:i])
-
-    return (width, height, compressed_data)
-
-def rle_decompress(width: int, height: int, compressed_data: list[list[list[int]]]) -> list[list[list[int]]]:
+        tuple[int, int, bytes]: Uma tupla contendo a largura, altura e os dados comprimidos da imagem.
+    """
+    return (width, height, rle_encode(_planar(image_data, width, height), width, maxval))
+
+
+def rle_decompress(width: int, height: int, compressed_data: bytes, maxval: int = 255, channels: int = 3,
+                   offsets: np.ndarray | None = None, start_row: int = 0, stop_row: int | None = None) -> np.ndarray:
     """
     Descomprime dados RLE para reconstruir a imagem original.
+
+    Com o índice de linhas (`offsets`, como gravado por `write_rle`), apenas o
+    trecho do fluxo correspondente às linhas [start_row, stop_row) é decodificado.
     
     Args:
         width (int): Largura da imagem.
         height (int): Altura da imagem.
-        compressed_data (list[int]): Dados comprimidos da imagem.
+        compressed_data (bytes): Dados comprimidos da imagem.
+        maxval (int): Intensidade máxima da imagem.
+        channels (int): Número de canais da imagem.
+        offsets (np.ndarray | None): Posição de cada linha no fluxo.
+        start_row (int): Primeira linha a decodificar.
+        stop_row (int | None): Linha final (exclusiva) a decodificar.
         
     Returns:
-        list[list[list[int]]]: Dados da imagem descomprimida.
+        np.ndarray: Dados da imagem descomprimida ((stop_row - start_row) x largura x canais).
     
     """
-    decompressed_data = []
-    i = 0
+    stop_row = height if stop_row is None else stop_row
+    if not 0 <= start_row <= stop_row <= height:
+        raise ValueError(f"Intervalo de linhas inválido: {start_row}-{stop_row}.")
 
-    for _ in range(height):
-        row = []
-        for _ in range(3):  # Processar R, G e B separadamente
-            channel = []
-            while len(channel) < width:
-                count = compressed_data[i]
-                i += 1
+    if offsets is None:
+        samples = rle_decode(compressed_data, height * channels * width, maxval)
+        samples = samples.reshape(height, channels, width)[start_row:stop_row]
+    else:
+        data = compressed_data[int(offsets[start_row]):int(offsets[stop_row])]
+        samples = rle_decode(data, (stop_row - start_row) * channels * width, maxval)
+        samples = samples.reshape(stop_row - start_row, channels, width)
+    return samples.transpose(0, 2, 1)
 
-                if count > 0:
-                    # Repetir o próximo valor 'count' vezes
-                    channel.extend([compressed_data[i]] * count)
-                    i += 1
-                else:
-                    # Copiar os próximos '-count' valores diretamente
-                    count = -count
-                    channel.extend(compressed_data[i:i + count])
-                    i += count
 
-            row.append(channel)
+# Arquivo .rle: cabeçalho, índice de linhas, CRC32 de cada linha, CRC32 do
+# cabeçalho e do índice, e por fim o fluxo comprimido
+RLE_MAGIC = b"PRLE"
+RLE_VERSION = 1
+RLE_HEADER = struct.Struct("<4sBBBxIII")
 
-        decompressed_data.append(list(zip(*row)))
+# Disposição dos canais: cada linha guarda o canal 0 inteiro, depois o 1, ...
+LAYOUT_PLANAR_ROWS = 0
 
-    return decompressed_data
 
-def write_ppm(file_path: str, width: int, height: int, max_color: int, image_data: list[list[int]]) -> None:
+class RleHeader(NamedTuple):
     """
-    Escreve os dados da imagem no formato PPM.
-    
+    Cabeçalho de um arquivo .rle.
+
+    Attributes:
+        width (int): largura.
+        height (int): altura.
+        maxval (int): intensidade máxima.
+        channels (int): número de canais.
+        layout (int): disposição dos canais no fluxo.
+        offsets (np.ndarray): posição de cada linha no fluxo (altura + 1 entradas).
+        checksums (np.ndarray): CRC32 do trecho comprimido de cada linha.
+        data_offset (int): posição do fluxo comprimido no arquivo.
+    """
+    width: int
+    height: int
+    maxval: int
+    channels: int
+    layout: int
+    offsets: np.ndarray
+    checksums: np.ndarray
+    data_offset: int
+
+
+def _encode_band(band: np.ndarray, maxval: int) -> tuple[bytes, np.ndarray, np.ndarray]:
+    """
+    Comprime um bloco de linhas de forma independente (usado pelos processos de trabalho).
+
+    Args:
+        band (np.ndarray): linhas da imagem (linhas x largura [x canais]).
+        maxval (int): intensidade máxima.
+
+    Returns:
+        tuple[bytes, np.ndarray, np.ndarray]: fluxo comprimido do bloco, posição de
+        cada linha no fluxo do bloco e CRC32 de cada linha.
+    """
+    rows, width = band.shape[:2]
+    planar = _planar(band, width, rows).reshape(rows, -1)
+    data, offsets = rle_encode_rows(planar, width, maxval)
+    view = memoryview(data)
+    checksums = np.array([zlib.crc32(view[offsets[r]:offsets[r + 1]]) for r in range(rows)], dtype="<u4")
+    return data, offsets, checksums
+
+
+def rle_compress_bands(bands: Iterable[np.ndarray], maxval: int = 255,
+                       workers: int = 1) -> Iterator[tuple[bytes, np.ndarray, np.ndarray]]:
+    """
+    Comprime blocos de linhas independentes, em paralelo, preservando a ordem.
+
+    Com `workers` > 1 os blocos são distribuídos entre processos; no máximo
+    2 x `workers` blocos ficam pendentes, o que limita a memória usada mesmo
+    quando os blocos vêm de um leitor em fluxo.
+
+    Args:
+        bands (Iterable[np.ndarray]): blocos de linhas (linhas x largura [x canais]).
+        maxval (int): intensidade máxima.
+        workers (int): número de processos.
+
+    Yields:
+        tuple[bytes, np.ndarray, np.ndarray]: resultado de `_encode_band` para cada bloco.
+    """
+    if workers <= 1:
+        for band in bands:
+            yield _encode_band(band, maxval)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for band in bands:
+            pending.append(executor.submit(_encode_band, np.asarray(band), maxval))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_rle_bands(file_path: str, width: int, height: int, maxval: int, channels: int,
+                    bands: Iterable[np.ndarray], workers: int = 1) -> None:
+    """
+    Comprime uma imagem entregue em blocos de linhas e a escreve no formato .rle.
+
+    O índice tem tamanho fixo (depende só da altura), então o espaço dele é
+    reservado e os blocos comprimidos são gravados assim que ficam prontos; o
+    índice e as somas de verificação são preenchidos no final.
+
     Args:
         file_path (str): Caminho para o arquivo de saída.
         width (int): Largura da imagem.
         height (int): Altura da imagem.
-        max_color (int): Intensidade máxima da imagem.
-        image_data (list[list[int]]): Dados da imagem.
+        maxval (int): Intensidade máxima da imagem.
+        channels (int): Número de canais.
+        bands (Iterable[np.ndarray]): Blocos de linhas, em ordem.
+        workers (int): Número de processos de compressão.
     """
-    with open(file_path, 'w') as file:
-        file.write("P3\n")
-        file.write(f"{width} {height}\n")
-        file.write(f"{max_color}\n")
+    offsets = np.zeros(height + 1, dtype="<u8")
+    checksums = np.zeros(height, dtype="<u4")
+    header = RLE_HEADER.pack(RLE_MAGIC, RLE_VERSION, LAYOUT_PLANAR_ROWS, channels, width, height, maxval)
+    index_size = offsets.nbytes + checksums.nbytes + 4
 
-        for row in image_data:
-            for pixel in row:
-                file.write(f"{pixel[0]} {pixel[1]} {pixel[2]} ")
-            file.write("\n")
+    row = 0
+    size = 0
+    with open(file_path, 'wb') as file:
+        file.write(header)
+        file.seek(index_size, os.SEEK_CUR)
+        for data, band_offsets, band_checksums in rle_compress_bands(bands, maxval, workers):
+            rows = len(band_checksums)
+            if row + rows > height:
+                raise ValueError(f"Mais linhas do que a altura informada ({height}).")
+            # Os índices de cada bloco são relativos ao início do bloco
+            offsets[row:row + rows + 1] = band_offsets + np.uint64(size)
+            checksums[row:row + rows] = band_checksums
+            file.write(data)
+            row += rows
+            size += len(data)
+        if row != height:
+            raise ValueError(f"Foram comprimidas {row} linhas, esperado {height}.")
 
-def write_rle(file_path: str, width: int, height: int, compressed_data: list[int]) -> None:
+        index = offsets.tobytes() + checksums.tobytes()
+        file.seek(len(header))
+        file.write(index)
+        file.write(struct.pack("<I", zlib.crc32(header + index)))
+
+
+def write_rle(file_path: str, image_data: np.ndarray, maxval: int = 255, workers: int = 1,
+              rows: int = 256) -> None:
     """
-    Escreve os dados comprimidos no formato RLE.
+    Comprime uma imagem e a escreve no formato .rle.
     
     Args:
         file_path (str): Caminho para o arquivo de saída.
-        width (int): Largura da imagem.
-        height (int): Altura da imagem.
-        compressed_data (list[int]): Dados comprimidos da imagem.
+        image_data (np.ndarray): Dados da imagem (altura x largura [x canais]).
+        maxval (int): Intensidade máxima da imagem.
+        workers (int): Número de processos de compressão.
+        rows (int): Linhas por bloco comprimido de forma independente.
     """
-    with open(file_path, 'w') as file:
-        file.write(f"{width} {height}\n")
-        for value in compressed_data:
-            file.write(f"{value} ")
-        file.write("\n")
+    image_data = np.asarray(image_data)
+    height, width = image_data.shape[:2]
+    if image_data.ndim == 3:
+        channels = image_data.shape[2]
+    else:
+        channels = image_data.size // (height * width) if height * width else 1
+    bands = (image_data[start:start + rows] for start in range(0, height, rows))
+    write_rle_bands(file_path, width, height, maxval, channels, bands, workers)
+
+
+def compress_file(input_path: str, output_path: str, workers: int = 1, rows: int = 256) -> None:
+    """
+    Comprime uma imagem Netpbm em .rle lendo-a em blocos, com memória limitada.
+
+    Args:
+        input_path (str): Imagem de entrada (PGM ou PPM).
+        output_path (str): Arquivo .rle de saída.
+        workers (int): Número de processos de compressão.
+        rows (int): Linhas por bloco.
+    """
+    header, bands = read_bands(input_path, rows)
+    write_rle_bands(output_path, header.width, header.height, header.maxval, header.channels, bands, workers)
+
+
+def read_rle_header(file: BinaryIO) -> RleHeader:
+    """
+    Lê o cabeçalho e o índice de um arquivo .rle.
+
+    Args:
+        file (BinaryIO): arquivo aberto em modo binário, no início.
+
+    Returns:
+        RleHeader: cabeçalho lido.
+    """
+    header = file.read(RLE_HEADER.size)
+    if len(header) < RLE_HEADER.size:
+        raise ValueError("Arquivo RLE truncado.")
+    magic, version, layout, channels, width, height, maxval = RLE_HEADER.unpack(header)
+    if magic != RLE_MAGIC or version != RLE_VERSION or layout != LAYOUT_PLANAR_ROWS:
+        raise ValueError("Arquivo RLE inválido ou de versão não suportada.")
+
+    index = file.read(8 * (height + 1) + 4 * height)
+    (crc,) = struct.unpack("<I", file.read(4))
+    if zlib.crc32(header + index) != crc:
+        raise ValueError("Cabeçalho RLE corrompido.")
+    offsets = np.frombuffer(index, dtype="<u8", count=height + 1)
+    checksums = np.frombuffer(index, dtype="<u4", offset=8 * (height + 1))
+    return RleHeader(width, height, maxval, channels, layout, offsets, checksums, file.tell())
+
+
+def read_rle(file_path: str, start_row: int = 0, stop_row: int | None = None,
+             verify: bool = True) -> tuple[int, int, int, np.ndarray]:
+    """
+    Lê as linhas [start_row, stop_row) de um arquivo .rle.
+
+    O fluxo é mapeado em memória e apenas o trecho das linhas pedidas é lido.
+    
+    Args:
+        file_path (str): Caminho para o arquivo .rle.
+        start_row (int): Primeira linha.
+        stop_row (int | None): Linha final (exclusiva); padrão: a última.
+        verify (bool): Confere o CRC32 de cada linha lida.
+    
+    Returns:
+        tuple[int, int, int, np.ndarray]: largura, altura, intensidade máxima e as
+        linhas descomprimidas (linhas x largura [x canais]).
+    """
+    with open(file_path, 'rb') as file:
+        header = read_rle_header(file)
+    stop_row = header.height if stop_row is None else stop_row
+    if not 0 <= start_row <= stop_row <= header.height:
+        raise ValueError(f"Intervalo de linhas inválido: {start_row}-{stop_row}.")
+
+    size = int(header.offsets[-1])
+    data = np.memmap(file_path, dtype=np.uint8, mode='r', offset=header.data_offset, shape=(size,)) if size else b""
+    if verify:
+        for row in range(start_row, stop_row):
+            chunk = data[int(header.offsets[row]):int(header.offsets[row + 1])]
+            if zlib.crc32(chunk) != header.checksums[row]:
+                raise ValueError(f"Linha {row} corrompida.")
 
+    rows = rle_decompress(header.width, header.height, data, header.maxval, header.channels,
+                          header.offsets, start_row, stop_row)
+    if header.channels == 1:
+        rows = rows[:, :, 0]
+    return header.width, header.height, header.maxval, rows
 
-ppm_file = "src/main/resources/bclc.ppm"
 
-width, height, max_color, image_data = read_ppm(ppm_file)
-print(f"Imagem carregada: {width}x{height}, Max Color: {max_color}")
+if __name__ == "__main__":
+    ppm_file = "src/main/resources/bclc.ppm"
 
-compressed = rle_compress(width, height, image_data)
-write_rle("src/main/resources/bclc.rle", compressed[0], compressed[1], compressed[2])
+    width, height, max_color, image_data = read_ppm(ppm_file)
+    print(f"Imagem carregada: {width}x{height}, Max Color: {max_color}")
 
-decompressed = rle_decompress(compressed[0], compressed[1], compressed[2])
-print(f"Imagem descomprimida com sucesso. Dimensões: {len(decompressed)}x{len(decompressed[0])}")
-write_ppm("src/main/resources/bclc_decompressed.ppm", width, height, max_color, decompressed)
+    write_rle("src/main/resources/bclc.rle", image_data, max_color)
 
+    _, _, _, decompressed = read_rle("src/main/resources/bclc.rle")
+    print(f"Imagem descomprimida com sucesso. Dimensões: {len(decompressed)}x{len(decompressed[0])}")
+    write_ppm("src/main/resources/bclc_decompressed.ppm", decompressed, max_color)
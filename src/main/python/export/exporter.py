@@ -0,0 +1,157 @@
+"""
+Fila de exportação para scripts que salvam muitos arquivos.
+
+As escritas (codificação de PNG/TIFF pelo PIL ou OpenCV, gráficos, CSVs) são
+executadas em um conjunto de threads enquanto o script continua calculando as
+próximas saídas; os codificadores liberam o GIL durante a compressão. O número
+de escritas pendentes é limitado: `submit` bloqueia quando o limite é atingido,
+de modo que no máximo `max_pending` imagens ficam na memória esperando a vez.
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+
+def write_image(path: str, pixels: np.ndarray) -> None:
+    """
+    Salva uma imagem com o PIL (formato pela extensão do arquivo).
+
+    Args:
+        path (str): caminho da imagem.
+        pixels (np.ndarray): pixels, ou um objeto convertível em array (expandido só aqui).
+    """
+    from PIL import Image
+
+    Image.fromarray(np.asarray(pixels)).save(path)
+
+
+def write_image_cv2(path: str, pixels: np.ndarray) -> None:
+    """
+    Salva uma imagem com o OpenCV (formato pela extensão do arquivo).
+
+    Args:
+        path (str): caminho da imagem.
+        pixels (np.ndarray): pixels.
+    """
+    import cv2
+
+    if not cv2.imwrite(path, np.asarray(pixels)):
+        raise OSError(f"Não foi possível salvar {path}.")
+
+
+class ExportQueue:
+    """
+    Escreve arquivos em paralelo, com um limite de escritas pendentes.
+
+    Args:
+        workers (int): número de threads de escrita.
+        max_pending (int): escritas enviadas e ainda não concluídas antes de `submit` bloquear.
+        on_done (Callable[[str], None] | None): função chamada com o caminho de cada arquivo salvo.
+    """
+
+    def __init__(self, workers: int = 4, max_pending: int = 8,
+                 on_done: Callable[[str], None] | None = None):
+        if workers < 1 or max_pending < 1:
+            raise ValueError("workers e max_pending devem ser positivos.")
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.on_done = on_done
+        self.futures: list[Future] = []
+        self.completed: list[str] = []
+        # Erros de `on_done`, que o Future descartaria, e conclusões ainda não tratadas
+        self.errors: list[BaseException] = []
+        self.pending = 0
+        self.idle = threading.Condition()
+
+    def submit(self, path: str, function: Callable[..., object], *args, **kwargs) -> Future:
+        """
+        Agenda uma escrita, esperando se já houver `max_pending` pendentes.
+
+        Args:
+            path (str): caminho do arquivo escrito, usado no relatório de conclusão.
+            function (Callable[..., object]): função que escreve o arquivo.
+            *args: argumentos posicionais de `function`.
+            **kwargs: argumentos nomeados de `function`.
+
+        Returns:
+            Future: conclusão da escrita.
+        """
+        self.slots.acquire()
+        with self.idle:
+            self.pending += 1
+        try:
+            future = self.executor.submit(function, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda done: self._finished(path, done))
+        self.futures.append(future)
+        return future
+
+    def submit_image(self, path: str, pixels: np.ndarray) -> Future:
+        """
+        Agenda a escrita de uma imagem com o PIL.
+
+        Args:
+            path (str): caminho da imagem.
+            pixels (np.ndarray): pixels, ou um objeto convertível em array.
+
+        Returns:
+            Future: conclusão da escrita.
+        """
+        return self.submit(path, write_image, path, pixels)
+
+    def _release(self) -> None:
+        self.slots.release()
+        with self.idle:
+            self.pending -= 1
+            self.idle.notify_all()
+
+    def _finished(self, path: str, future: Future) -> None:
+        try:
+            if future.exception() is None:
+                if self.on_done:
+                    self.on_done(path)
+                self.completed.append(path)
+        except BaseException as error:
+            self.errors.append(error)
+        finally:
+            self._release()
+
+    def wait(self) -> list[str]:
+        """
+        Espera todas as escritas agendadas.
+
+        Returns:
+            list[str]: caminhos salvos, na ordem de conclusão.
+
+        Raises:
+            Exception: o primeiro erro de escrita, ou de `on_done`, se houver.
+        """
+        futures, self.futures = self.futures, []
+        for future in futures:
+            future.result()
+        # O Future é concluído antes de chamar `_finished`: espera as chamadas em andamento
+        with self.idle:
+            self.idle.wait_for(lambda: self.pending == 0)
+        if self.errors:
+            error, self.errors = self.errors[0], []
+            raise error
+        return list(self.completed)
+
+    def close(self) -> None:
+        """Espera as escritas pendentes e encerra as threads."""
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ExportQueue":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        try:
+            if exc_type is None:
+                self.wait()
+        finally:
+            self.close()
@@ -0,0 +1,37 @@
+"""
+Sorteio de imagens aleatórias em blocos de linhas, comum aos geradores PBM, PGM e PPM.
+"""
+
+from collections.abc import Callable, Iterator
+
+import numpy as np
+
+# Amostras sorteadas por bloco de linhas (limita a memória, qualquer que seja o tamanho da imagem)
+BAND_SAMPLES = 1 << 22
+
+# Semente usada pelos scripts quando nenhuma é informada (a mesma imagem a cada execução)
+DEFAULT_SEED = 0
+
+
+def sample_bands(width: int, height: int, channels: int,
+                 sample: Callable[[np.random.Generator, tuple[int, ...]], np.ndarray],
+                 seed: int | None = None) -> Iterator[np.ndarray]:
+    """
+    Sorteia a imagem em blocos de linhas com a função de amostragem do formato.
+
+    Args:
+        width (int): largura.
+        height (int): altura.
+        channels (int): número de canais (1 gera blocos linhas x largura).
+        sample (Callable[[np.random.Generator, tuple[int, ...]], np.ndarray]): sorteia
+            um bloco com o formato pedido.
+        seed (int | None): semente do gerador (None = imprevisível).
+
+    Yields:
+        np.ndarray: bloco de linhas (linhas x largura [x canais]).
+    """
+    rng = np.random.default_rng(seed)
+    rows = max(BAND_SAMPLES // max(channels * width, 1), 1)
+    shape = (width,) if channels == 1 else (width, channels)
+    for start in range(0, height, rows):
+        yield sample(rng, (min(rows, height - start), *shape))
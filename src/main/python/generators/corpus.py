@@ -0,0 +1,272 @@
+"""
+Conjunto de imagens sintéticas e reproduzíveis para testes e benchmarks.
+
+Cada padrão reproduz um tipo de conteúdo com comportamento bem diferente nos
+codecs e nas operações do projeto: gradientes, blocos planos, tabuleiros,
+ruído gaussiano sobre um gradiente com várias relações sinal-ruído (SNR),
+imagens de baixo contraste como as do conjunto `Fig0316` e linhas de "texto".
+As imagens são geradas com o tamanho, a intensidade máxima e o formato (P1-P6)
+desejados, e a mesma semente gera sempre as mesmas imagens, então nenhum
+arquivo grande precisa ser versionado.
+
+    PYTHONPATH=src/main/python python src/main/python/generators/corpus.py --size 512x512 --maxval 255
+"""
+
+import argparse
+import os
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+
+import numpy as np
+
+from netpbm.header import BINARY, CHANNELS
+from netpbm.writer import write_netpbm
+
+# Relações sinal-ruído (dB) das variantes de ruído gaussiano
+NOISE_SNRS = (40, 20, 10, 0)
+
+# Faixas de intensidade (fração de maxval) das variantes de baixo contraste
+CONTRAST_RANGES = {
+    "escura": (0.0, 0.25),
+    "clara": (0.75, 1.0),
+    "baixo_contraste": (0.4, 0.6),
+}
+
+
+def _ramp(height: int, width: int, channels: int) -> np.ndarray:
+    """
+    Gradiente de 0 a 1: horizontal, vertical e diagonal, um por canal.
+
+    Args:
+        height (int): altura.
+        width (int): largura.
+        channels (int): número de canais (1 ou 3).
+
+    Returns:
+        np.ndarray: valores de 0 a 1 (altura x largura x canais).
+    """
+    x = np.linspace(0.0, 1.0, width)[np.newaxis, :]
+    y = np.linspace(0.0, 1.0, height)[:, np.newaxis]
+    ramps = [np.broadcast_to(x, (height, width)), np.broadcast_to(y, (height, width)), (x + y) / 2]
+    return np.stack(ramps[:channels], axis=-1)
+
+
+def gradient(height: int, width: int, channels: int, rng: np.random.Generator) -> np.ndarray:
+    """Gradiente suave (horizontal no primeiro canal)."""
+    return _ramp(height, width, channels)
+
+
+def flat_blocks(height: int, width: int, channels: int, rng: np.random.Generator) -> np.ndarray:
+    """Grade de 8 x 8 blocos planos com intensidades sorteadas."""
+    values = rng.random((8, 8, channels))
+    rows = np.arange(height) * 8 // height
+    columns = np.arange(width) * 8 // width
+    return values[rows[:, np.newaxis], columns]
+
+
+def checkerboard(height: int, width: int, channels: int, rng: np.random.Generator) -> np.ndarray:
+    """Tabuleiro de casas de 1/16 da menor dimensão, alternando preto e branco."""
+    cell = max(min(height, width) // 16, 1)
+    board = (np.arange(height)[:, np.newaxis] // cell + np.arange(width) // cell) % 2
+    return np.repeat(board[:, :, np.newaxis].astype(np.float64), channels, axis=2)
+
+
+def noisy_gradient(snr: float) -> Callable[[int, int, int, np.random.Generator], np.ndarray]:
+    """
+    Cria o padrão de gradiente com ruído gaussiano de uma relação sinal-ruído.
+
+    Args:
+        snr (float): relação sinal-ruído, em dB (desvio do sinal / desvio do
+            ruído, antes da saturação em 0 e maxval).
+
+    Returns:
+        Callable: padrão com a assinatura dos demais.
+    """
+    def pattern(height: int, width: int, channels: int, rng: np.random.Generator) -> np.ndarray:
+        signal = _ramp(height, width, channels)
+        sigma = signal.std() / 10 ** (snr / 20)
+        return signal + rng.normal(0.0, sigma, signal.shape)
+
+    pattern.__doc__ = f"Gradiente com ruído gaussiano, SNR de {snr} dB."
+    return pattern
+
+
+def low_contrast(low: float, high: float) -> Callable[[int, int, int, np.random.Generator], np.ndarray]:
+    """
+    Cria um padrão de baixo contraste: blocos e um gradiente espremidos em uma
+    faixa estreita de intensidades, como as imagens `Fig0316`.
+
+    Args:
+        low (float): início da faixa (fração de maxval).
+        high (float): fim da faixa (fração de maxval).
+
+    Returns:
+        Callable: padrão com a assinatura dos demais.
+    """
+    def pattern(height: int, width: int, channels: int, rng: np.random.Generator) -> np.ndarray:
+        content = (flat_blocks(height, width, channels, rng) + _ramp(height, width, channels)) / 2
+        content += rng.normal(0.0, 0.02, content.shape)
+        return low + (high - low) * np.clip(content, 0.0, 1.0)
+
+    pattern.__doc__ = f"Baixo contraste, intensidades entre {low:.0%} e {high:.0%} de maxval."
+    return pattern
+
+
+def text_like(height: int, width: int, channels: int, rng: np.random.Generator) -> np.ndarray:
+    """Linhas de "palavras" escuras sobre fundo claro, como uma página de texto."""
+    page = np.ones((height, width))
+    line = max(height // 32, 4)
+    for top in range(line // 2, height - line, line * 3 // 2):
+        # Palavras e espaços de larguras sorteadas ao longo da linha (ao menos uma palavra,
+        # mesmo em imagens mais estreitas que a altura da linha)
+        widths = rng.integers(line, 5 * line, size=max(width // line + 1, 2))
+        edges = np.cumsum(widths)
+        starts, ends = edges[:-1:2], edges[1::2] - line // 2
+        column = np.arange(width)
+        word = np.searchsorted(starts, column, side="right") - 1
+        inside = (word >= 0) & (column < ends[np.clip(word, 0, len(ends) - 1)])
+        # Traços verticais finos dentro das palavras
+        strokes = inside & (column % max(line // 3, 2) != 0)
+        page[top:top + line * 2 // 3, strokes] = 0.1
+    return np.repeat(page[:, :, np.newaxis], channels, axis=2)
+
+
+PATTERNS: dict[str, Callable[[int, int, int, np.random.Generator], np.ndarray]] = {
+    "gradiente": gradient,
+    "blocos": flat_blocks,
+    "tabuleiro": checkerboard,
+    **{f"ruido_snr{snr}": noisy_gradient(snr) for snr in NOISE_SNRS},
+    **{name: low_contrast(low, high) for name, (low, high) in CONTRAST_RANGES.items()},
+    "texto": text_like,
+}
+
+
+def synthetic_image(pattern: str, width: int, height: int, maxval: int = 255, channels: int = 1,
+                    seed: int = 0) -> np.ndarray:
+    """
+    Gera uma imagem sintética.
+
+    O gerador de cada padrão é semeado com a semente e o nome do padrão, então
+    a imagem não depende de quais outros padrões foram gerados antes.
+
+    Args:
+        pattern (str): nome do padrão (chave de `PATTERNS`).
+        width (int): largura.
+        height (int): altura.
+        maxval (int): valor máximo de intensidade (1 a 65535).
+        channels (int): número de canais (1 ou 3).
+        seed (int): semente.
+
+    Returns:
+        np.ndarray: pixels (altura x largura [x 3]), uint8 ou uint16.
+    """
+    if pattern not in PATTERNS:
+        raise ValueError(f"Padrão desconhecido: {pattern}. Opções: {', '.join(PATTERNS)}.")
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Dimensões inválidas: {width}x{height}.")
+    if not 0 < maxval < 65536 or channels not in (1, 3):
+        raise ValueError(f"Valor máximo ({maxval}) ou número de canais ({channels}) inválido.")
+
+    rng = np.random.default_rng([seed, zlib.crc32(pattern.encode())])
+    values = PATTERNS[pattern](height, width, channels, rng)
+    pixels = np.rint(np.clip(values, 0.0, 1.0) * maxval).astype(np.uint8 if maxval < 256 else np.uint16)
+    return pixels[:, :, 0] if channels == 1 else pixels
+
+
+def corpus(width: int = 512, height: int = 512, maxval: int = 255, magic: str = "P5", seed: int = 0,
+           patterns: Iterable[str] | None = None) -> Iterator[tuple[str, np.ndarray, int]]:
+    """
+    Gera as imagens do conjunto em um formato.
+
+    Nos formatos PBM (P1 e P4) as imagens são limiarizadas no meio da sua
+    própria faixa de intensidades (também nas de baixo contraste); 1 é preto,
+    como no formato.
+
+    Args:
+        width (int): largura.
+        height (int): altura.
+        maxval (int): valor máximo de intensidade (ignorado em PBM).
+        magic (str): formato (P1 a P6).
+        seed (int): semente.
+        patterns (Iterable[str] | None): padrões a gerar (padrão: todos).
+
+    Yields:
+        tuple[str, np.ndarray, int]: nome do arquivo, pixels e intensidade máxima.
+    """
+    if magic not in CHANNELS:
+        raise ValueError(f"Formato Netpbm não suportado: {magic!r}.")
+    bitmap = magic in ("P1", "P4")
+    extension = "pbm" if bitmap else "pgm" if CHANNELS[magic] == 1 else "ppm"
+    for pattern in PATTERNS if patterns is None else patterns:
+        pixels = synthetic_image(pattern, width, height, 255 if bitmap else maxval, CHANNELS[magic], seed)
+        if bitmap:
+            threshold = (int(pixels.min()) + int(pixels.max()) + 1) // 2
+            yield f"{pattern}_{width}x{height}.{extension}", (pixels < threshold).astype(np.uint8), 1
+        else:
+            yield f"{pattern}_{width}x{height}_{maxval}.{extension}", pixels, maxval
+
+
+def write_corpus(directory: str, width: int = 512, height: int = 512, maxval: int = 255,
+                 formats: Iterable[str] = ("P1", "P2", "P3", "P4", "P5", "P6"), seed: int = 0,
+                 patterns: Iterable[str] | None = None) -> list[str]:
+    """
+    Escreve o conjunto de imagens em um diretório, em cada um dos formatos.
+
+    As imagens de formatos ASCII e binários ficam em subdiretórios separados
+    (`ascii` e `binario`), já que têm a mesma extensão.
+
+    Args:
+        directory (str): diretório de saída.
+        width (int): largura.
+        height (int): altura.
+        maxval (int): valor máximo de intensidade.
+        formats (Iterable[str]): formatos a gerar.
+        seed (int): semente.
+        patterns (Iterable[str] | None): padrões a gerar (padrão: todos).
+
+    Returns:
+        list[str]: caminhos das imagens escritas.
+    """
+    patterns = None if patterns is None else list(patterns)
+    paths = []
+    for magic in formats:
+        output_dir = os.path.join(directory, "binario" if magic in BINARY else "ascii")
+        os.makedirs(output_dir, exist_ok=True)
+        for name, pixels, image_maxval in corpus(width, height, maxval, magic, seed, patterns):
+            path = os.path.join(output_dir, name)
+            write_netpbm(path, magic, pixels, image_maxval)
+            paths.append(path)
+    return paths
+
+
+def parse_size(text: str) -> tuple[int, int]:
+    """
+    Lê um tamanho no formato LARGURAxALTURA.
+
+    Args:
+        text (str): tamanho, por exemplo "512x512".
+
+    Returns:
+        tuple[int, int]: largura e altura.
+    """
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Tamanho inválido: {text!r} (use LARGURAxALTURA).") from None
+    return width, height
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera o conjunto de imagens sintéticas.")
+    parser.add_argument("--output", default="corpus", help="diretório de saída")
+    parser.add_argument("--size", type=parse_size, default=(512, 512), help="LARGURAxALTURA")
+    parser.add_argument("--maxval", type=int, default=255, help="valor máximo de intensidade")
+    parser.add_argument("--formats", nargs="+", default=["P1", "P2", "P3", "P4", "P5", "P6"],
+                        choices=sorted(CHANNELS), help="formatos a gerar")
+    parser.add_argument("--patterns", nargs="+", choices=list(PATTERNS), help="padrões (padrão: todos)")
+    parser.add_argument("--seed", type=int, default=0, help="semente")
+    args = parser.parse_args()
+
+    width, height = args.size
+    paths = write_corpus(args.output, width, height, args.maxval, args.formats, args.seed, args.patterns)
+    print(f"{len(paths)} imagens escritas em {args.output}")
@@ -1,26 +1,48 @@
-import random
+import argparse
+from collections.abc import Iterator
 
-def generate_pbm(width: int, height: int) -> None:
+import numpy as np
+
+from generators._bands import DEFAULT_SEED, sample_bands
+from netpbm import write_bands
+
+
+def random_bands(width: int, height: int, seed: int | None = None) -> Iterator[np.ndarray]:
+    """
+    Sorteia a imagem em blocos de linhas, com valores 0 e 1.
+
+    Args:
+        width (int): largura.
+        height (int): altura.
+        seed (int | None): semente do gerador (None = imprevisível).
+
+    Returns:
+        Iterator[np.ndarray]: blocos de linhas (linhas x largura), uint8.
+    """
+    return sample_bands(width, height, 1, lambda rng, shape: rng.integers(0, 2, size=shape, dtype=np.uint8), seed)
+
+
+def generate_pbm(width: int, height: int, seed: int | None = None, filename: str = "image-pbm.pbm",
+                 binary: bool = False) -> None:
     """
     Gera uma imagem no formato PBM conforme os parâmetros passados.
-    
+
+    A imagem é sorteada e escrita em blocos de linhas, sem ser montada inteira
+    na memória. A mesma semente gera sempre a mesma imagem.
+
     Args:
         width (int): largura.
         height (int): altura.
+        seed (int | None): semente do gerador (None = imprevisível).
+        filename (str): caminho da imagem.
+        binary (bool): grava no formato binário P4.
     """
-    
-    # Cabeçalho do formato PBM
-    header = f"P1\n{width} {height}\n"
-
-    # Gera a imagem com valores aleatórios de 0 e 1
-    data = ""
-    for y in range(height):
-        row = ""
-        for x in range(width):
-            row += str(random.randint(0, 1)) + " "
-        data += row.strip() + "\n"
-
-    with open("image-pbm.pbm", "w") as f:
-        f.write(header + data)
-
-generate_pbm(100, 100)
+    write_bands(filename, "P4" if binary else "P1", width, height, 1, random_bands(width, height, seed))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera uma imagem PBM aleatória.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="semente")
+    args = parser.parse_args()
+
+    generate_pbm(100, 100, args.seed)
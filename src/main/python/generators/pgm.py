@@ -1,26 +1,53 @@
-import random
+import argparse
+from collections.abc import Iterator
 
-def generate_pgm(width, height):
+import numpy as np
+
+from generators._bands import DEFAULT_SEED, sample_bands
+from netpbm import write_bands
+
+
+def random_bands(width: int, height: int, maxval: int, seed: int | None = None) -> Iterator[np.ndarray]:
+    """
+    Sorteia a imagem em blocos de linhas, com valores de 0 a maxval.
+
+    Args:
+        width (int): largura.
+        height (int): altura.
+        maxval (int): valor máximo de intensidade.
+        seed (int | None): semente do gerador (None = imprevisível).
+
+    Returns:
+        Iterator[np.ndarray]: blocos de linhas (linhas x largura).
+    """
+    dtype = np.uint8 if maxval < 256 else np.uint16
+    return sample_bands(width, height, 1,
+                        lambda rng, shape: rng.integers(0, maxval, size=shape, dtype=dtype, endpoint=True), seed)
+
+
+def generate_pgm(width: int, height: int, maxval: int = 15, seed: int | None = None,
+                 filename: str = "image-pgm.pgm", binary: bool = False) -> None:
     """
     Gera uma imagem no formato PGM conforme os parâmetros passados.
-    
+
+    A imagem é sorteada e escrita em blocos de linhas, sem ser montada inteira
+    na memória. A mesma semente gera sempre a mesma imagem.
+
     Args:
         width (int): largura.
         height (int): altura.
+        maxval (int): valor máximo de intensidade.
+        seed (int | None): semente do gerador (None = imprevisível).
+        filename (str): caminho da imagem.
+        binary (bool): grava no formato binário P5.
     """
-    
-    # Cabeçalho do formato PGM
-    header = f"P2\n{width} {height}\n15\n"
-
-    # Gera a imagem com valores aleatórios de 0 a 15
-    data = ""
-    for y in range(height):
-        row = ""
-        for x in range(width):
-            row += str(random.randint(0, 15)) + " "
-        data += row.strip() + "\n"
-
-    with open("image-pgm.pgm", "w") as f:
-        f.write(header + data)
-
-generate_pgm(100, 100)
+    write_bands(filename, "P5" if binary else "P2", width, height, maxval,
+                random_bands(width, height, maxval, seed))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera uma imagem PGM aleatória.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="semente")
+    args = parser.parse_args()
+
+    generate_pgm(100, 100, seed=args.seed)
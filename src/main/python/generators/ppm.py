@@ -1,32 +1,55 @@
-import random
+import argparse
+from collections.abc import Iterator
 
-def generate_ppm(width: int, height: int, bits: int) -> None:
+import numpy as np
+
+from generators._bands import DEFAULT_SEED, sample_bands
+from netpbm import write_bands
+
+
+def random_bands(width: int, height: int, maxval: int, seed: int | None = None) -> Iterator[np.ndarray]:
+    """
+    Sorteia a imagem em blocos de linhas, com valores de 0 a maxval para R, G e B.
+
+    Args:
+        width (int): largura.
+        height (int): altura.
+        maxval (int): valor máximo de intensidade.
+        seed (int | None): semente do gerador (None = imprevisível).
+
+    Returns:
+        Iterator[np.ndarray]: blocos de linhas (linhas x largura x 3).
+    """
+    dtype = np.uint8 if maxval < 256 else np.uint16
+    return sample_bands(width, height, 3,
+                        lambda rng, shape: rng.integers(0, maxval, size=shape, dtype=dtype, endpoint=True), seed)
+
+
+def generate_ppm(width: int, height: int, bits: int, seed: int | None = None,
+                 filename: str | None = None, binary: bool = False) -> None:
     """
     Gera uma imagem no formato PPM conforme os parâmetros passados.
-    
+
+    A imagem é sorteada e escrita em blocos de linhas, sem ser montada inteira
+    na memória. A mesma semente gera sempre a mesma imagem.
+
     Args:
         width (int): largura.
         height (int): altura.
-        bits (int): intensidade.
+        bits (int): intensidade (número de níveis, de 0 a bits - 1).
+        seed (int | None): semente do gerador (None = imprevisível).
+        filename (str | None): caminho da imagem (padrão: image_{bits}.ppm).
+        binary (bool): grava no formato binário P6.
     """
-    
-    # Cabeçalho do formato PPM
-    header = f"P3\n{width} {height}\n{bits - 1}\n"
-
-    # Gera a imagem com valores aleatórios entre 0 e {bits - 1} para R, G e B
-    data = ""
-    for y in range(height):
-        row = ""
-        for x in range(width):
-            r = random.randint(0, (bits - 1))
-            g = random.randint(0, (bits - 1))
-            b = random.randint(0, (bits - 1))
-            row += f"{r} {g} {b} "
-        data += row.strip() + "\n"
-
-    with open(f"image_{bits}.ppm", "w") as f:
-        f.write(header + data)
-
-generate_ppm(100, 100, 16)
-
-generate_ppm(1000, 1000, 256)
+    write_bands(filename or f"image_{bits}.ppm", "P6" if binary else "P3", width, height, bits - 1,
+                random_bands(width, height, bits - 1, seed))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera imagens PPM aleatórias.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="semente")
+    args = parser.parse_args()
+
+    generate_ppm(100, 100, 16, args.seed)
+
+    generate_ppm(1000, 1000, 256, args.seed)
@@ -1,41 +1,11 @@
-import csv
-import matplotlib.pyplot as plt
-from collections import Counter
+import numpy as np
 
-def read_image(filename: str) -> tuple[int, int, int, list[int]]:
-    """
-    Lê uma imagem PGM e retorna sua largura, altura, valor máximo (intensidade) e os dados da imagem.
-    
-    Args:
-        filename (str): nome do arquivo.
-    
-    Returns:
-        tuple[int, int, int, list[int]]: (largura, altura, valor máximo, dados da imagem).
-    """
-    
-    with open(filename, 'r') as f:
-        # Lê o cabeçalho
-        if f.readline().strip() != 'P2':
-            raise ValueError("Este não é um arquivo PGM ASCII (P2).")
+from histogram.hist import compute_histogram, load_histogram, plot_histogram, save_histogram
+from histogram.stretch import contrast_stretch
+from netpbm import read_pgm, write_pgm
 
-        # Lê as dimensões
-        dimensions = f.readline().strip()
-        while dimensions.startswith("#"):
-            dimensions = f.readline().strip()        
-        width, height = map(int, dimensions.split())
-        
-        # Lê o valor máximo de intensidade
-        bits = int(f.readline().strip())
-        
-        # Lê os dados da imagem
-        pixels = []
-        for line in f:
-            pixels.extend(map(int, line.split()))
-        
-        # Retorna a largura, altura, valor máximo e os dados da imagem
-        return width, height, bits, pixels
 
-def save_image(width: int, height: int, bits: int, pixels: list[int]) -> None:
+def save_image(width: int, height: int, bits: int, pixels: np.ndarray) -> None:
     """
     Salva uma imagem PGM.
     
@@ -43,60 +13,53 @@ def save_image(width: int, height: int, bits: int, pixels: list[int]) -> None:
         width (int): largura.
         height (int): altura.
         bits (int): valor máximo (intensidade).
-        pixels (list[int]): dados da imagem.
+        pixels (np.ndarray): dados da imagem.
     """
-    with open(f"image_{width}x{height}_{bits}_enhanced.pgm", 'w') as f:
-        f.write(f"P2\n{width} {height}\n{bits}\n")
-        for i in range(height):
-            f.write(" ".join(map(str, pixels[i * width:(i + 1) * width])) + "\n")
+    write_pgm(f"image_{width}x{height}_{bits}_enhanced.pgm", pixels, bits)
 
 
-def enhance_histogram_pgm(filename: str):
+def enhance_histogram_pgm(filename: str, low: float = 0.0, high: float = 100.0,
+                          output: str = 'histogram_pgm_enhanced.csv') -> np.ndarray:
     """
     Realça o histograma de uma imagem PGM usando a transformação Y = aX + b.
+
+    Xmin e Xmax são os percentis `low` e `high` do histograma (por padrão, o
+    mínimo e o máximo); 1 e 99, por exemplo, ignoram pixels isolados.
     
     Args:
         filename (str): Arquivo de entrada PGM.
+        low (float): Percentil usado como Xmin.
+        high (float): Percentil usado como Xmax.
+        output (str): Arquivo do histograma (.csv ou .npy).
+
+    Returns:
+        np.ndarray: Histograma da imagem realçada.
     """
-    width, height, bits, pixels = read_image(filename)
-    
-    Xmin = min(pixels)
-    Xmax = max(pixels)
-    
-    # Calcula os parâmetros da transformação
-    a = 255.0 / (Xmax - Xmin)
-    b = -a * Xmin
+    width, height, bits, pixels = read_pgm(filename)
     
-    # Aplica a transformação para gerar a nova imagem
-    enhanced_pixels = [int(a * x + b) for x in pixels]
+    # Limites tirados de uma passada de histograma e transformação por tabela
+    enhanced_pixels = contrast_stretch(pixels, bits, low, high, out_max=255)
     
     save_image(width, height, 255, enhanced_pixels)
     
-    counter = Counter(enhanced_pixels)
-    with open('histogram_pgm_enhanced.csv', 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["intensidade", "frequencia"])
-        for intensity in range(256):
-            writer.writerow([intensity, counter.get(intensity, 0)])
+    hist = compute_histogram(enhanced_pixels, 255)
+    save_histogram(hist, output)
+    return hist
 
-def plot_histogram_grayscale() -> None:
+def plot_histogram_grayscale(hist: np.ndarray | None = None, filename: str = 'histogram_pgm_enhanced.csv') -> None:
     """
     Plota o histograma da imagem PGM.
+
+    Args:
+        hist (np.ndarray | None): histograma já calculado (padrão: lido de `filename`).
+        filename (str): arquivo do histograma (.csv ou .npy).
     """
     
-    counter = {}
-    with open('histogram_pgm_enhanced.csv', 'r') as f:
-        reader = csv.reader(f)
-        next(reader)
-        counter = {int(row[0]): int(row[1]) for row in reader}
-
-    plt.bar(counter.keys(), counter.values(), color='blue')
-    plt.title('Histograma da Imagem PGM')
-    plt.xlabel('Intensidade')
-    plt.ylabel('Frequência')
-    plt.savefig('histogram_pgm.png')
-    plt.show()
+    if hist is None:
+        hist = load_histogram(filename)
+    plot_histogram(hist[:, 0], 'Histograma da Imagem PGM', 'histogram_pgm.png')
 
 
-enhance_histogram_pgm('src/main/resources/EntradaEscalaCinza.pgm')
-plot_histogram_grayscale()
\ No newline at end of file
+if __name__ == "__main__":
+    hist = enhance_histogram_pgm('src/main/resources/EntradaEscalaCinza.pgm')
+    plot_histogram_grayscale(hist)
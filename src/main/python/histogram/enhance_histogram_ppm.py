@@ -1,38 +1,11 @@
-import csv
-import matplotlib.pyplot as plt
-from collections import Counter
+import numpy as np
 
+from histogram.hist import compute_histogram, load_histogram, plot_histogram, save_histogram
+from histogram.stretch import contrast_stretch
+from netpbm import read_ppm, write_ppm
 
-def read_image(filename: str) -> tuple[int, int, int, list[tuple[int, int, int]]]:
-    """
-    Lê uma imagem PPM e retorna sua largura, altura, valor máximo e dados dos canais (R, G, B).
-
-    Args:
-        filename (str): nome do arquivo PPM.
-
-    Returns:
-        tuple[int, int, int, list[tuple[int, int, int]]]: largura, altura, valor máximo, dados RGB.
-    """
-    with open(filename, 'r') as f:
-        if f.readline().strip() != 'P3':
-            raise ValueError("Este não é um arquivo PPM ASCII (P3).")
 
-        dimensions = f.readline().strip()
-        while dimensions.startswith("#"):
-            dimensions = f.readline().strip()
-        width, height = map(int, dimensions.split())
-
-        bits = int(f.readline().strip())
-        data = []
-        for line in f:
-            data.extend(map(int, line.split()))
-
-        pixels = [(data[i], data[i + 1], data[i + 2])
-                  for i in range(0, len(data), 3)]
-        return width, height, bits, pixels
-
-
-def save_image(width: int, height: int, bits: int, pixels: list[tuple[int, int, int]]) -> None:
+def save_image(width: int, height: int, bits: int, pixels: np.ndarray) -> None:
     """
     Salva uma imagem PPM.
 
@@ -40,100 +13,61 @@ def save_image(width: int, height: int, bits: int, pixels: list[tuple[int, int,
         width (int): largura.
         height (int): altura.
         bits (int): valor máximo (intensidade).
-        pixels (list[tuple[int, int, int]]): dados da imagem.
+        pixels (np.ndarray): dados da imagem.
     """
-    with open(f"image_{width}x{height}_{bits}_enhanced.ppm", 'w') as f:
-        f.write(f"P3\n{width} {height}\n{bits}\n")
-        for r, g, b in pixels:
-            f.write(f"{r} {g} {b}\n")
+    write_ppm(f"image_{width}x{height}_{bits}_enhanced.ppm", pixels, bits)
 
 
-def enhance_histogram_ppm(filename: str):
+def enhance_histogram_ppm(filename: str, low: float = 0.0, high: float = 100.0,
+                          output: str = 'histogram_ppm_enhanced.csv') -> np.ndarray:
     """
     Realça o histograma de uma imagem PPM usando a transformação Y = aX + b para cada canal.
 
+    Xmin e Xmax de cada canal são os percentis `low` e `high` do seu histograma
+    (por padrão, o mínimo e o máximo).
+
     Args:
         filename (str): Arquivo de entrada PPM.
-    """
-    width, height, bits, pixels = read_image(filename)
+        low (float): Percentil usado como Xmin.
+        high (float): Percentil usado como Xmax.
+        output (str): Arquivo do histograma (.csv ou .npy).
 
-    r_values = [pixel[0] for pixel in pixels]
-    g_values = [pixel[1] for pixel in pixels]
-    b_values = [pixel[2] for pixel in pixels]
-
-    Rmin, Rmax = min(r_values), max(r_values)
-    Gmin, Gmax = min(g_values), max(g_values)
-    Bmin, Bmax = min(b_values), max(b_values)
-
-    # Calcula os parâmetros para cada canal
-    a_r = 255.0 / (Rmax - Rmin)
-    b_r = -a_r * Rmin
-
-    a_g = 255.0 / (Gmax - Gmin)
-    b_g = -a_g * Gmin
-
-    a_b = 255.0 / (Bmax - Bmin)
-    b_b = -a_b * Bmin
+    Returns:
+        np.ndarray: Histograma da imagem realçada.
+    """
+    width, height, bits, pixels = read_ppm(filename)
 
-    # Aplica a transformação para cada canal
-    enhanced_pixels = [
-        (
-            int(a_r * r + b_r),
-            int(a_g * g + b_g),
-            int(a_b * b + b_b)
-        ) for r, g, b in pixels
-    ]
+    # Os três canais em uma passada de histograma e uma consulta à tabela,
+    # escrevendo sobre os próprios pixels lidos
+    enhanced_pixels = contrast_stretch(pixels, bits, low, high, in_place=True)
 
     save_image(width, height, bits, enhanced_pixels)
 
-    r_counter = Counter(pixel[0] for pixel in enhanced_pixels)
-    g_counter = Counter(pixel[1] for pixel in enhanced_pixels)
-    b_counter = Counter(pixel[2] for pixel in enhanced_pixels)
+    hist = compute_histogram(enhanced_pixels, bits)
+    save_histogram(hist, output)
+    return hist
 
-    with open('histogram_ppm_enhanced.csv', 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["intensidade", "R", "G", "B"])
-        for intensity in range(bits + 1):
-            writer.writerow([
-                intensity,
-                r_counter.get(intensity, 0),
-                g_counter.get(intensity, 0),
-                b_counter.get(intensity, 0)
-            ])
 
-
-def plot_histogram_rgb() -> None:
+def plot_histogram_rgb(hist: np.ndarray | None = None, filename: str = 'histogram_ppm_enhanced.csv') -> None:
     """
     Plota o histograma de uma imagem RGB (PPM).
-    """
 
-    r_counter = {}
-    g_counter = {}
-    b_counter = {}
+    Args:
+        hist (np.ndarray | None): histograma já calculado (padrão: lido de `filename`).
+        filename (str): arquivo do histograma (.csv ou .npy).
+    """
 
-    with open('histogram_ppm_enhanced.csv', 'r') as f:
-        reader = csv.reader(f)
-        next(reader)
-        for row in reader:
-            intensidade = int(row[0])
-            r_counter[intensidade] = int(row[1])
-            g_counter[intensidade] = int(row[2])
-            b_counter[intensidade] = int(row[3])
+    if hist is None:
+        hist = load_histogram(filename)
 
     # Gera gráficos para cada canal
-    for channel, counter, color, label in zip(
-        ['R', 'G', 'B'], [r_counter, g_counter, b_counter], [
-            'red', 'green', 'blue'], ['Vermelho', 'Verde', 'Azul']
-    ):
-        plt.figure()
-        plt.bar(counter.keys(), counter.values(), color=color)
-        plt.title(f"Histograma - Canal {label}")
-        plt.xlabel('Intensidade')
-        plt.ylabel('Frequência')
-        plt.savefig(f"histogram_{channel}.png")
-        plt.show()
-
-
-# Exemplo de uso
-enhance_histogram_ppm('src/main/resources/EntradaRGB.ppm')
-plot_histogram_rgb()
+    for index, (channel, color, label) in enumerate(zip(
+        ['R', 'G', 'B'], ['red', 'green', 'blue'], ['Vermelho', 'Verde', 'Azul']
+    )):
+        plot_histogram(hist[:, index], f"Histograma - Canal {label}", f"histogram_{channel}.png", color)
+
+
+if __name__ == "__main__":
+    # Exemplo de uso
+    hist = enhance_histogram_ppm('src/main/resources/EntradaRGB.ppm')
+    plot_histogram_rgb(hist)
@@ -1,37 +1,112 @@
 import numpy as np
 import cv2
-import matplotlib.pyplot as plt
-import csv
-from collections import Counter
 
+from histogram.hist import compute_histogram, plot_histogram as plot_counts, save_histogram
+from manipulation.point_ops import apply_lut
 
-def equalize_histogram(image: np.ndarray) -> np.ndarray:
+
+def equalization_lut(hist: np.ndarray, maxval: int = 255) -> np.ndarray:
+    """
+    Calcula a tabela de equalização s_k = round((L - 1) * CDF(k)) a partir do histograma.
+
+    Args:
+        hist (np.ndarray): Frequência de cada intensidade (L = maxval + 1 valores).
+        maxval (int): Intensidade máxima (L - 1).
+
+    Returns:
+        np.ndarray: Tabela de consulta com a nova intensidade de cada nível.
+    """
+    hist = np.asarray(hist).ravel()
+    cdf = np.cumsum(hist / hist.sum())
+    s_k = np.round(cdf * maxval)
+    return s_k.astype(np.uint8 if maxval < 256 else np.uint16)
+
+
+def equalize_histogram(image: np.ndarray, maxval: int = 255, hist: np.ndarray | None = None) -> np.ndarray:
     """
     Equaliza o histograma de uma imagem em escala de cinza.
 
+    A transformação é aplicada com uma única consulta à tabela (`apply_lut`).
+
     Args:
         image (np.ndarray): Imagem de entrada (2D).
+        maxval (int): Intensidade máxima da imagem.
+        hist (np.ndarray | None): Histograma da imagem, se já calculado.
 
     Returns:
         np.ndarray: Imagem com histograma equalizado.
     """
-    height, width = image.shape
-    MN = height * width
-
-    hist = Counter(image.flatten())
+    if hist is None:
+        hist = compute_histogram(image, maxval)
+    return apply_lut(image, equalization_lut(hist, maxval))
 
-    L = 256
-    p_r = np.array([hist.get(i, 0) / MN for i in range(L)])
 
-    s_k = np.cumsum(p_r) * (L - 1)
-    s_k = np.round(s_k).astype(int)
+def clahe(image: np.ndarray, maxval: int = 255, tiles: tuple[int, int] = (8, 8),
+          clip_limit: float = 2.0) -> np.ndarray:
+    """
+    Equalização adaptativa com limite de contraste (CLAHE).
 
-    equalized_image = np.array(
-        [s_k[p] for p in image.flatten()], dtype=np.uint8).reshape(height, width)
-    return equalized_image
+    A imagem é dividida em blocos (tiles), cada um com a sua tabela de
+    equalização. O histograma de cada bloco é limitado a `clip_limit` vezes a
+    frequência média (truncada para um número inteiro de pixels), com o excesso
+    redistribuído entre todos os níveis como no OpenCV, e cada pixel recebe a
+    interpolação bilinear das tabelas dos quatro blocos cujos centros o cercam.
+    Os histogramas de todos os blocos são calculados em uma única passada de
+    `np.bincount`.
 
+    Args:
+        image (np.ndarray): Imagem de entrada (2D).
+        maxval (int): Intensidade máxima da imagem.
+        tiles (tuple[int, int]): Número de blocos na vertical e na horizontal.
+        clip_limit (float): Limite do histograma, em múltiplos da frequência média.
 
-def plot_histogram(image: np.ndarray, title: str, output_graph: str):
+    Returns:
+        np.ndarray: Imagem equalizada.
+    """
+    height, width = image.shape
+    levels = maxval + 1
+    tiles_y, tiles_x = min(tiles[0], height), min(tiles[1], width)
+    tile_h, tile_w = -(-height // tiles_y), -(-width // tiles_x)
+
+    # Completa a imagem por reflexão (sem repetir a borda) até um múltiplo do tamanho do bloco
+    padded = np.pad(image, ((0, tiles_y * tile_h - height), (0, tiles_x * tile_w - width)), mode='reflect')
+    tile = (np.arange(padded.shape[0]) // tile_h)[:, np.newaxis] * tiles_x + np.arange(padded.shape[1]) // tile_w
+    hist = np.bincount((tile * levels + padded).ravel(), minlength=tiles_y * tiles_x * levels)
+    hist = hist.reshape(tiles_y * tiles_x, levels)
+
+    # Limita cada histograma e redistribui o excesso: a mesma parte inteira para todos
+    # os níveis e o resto, um pixel por nível, em níveis igualmente espaçados
+    limit = max(int(clip_limit * tile_h * tile_w / levels), 1)
+    excess = np.maximum(hist - limit, 0).sum(axis=1, keepdims=True)
+    residual = excess % levels
+    step = np.maximum(levels // np.maximum(residual, 1), 1)
+    level = np.arange(levels)
+    hist = np.minimum(hist, limit) + excess // levels + ((level % step == 0) & (level // step < residual))
+    luts = np.rint(np.cumsum(hist, axis=1) * (maxval / (tile_h * tile_w))).ravel()
+
+    # Blocos vizinhos de cada linha e coluna e o peso de cada um (posição do pixel
+    # em blocos, na mesma convenção do OpenCV)
+    def neighbours(size: int, tile_size: int, count: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        position = np.arange(size) / tile_size - 0.5
+        first = np.floor(position).astype(np.intp)
+        weight = np.clip(position - first, 0, 1)
+        return np.clip(first, 0, count - 1), np.clip(first + 1, 0, count - 1), weight
+
+    y0, y1, wy = neighbours(height, tile_h, tiles_y)
+    x0, x1, wx = neighbours(width, tile_w, tiles_x)
+    y0, y1, wy = y0[:, np.newaxis] * tiles_x, y1[:, np.newaxis] * tiles_x, wy[:, np.newaxis]
+    value = image.astype(np.intp)
+
+    def lookup(tile_y: np.ndarray, tile_x: np.ndarray) -> np.ndarray:
+        return luts[(tile_y + tile_x) * levels + value]
+
+    top = (1 - wx) * lookup(y0, x0) + wx * lookup(y0, x1)
+    bottom = (1 - wx) * lookup(y1, x0) + wx * lookup(y1, x1)
+    result = np.round((1 - wy) * top + wy * bottom)
+    return np.clip(result, 0, maxval).astype(image.dtype)
+
+
+def plot_histogram(image: np.ndarray, title: str, output_graph: str, hist: np.ndarray | None = None):
     """
     Gera e salva o histograma de uma imagem.
 
@@ -39,52 +114,56 @@ def plot_histogram(image: np.ndarray, title: str, output_graph: str):
         image (np.ndarray): Imagem de entrada.
         title (str): Título do gráfico.
         output_graph (str): Caminho para salvar o gráfico.
+        hist (np.ndarray | None): Histograma da imagem, se já calculado.
     """
-    hist = Counter(image.flatten())
-    plt.bar(hist.keys(), hist.values(), color='gray', edgecolor='black')
-    plt.title(title)
-    plt.xlabel('Intensidade')
-    plt.ylabel('Frequência')
-    plt.savefig(output_graph)
-    plt.show()
+    hist = compute_histogram(image, 255) if hist is None else hist
+    plot_counts(hist[:, 0], title, output_graph, 'gray')
 
 
-def save_csv_histogram(image: np.ndarray, csv_filename: str):
+def save_csv_histogram(image: np.ndarray, csv_filename: str, hist: np.ndarray | None = None):
     """
-    Salva o histograma de uma imagem em um arquivo CSV.
+    Salva o histograma de uma imagem em um arquivo CSV (ou binário, com extensão .npy).
 
     Args:
         image (np.ndarray): Imagem de entrada.
-        csv_filename (str): Caminho do arquivo CSV.
+        csv_filename (str): Caminho do arquivo CSV (ou .npy).
+        hist (np.ndarray | None): Histograma da imagem, se já calculado.
     """
-    hist = Counter(image.flatten())
-    with open(csv_filename, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['intensidade', 'frequencia'])
-        for intensity in range(256):
-            writer.writerow([intensity, hist.get(intensity, 0)])
-
-
-# Processamento das imagens
-image_files = [
-    'src/main/resources/Fig0316(1)(top_left).tif',
-    'src/main/resources/Fig0316(2)(2nd_from_top).tif',
-    'src/main/resources/Fig0316(3)(third_from_top).tif',
-    'src/main/resources/Fig0316(4)(bottom_left).tif'
-]
-
-for idx, image_file in enumerate(image_files):
-    image = cv2.imread(image_file, cv2.IMREAD_GRAYSCALE)
-
-    equalized_image = equalize_histogram(image)
-
-    output_image_file = f"equalized_image_{idx + 1}.tif"
-    cv2.imwrite(output_image_file, equalized_image)
-
-    plot_histogram(
-        image, f"Histograma Original - Imagem {idx + 1}", f"histogram_original_{idx + 1}.png")
-    save_csv_histogram(image, f"histogram_original_{idx + 1}.csv")
-
-    plot_histogram(equalized_image, f"Histograma Equalizado - Imagem {
-                   idx + 1}", f"histogram_equalized_{idx + 1}.png")
-    save_csv_histogram(equalized_image, f"histogram_equalized_{idx + 1}.csv")
+    save_histogram(compute_histogram(image, 255) if hist is None else hist, csv_filename)
+
+
+if __name__ == "__main__":
+    from export.exporter import ExportQueue, write_image_cv2
+
+    # Processamento das imagens
+    image_files = [
+        'src/main/resources/Fig0316(1)(top_left).tif',
+        'src/main/resources/Fig0316(2)(2nd_from_top).tif',
+        'src/main/resources/Fig0316(3)(third_from_top).tif',
+        'src/main/resources/Fig0316(4)(bottom_left).tif'
+    ]
+
+    # Imagens, gráficos e CSVs são salvos em paralelo enquanto as próximas imagens são processadas
+    with ExportQueue() as exports:
+        for idx, image_file in enumerate(image_files):
+            image = cv2.imread(image_file, cv2.IMREAD_GRAYSCALE)
+
+            # Um único histograma por imagem: a tabela de equalização e o histograma
+            # da imagem equalizada saem dele, sem novas passadas sobre os pixels
+            hist = compute_histogram(image, 255)
+            lut = equalization_lut(hist)
+            equalized_image = apply_lut(image, lut)
+            equalized_hist = np.bincount(lut, weights=hist[:, 0], minlength=256).astype(np.int64)[:, np.newaxis]
+
+            equalized_file = f"equalized_image_{idx + 1}.tif"
+            clahe_file = f"clahe_image_{idx + 1}.tif"
+            exports.submit(equalized_file, write_image_cv2, equalized_file, equalized_image)
+            exports.submit(clahe_file, write_image_cv2, clahe_file, clahe(image))
+
+            for name, label, pixels, counts in [("original", "Original", image, hist),
+                                                 ("equalized", "Equalizado", equalized_image, equalized_hist)]:
+                graph_file = f"histogram_{name}_{idx + 1}.png"
+                csv_file = f"histogram_{name}_{idx + 1}.csv"
+                exports.submit(graph_file, plot_histogram, pixels, f"Histograma {label} - Imagem {idx + 1}",
+                               graph_file, counts)
+                exports.submit(csv_file, save_csv_histogram, pixels, csv_file, counts)
@@ -1,76 +1,38 @@
-import csv
-import matplotlib.pyplot as plt
-from collections import Counter
+import numpy as np
 
-def read_image(filename: str) -> tuple[int, int, int, list[int]]:
-    """
-    Lê uma imagem PGM e retorna sua largura, altura, valor máximo (intensidade) e os dados da imagem.
-    
-    Args:
-        filename (str): nome do arquivo.
-    
-    Returns:
-        tuple[int, int, int, list[int]]: (largura, altura, valor máximo, dados da imagem).
-    """
-    
-    with open(filename, 'r') as f:
-        # Lê o cabeçalho
-        if f.readline().strip() != 'P2':
-            raise ValueError("Este não é um arquivo PGM ASCII (P2).")
+from histogram.hist import histogram_file, load_histogram, plot_histogram, save_histogram
 
-        # Lê as dimensões
-        dimensions = f.readline().strip()
-        while dimensions.startswith("#"):
-            dimensions = f.readline().strip()        
-        width, height = map(int, dimensions.split())
-        
-        # Lê o valor máximo de intensidade
-        bits = int(f.readline().strip())
-        
-        # Lê os dados da imagem
-        pixels = []
-        for line in f:
-            pixels.extend(map(int, line.split()))
-        
-        # Retorna a largura, altura, valor máximo e os dados da imagem
-        return width, height, bits, pixels
 
-def generate_histogram_grayscale(filename: str) -> None:
+def generate_histogram_grayscale(filename: str, output: str = 'histogram_pgm.csv') -> np.ndarray:
     """
-    Gera um histograma da imagem PGM.
+    Gera um histograma da imagem PGM, lida em blocos de linhas.
 
     Args:
         filename (str): nome do arquivo.
+        output (str): arquivo do histograma (.csv ou .npy).
+
+    Returns:
+        np.ndarray: histograma (níveis x 1).
     """
     
-    width, height, bits, pixels = read_image(filename)
-    
-    counter = Counter(pixels)
-    
-    with open('histogram_pgm.csv', 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['intensidade', 'frequencia'])
-        for intensity in range(bits + 1):
-            writer.writerow([intensity, counter.get(intensity, 0)])
+    hist = histogram_file(filename)
+    save_histogram(hist.counts, output)
+    return hist.counts
             
-def plot_histogram_grayscale() -> None:
+def plot_histogram_grayscale(hist: np.ndarray | None = None, filename: str = 'histogram_pgm.csv') -> None:
     """
     Plota o histograma da imagem PGM.
+
+    Args:
+        hist (np.ndarray | None): histograma já calculado (padrão: lido de `filename`).
+        filename (str): arquivo do histograma (.csv ou .npy).
     """
     
-    counter = {}
-    with open('histogram_pgm.csv', 'r') as f:
-        reader = csv.reader(f)
-        next(reader)
-        counter = {int(row[0]): int(row[1]) for row in reader}
-
-    plt.bar(counter.keys(), counter.values(), color='blue')
-    plt.title('Histograma da Imagem PGM')
-    plt.xlabel('Intensidade')
-    plt.ylabel('Frequência')
-    plt.savefig('histogram_pgm.png')
-    plt.show()
+    if hist is None:
+        hist = load_histogram(filename)
+    plot_histogram(hist[:, 0], 'Histograma da Imagem PGM', 'histogram_pgm.png')
 
 
-generate_histogram_grayscale('src/main/resources/EntradaEscalaCinza.pgm')
-plot_histogram_grayscale()
+if __name__ == "__main__":
+    hist = generate_histogram_grayscale('src/main/resources/EntradaEscalaCinza.pgm')
+    plot_histogram_grayscale(hist)
@@ -0,0 +1,421 @@
+"""
+Histogramas de imagens como arrays NumPy.
+
+Todos os canais são contados em uma única passada de `np.bincount`: cada
+amostra do canal c é deslocada para c x níveis, de modo que os contadores dos
+canais ficam lado a lado em um só vetor. O resultado é um array
+(níveis x canais), consumido diretamente pelo escritor de CSV e pelo gráfico.
+
+Histogramas são aditivos: `HistogramAccumulator` soma os histogramas de blocos
+de linhas lidos em fluxo, ou de imagens inteiras, e acumuladores calculados em
+processos diferentes podem ser combinados com `merge`.
+"""
+
+import csv
+import os
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+
+from netpbm import read_bands
+
+# Amostras convertidas para índices a cada passada (limita a memória extra)
+CHUNK_SAMPLES = 1 << 22
+
+# Cabeçalho do CSV e cor do gráfico de cada canal
+CHANNEL_LABELS = {1: ["frequencia"], 3: ["R", "G", "B"]}
+CHANNEL_COLORS = {1: ["blue"], 3: ["red", "green", "blue"]}
+
+# Com HISTOGRAM_PLOTS=0 os gráficos não são desenhados e o matplotlib nem é importado
+PLOTS_ENABLED = os.environ.get("HISTOGRAM_PLOTS", "1") != "0"
+
+# Serialização de um acumulador: cabeçalho seguido das frequências (<i8)
+HIST_MAGIC = b"PHST"
+HIST_HEADER = struct.Struct("<4sIB")
+
+
+def compute_histogram(pixels: np.ndarray, maxval: int) -> np.ndarray:
+    """
+    Conta a frequência de cada intensidade em cada canal da imagem.
+
+    Args:
+        pixels (np.ndarray): imagem (altura x largura [x canais]).
+        maxval (int): valor máximo de intensidade (até 65535).
+
+    Returns:
+        np.ndarray: frequências, (maxval + 1) x canais (int64).
+    """
+    if not 0 < maxval < 65536:
+        raise ValueError(f"Valor máximo inválido: {maxval}.")
+    pixels = np.asarray(pixels)
+    levels = maxval + 1
+    channels = pixels.shape[2] if pixels.ndim == 3 else 1
+    samples = pixels.reshape(-1, channels)
+
+    counts = np.zeros(channels * levels, dtype=np.int64)
+    if samples.size and (samples.min() < 0 or samples.max() > maxval):
+        raise ValueError(f"A imagem tem valores fora de 0-{maxval}.")
+    if channels == 1:
+        counts += np.bincount(samples.ravel(), minlength=levels)
+    else:
+        offset = np.arange(channels, dtype=np.intp) * levels
+        step = max(CHUNK_SAMPLES // channels, 1)
+        for start in range(0, samples.shape[0], step):
+            index = samples[start:start + step].astype(np.intp) + offset
+            counts += np.bincount(index.ravel(), minlength=channels * levels)
+    return counts.reshape(channels, levels).T
+
+
+class HistogramAccumulator:
+    """
+    Histograma acumulado aos poucos, a partir de blocos de linhas ou de imagens.
+
+    Args:
+        maxval (int): valor máximo de intensidade (até 65535).
+        channels (int): número de canais.
+    """
+
+    def __init__(self, maxval: int, channels: int = 1):
+        if not 0 < maxval < 65536:
+            raise ValueError(f"Valor máximo inválido: {maxval}.")
+        self.maxval = maxval
+        self.channels = channels
+        self.counts = np.zeros((maxval + 1, channels), dtype=np.int64)
+
+    def update(self, band: np.ndarray) -> "HistogramAccumulator":
+        """
+        Soma ao histograma as amostras de um bloco.
+
+        Args:
+            band (np.ndarray): bloco de linhas (linhas x largura [x canais]).
+
+        Returns:
+            HistogramAccumulator: o próprio acumulador.
+        """
+        band = np.asarray(band)
+        channels = band.shape[2] if band.ndim == 3 else 1
+        if channels != self.channels:
+            raise ValueError(f"Bloco com {channels} canais, esperado {self.channels}.")
+        self.counts += compute_histogram(band, self.maxval)
+        return self
+
+    def update_many(self, bands: Iterable[np.ndarray]) -> "HistogramAccumulator":
+        """
+        Soma ao histograma todos os blocos de um iterável (por exemplo, `read_bands`).
+
+        Args:
+            bands (Iterable[np.ndarray]): blocos de linhas.
+
+        Returns:
+            HistogramAccumulator: o próprio acumulador.
+        """
+        for band in bands:
+            self.update(band)
+        return self
+
+    def merge(self, other: "HistogramAccumulator") -> "HistogramAccumulator":
+        """
+        Soma outro histograma (do mesmo valor máximo e número de canais) a este.
+
+        Args:
+            other (HistogramAccumulator): histograma a somar.
+
+        Returns:
+            HistogramAccumulator: o próprio acumulador.
+        """
+        if (other.maxval, other.channels) != (self.maxval, self.channels):
+            raise ValueError("Histogramas com valor máximo ou número de canais diferentes.")
+        self.counts += other.counts
+        return self
+
+    def __iadd__(self, other: "HistogramAccumulator") -> "HistogramAccumulator":
+        return self.merge(other)
+
+    @property
+    def total(self) -> np.ndarray:
+        """
+        np.ndarray: número de amostras de cada canal.
+        """
+        return self.counts.sum(axis=0)
+
+    def _require_samples(self) -> None:
+        if not self.total.all():
+            raise ValueError("Histograma vazio.")
+
+    def min(self) -> np.ndarray:
+        """
+        Menor intensidade presente em cada canal.
+
+        Returns:
+            np.ndarray: uma intensidade por canal.
+        """
+        self._require_samples()
+        return np.argmax(self.counts > 0, axis=0)
+
+    def max(self) -> np.ndarray:
+        """
+        Maior intensidade presente em cada canal.
+
+        Returns:
+            np.ndarray: uma intensidade por canal.
+        """
+        self._require_samples()
+        return self.maxval - np.argmax(self.counts[::-1] > 0, axis=0)
+
+    def cdf(self) -> np.ndarray:
+        """
+        Função de distribuição acumulada: fração das amostras com intensidade <= k.
+
+        Returns:
+            np.ndarray: CDF (níveis x canais), de 0 a 1.
+        """
+        self._require_samples()
+        return np.cumsum(self.counts, axis=0) / self.total
+
+    def percentile(self, q: float | Sequence[float]) -> np.ndarray:
+        """
+        Menor intensidade cuja frequência acumulada atinge q% das amostras.
+
+        Args:
+            q (float | Sequence[float]): percentil (ou percentis), de 0 a 100.
+
+        Returns:
+            np.ndarray: intensidades, uma por canal (percentis x canais para uma sequência).
+        """
+        self._require_samples()
+        q = np.asarray(q, dtype=np.float64)
+        if ((q < 0) | (q > 100)).any():
+            raise ValueError("Percentis devem estar entre 0 e 100.")
+        cumulative = np.cumsum(self.counts, axis=0)
+        # Posição (1 a total) da amostra do percentil, na ordem crescente
+        rank = np.maximum(np.ceil(q[..., np.newaxis] / 100 * self.total), 1)
+        return np.stack([np.searchsorted(cumulative[:, c], rank[..., c]) for c in range(self.channels)], axis=-1)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializa o histograma.
+
+        Returns:
+            bytes: cabeçalho (assinatura, valor máximo, canais) e frequências.
+        """
+        return HIST_HEADER.pack(HIST_MAGIC, self.maxval, self.channels) + self.counts.astype("<i8").tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HistogramAccumulator":
+        """
+        Reconstrói um histograma serializado por `to_bytes`.
+
+        Args:
+            data (bytes): histograma serializado.
+
+        Returns:
+            HistogramAccumulator: histograma lido.
+        """
+        if len(data) < HIST_HEADER.size:
+            raise ValueError("Histograma serializado truncado.")
+        magic, maxval, channels = HIST_HEADER.unpack_from(data)
+        if magic != HIST_MAGIC:
+            raise ValueError("Histograma serializado inválido.")
+        accumulator = cls(maxval, channels)
+        size = accumulator.counts.size
+        if len(data) != HIST_HEADER.size + 8 * size:
+            raise ValueError("Histograma serializado truncado.")
+        accumulator.counts[:] = np.frombuffer(data, dtype="<i8", offset=HIST_HEADER.size).reshape(-1, channels)
+        return accumulator
+
+
+def histogram_file(filename: str, rows: int = 256) -> HistogramAccumulator:
+    """
+    Calcula o histograma de uma imagem Netpbm lendo-a em blocos de linhas.
+
+    Apenas um bloco fica em memória por vez, então a imagem pode ser maior que a
+    memória disponível.
+
+    Args:
+        filename (str): imagem PBM, PGM ou PPM.
+        rows (int): linhas por bloco.
+
+    Returns:
+        HistogramAccumulator: histograma da imagem.
+    """
+    header, bands = read_bands(filename, rows)
+    return HistogramAccumulator(header.maxval, header.channels).update_many(bands)
+
+
+def histogram_files(filenames: Iterable[str], workers: int = 1, rows: int = 256) -> HistogramAccumulator:
+    """
+    Calcula o histograma conjunto de várias imagens, uma por processo.
+
+    As imagens devem ter o mesmo valor máximo e número de canais.
+
+    Args:
+        filenames (Iterable[str]): imagens PBM, PGM ou PPM.
+        workers (int): número de processos.
+        rows (int): linhas por bloco.
+
+    Returns:
+        HistogramAccumulator: soma dos histogramas.
+    """
+    return reduce(HistogramAccumulator.merge, _histograms(list(filenames), workers, rows))
+
+
+def _histograms(filenames: list[str], workers: int, rows: int) -> Iterator[HistogramAccumulator]:
+    # Histograma de cada imagem, na ordem dos arquivos
+    if not filenames:
+        raise ValueError("Nenhuma imagem informada.")
+    if workers <= 1:
+        yield from (histogram_file(filename, rows) for filename in filenames)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(histogram_file, filenames, [rows] * len(filenames))
+
+
+def save_histogram_csv(hist: np.ndarray, filename: str) -> None:
+    """
+    Salva um histograma em CSV: uma linha por intensidade, uma coluna por canal.
+
+    Args:
+        hist (np.ndarray): frequências (níveis x canais).
+        filename (str): caminho do arquivo CSV.
+    """
+    hist = hist.reshape(hist.shape[0], -1)
+    labels = CHANNEL_LABELS.get(hist.shape[1], [f"C{c}" for c in range(hist.shape[1])])
+    rows = np.column_stack([np.arange(hist.shape[0]), hist])
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["intensidade", *labels])
+        writer.writerows(rows.tolist())
+
+
+def load_histogram_csv(filename: str) -> np.ndarray:
+    """
+    Lê um histograma salvo por `save_histogram_csv`.
+
+    Args:
+        filename (str): caminho do arquivo CSV.
+
+    Returns:
+        np.ndarray: frequências (níveis x canais).
+    """
+    table = np.loadtxt(filename, delimiter=",", skiprows=1, dtype=np.int64, ndmin=2)
+    hist = np.zeros((int(table[:, 0].max()) + 1, table.shape[1] - 1), dtype=np.int64)
+    hist[table[:, 0]] = table[:, 1:]
+    return hist
+
+
+def save_histogram(hist: np.ndarray, filename: str | os.PathLike) -> None:
+    """
+    Salva um histograma em CSV ou em binário (.npy), conforme a extensão.
+
+    No formato binário as frequências são gravadas como uint32, ou uint64 se
+    não couberem, e o arquivo pode ser lido sem conversão de texto.
+
+    Args:
+        hist (np.ndarray): frequências (níveis x canais).
+        filename (str | os.PathLike): caminho do arquivo (.csv ou .npy).
+    """
+    filename = os.fspath(filename)
+    if filename.endswith(".csv"):
+        save_histogram_csv(hist, filename)
+    elif filename.endswith(".npy"):
+        hist = hist.reshape(hist.shape[0], -1)
+        dtype = np.uint32 if hist.max(initial=0) <= np.iinfo(np.uint32).max else np.uint64
+        np.save(filename, hist.astype(dtype))
+    else:
+        raise ValueError(f"Formato de histograma desconhecido: {filename}.")
+
+
+def load_histogram(filename: str | os.PathLike) -> np.ndarray:
+    """
+    Lê um histograma salvo por `save_histogram`; o formato .npy é mapeado em memória.
+
+    Args:
+        filename (str | os.PathLike): caminho do arquivo (.csv ou .npy).
+
+    Returns:
+        np.ndarray: frequências (níveis x canais).
+    """
+    filename = os.fspath(filename)
+    if filename.endswith(".csv"):
+        return load_histogram_csv(filename)
+    if filename.endswith(".npy"):
+        return np.load(filename, mmap_mode='r')
+    raise ValueError(f"Formato de histograma desconhecido: {filename}.")
+
+
+def write_histogram_records(filenames: Iterable[str], output: str | os.PathLike, workers: int = 1,
+                            rows: int = 256) -> np.ndarray:
+    """
+    Calcula o histograma de cada imagem e grava todos em um único arquivo .npy.
+
+    O arquivo guarda um registro de largura fixa por imagem (imagens x níveis x
+    canais, uint64), na ordem de `filenames`, e é preenchido por mapeamento em
+    memória à medida que os histogramas ficam prontos. As imagens devem ter o
+    mesmo valor máximo e número de canais; caso contrário, ou se alguma imagem
+    não puder ser lida, o arquivo incompleto é removido.
+
+    Args:
+        filenames (Iterable[str]): imagens PBM, PGM ou PPM.
+        output (str | os.PathLike): arquivo .npy de saída.
+        workers (int): número de processos.
+        rows (int): linhas por bloco.
+
+    Returns:
+        np.ndarray: registros gravados (mapeados em memória, somente leitura).
+    """
+    filenames = list(filenames)
+    records = None
+    try:
+        for index, hist in enumerate(_histograms(filenames, workers, rows)):
+            if records is None:
+                shape = (len(filenames), *hist.counts.shape)
+                records = np.lib.format.open_memmap(output, mode='w+', dtype=np.uint64, shape=shape)
+            if hist.counts.shape != records.shape[1:]:
+                raise ValueError(f"{filenames[index]} tem valor máximo ou número de canais diferente.")
+            records[index] = hist.counts
+        records.flush()
+    except BaseException:
+        if records is not None:
+            del records
+            os.remove(output)
+        raise
+    del records
+    return load_histogram_records(output)
+
+
+def load_histogram_records(filename: str | os.PathLike) -> np.ndarray:
+    """
+    Mapeia em memória os registros gravados por `write_histogram_records`.
+
+    Agregar imagens é uma soma sobre o primeiro eixo (por exemplo,
+    `records.sum(axis=0)` para o histograma de todo o conjunto).
+
+    Args:
+        filename (str | os.PathLike): arquivo .npy de registros.
+
+    Returns:
+        np.ndarray: registros (imagens x níveis x canais), somente leitura.
+    """
+    return np.load(filename, mmap_mode='r')
+
+
+def plot_histogram(hist: np.ndarray, title: str, output_graph: str, color: str = 'blue') -> None:
+    """
+    Plota o histograma de um canal e salva o gráfico (sem interface gráfica).
+
+    Não faz nada se os gráficos estiverem desligados (`PLOTS_ENABLED`).
+
+    Args:
+        hist (np.ndarray): frequências do canal (uma por intensidade).
+        title (str): título do gráfico.
+        output_graph (str): caminho da imagem do gráfico.
+        color (str): cor das barras.
+    """
+    if not PLOTS_ENABLED:
+        return
+    from histogram.render import HistogramPlot, default_renderer
+
+    default_renderer().save(HistogramPlot(hist, title, color), output_graph)
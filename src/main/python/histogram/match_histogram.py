@@ -0,0 +1,118 @@
+"""
+Especificação de histograma: transforma uma imagem para que o seu histograma
+se aproxime de um histograma de referência.
+
+A referência pode ser um CSV no formato de `save_histogram_csv` ou uma imagem
+Netpbm. A sua CDF é calculada uma única vez e mantida em cache (LRU) pelo
+caminho do arquivo, de modo que ajustar muitas imagens à mesma referência
+custa, por imagem, só um histograma, uma tabela e uma consulta.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from histogram.hist import compute_histogram, load_histogram_csv
+from netpbm import read_image, write_pgm
+
+# Tamanho máximo do cache de CDFs de referência
+REFERENCE_CACHE_SIZE = 16
+
+
+def histogram_cdf(hist: np.ndarray) -> np.ndarray:
+    """
+    Calcula a CDF de cada canal de um histograma.
+
+    Args:
+        hist (np.ndarray): frequências (níveis x canais).
+
+    Returns:
+        np.ndarray: CDF (níveis x canais), de 0 a 1.
+    """
+    hist = np.asarray(hist, dtype=np.float64)
+    hist = hist.reshape(hist.shape[0], -1)
+    total = hist.sum(axis=0)
+    if not total.all():
+        raise ValueError("Histograma vazio.")
+    return np.cumsum(hist, axis=0) / total
+
+
+@lru_cache(maxsize=REFERENCE_CACHE_SIZE)
+def reference_cdf(path: str) -> np.ndarray:
+    """
+    Lê uma referência (CSV de histograma ou imagem Netpbm) e devolve a sua CDF.
+
+    O resultado fica em cache e não pode ser alterado.
+
+    Args:
+        path (str): caminho do CSV ou da imagem.
+
+    Returns:
+        np.ndarray: CDF (níveis x canais).
+    """
+    if path.endswith(".csv"):
+        hist = load_histogram_csv(path)
+    else:
+        _, _, maxval, pixels = read_image(path)
+        hist = compute_histogram(pixels, maxval)
+    cdf = histogram_cdf(hist)
+    cdf.flags.writeable = False
+    return cdf
+
+
+def matching_lut(hist: np.ndarray, target_cdf: np.ndarray) -> np.ndarray:
+    """
+    Calcula a tabela de especificação de cada canal: cada nível k vai para o
+    menor nível z com CDF_referência(z) >= CDF_imagem(k).
+
+    Args:
+        hist (np.ndarray): histograma da imagem (níveis x canais).
+        target_cdf (np.ndarray): CDF de referência (níveis x canais, ou um canal para todos).
+
+    Returns:
+        np.ndarray: tabelas (níveis da imagem x canais), com valores nos níveis da referência.
+    """
+    source_cdf = histogram_cdf(hist)
+    channels = source_cdf.shape[1]
+    if target_cdf.shape[1] not in (1, channels):
+        raise ValueError(f"Referência com {target_cdf.shape[1]} canais para uma imagem com {channels}.")
+    levels = target_cdf.shape[0]
+    lut = np.empty(source_cdf.shape, dtype=np.uint8 if levels <= 256 else np.uint16)
+    for c in range(channels):
+        target = target_cdf[:, c if target_cdf.shape[1] > 1 else 0]
+        # Tolerância para somas em ponto flutuante que deveriam ser iguais
+        lut[:, c] = np.minimum(np.searchsorted(target, source_cdf[:, c] - 1e-12), levels - 1)
+    return lut
+
+
+def match_histogram(pixels: np.ndarray, maxval: int, target_cdf: np.ndarray) -> np.ndarray:
+    """
+    Ajusta o histograma de uma imagem a uma CDF de referência.
+
+    Todos os canais são transformados em uma única consulta: as tabelas dos
+    canais ficam lado a lado e cada amostra é deslocada para a tabela do seu canal.
+
+    Args:
+        pixels (np.ndarray): imagem (altura x largura [x canais]).
+        maxval (int): intensidade máxima da imagem.
+        target_cdf (np.ndarray): CDF de referência (por exemplo, de `reference_cdf`).
+
+    Returns:
+        np.ndarray: imagem ajustada, com intensidade máxima igual à da referência.
+    """
+    pixels = np.asarray(pixels)
+    lut = matching_lut(compute_histogram(pixels, maxval), target_cdf)
+    if pixels.ndim == 2:
+        return np.take(lut[:, 0], pixels)
+    offset = np.arange(pixels.shape[2], dtype=np.intp) * (maxval + 1)
+    return np.take(lut.T.ravel(), pixels + offset)
+
+
+if __name__ == "__main__":
+    reference = 'src/main/resources/EntradaEscalaCinza.pgm'
+    target = reference_cdf(reference)
+
+    for filename in ['src/main/resources/image_800x800_31.pgm']:
+        width, height, bits, pixels = read_image(filename)
+        matched = match_histogram(pixels, bits, target)
+        write_pgm(f"image_{width}x{height}_matched.pgm", matched, target.shape[0] - 1)
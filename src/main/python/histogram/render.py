@@ -0,0 +1,149 @@
+"""
+Desenho de histogramas sem interface gráfica.
+
+Os gráficos são desenhados com o backend Agg em uma única figura, reutilizada
+entre chamadas: o histograma é um único artista (`StepPatch`) cujos dados são
+trocados a cada desenho, sem criar figuras nem chamar `plt.show()`. Vários
+histogramas podem ser reunidos em uma única imagem (sprite) ou em um PDF de
+várias páginas.
+
+O matplotlib só é importado quando um `HistogramRenderer` é criado, então os
+scripts que não desenham gráficos não pagam pela importação. Como a figura é
+compartilhada, os desenhos são serializados por uma trava e o desenhista pode
+ser usado por várias threads (por exemplo, de uma `ExportQueue`).
+"""
+
+import threading
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+
+class HistogramPlot(NamedTuple):
+    """
+    Histograma de um canal a desenhar.
+
+    Attributes:
+        hist (np.ndarray): frequência de cada intensidade.
+        title (str): título do gráfico.
+        color (str): cor do histograma.
+    """
+    hist: np.ndarray
+    title: str
+    color: str = 'blue'
+
+
+class HistogramRenderer:
+    """
+    Desenha histogramas em uma figura Agg reutilizada.
+
+    Args:
+        size (tuple[float, float]): tamanho da figura, em polegadas.
+        dpi (int): resolução.
+    """
+
+    def __init__(self, size: tuple[float, float] = (6.4, 4.8), dpi: int = 100):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=size, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        self.axes.set_xlabel('Intensidade')
+        self.axes.set_ylabel('Frequência')
+        self.patch = self.axes.stairs(np.zeros(1), fill=True)
+        self.lock = threading.RLock()
+
+    def draw(self, plot: HistogramPlot) -> None:
+        """
+        Desenha um histograma na figura, substituindo o anterior.
+
+        Args:
+            plot (HistogramPlot): histograma, título e cor.
+        """
+        hist = np.asarray(plot.hist).ravel()
+        self.patch.set_data(hist, np.arange(hist.size + 1) - 0.5)
+        self.patch.set_color(plot.color)
+        self.axes.set_xlim(-0.5, hist.size - 0.5)
+        self.axes.set_ylim(0, max(int(hist.max(initial=0)), 1) * 1.05)
+        self.axes.set_title(plot.title)
+
+    def save(self, plot: HistogramPlot, output_graph: str) -> None:
+        """
+        Desenha um histograma e o salva em um arquivo.
+
+        Args:
+            plot (HistogramPlot): histograma, título e cor.
+            output_graph (str): caminho da imagem do gráfico.
+        """
+        with self.lock:
+            self.draw(plot)
+            self.figure.savefig(output_graph)
+
+    def to_array(self, plot: HistogramPlot) -> np.ndarray:
+        """
+        Desenha um histograma e devolve a imagem do gráfico.
+
+        Args:
+            plot (HistogramPlot): histograma, título e cor.
+
+        Returns:
+            np.ndarray: pixels RGBA (altura x largura x 4).
+        """
+        with self.lock:
+            self.draw(plot)
+            self.canvas.draw()
+            return np.asarray(self.canvas.buffer_rgba()).copy()
+
+    def save_sprite(self, plots: Sequence[HistogramPlot], output: str, columns: int = 4) -> None:
+        """
+        Desenha vários histogramas em uma grade e salva uma única imagem.
+
+        Args:
+            plots (Sequence[HistogramPlot]): histogramas a desenhar.
+            output (str): caminho da imagem (PNG).
+            columns (int): número de gráficos por linha.
+        """
+        from matplotlib.image import imsave
+
+        if not plots:
+            raise ValueError("Nenhum histograma para desenhar.")
+        columns = min(columns, len(plots))
+        rows = -(-len(plots) // columns)
+        sprite = None
+        for index, plot in enumerate(plots):
+            tile = self.to_array(plot)
+            if sprite is None:
+                height, width = tile.shape[:2]
+                sprite = np.full((rows * height, columns * width, 4), 255, dtype=np.uint8)
+            row, column = divmod(index, columns)
+            sprite[row * height:(row + 1) * height, column * width:(column + 1) * width] = tile
+        imsave(output, sprite)
+
+    def save_pages(self, plots: Sequence[HistogramPlot], output: str) -> None:
+        """
+        Desenha vários histogramas em um PDF, um por página.
+
+        Args:
+            plots (Sequence[HistogramPlot]): histogramas a desenhar.
+            output (str): caminho do PDF.
+        """
+        from matplotlib.backends.backend_pdf import PdfPages
+
+        with self.lock, PdfPages(output) as pages:
+            for plot in plots:
+                self.draw(plot)
+                pages.savefig(self.figure)
+
+
+@lru_cache(maxsize=1)
+def default_renderer() -> HistogramRenderer:
+    """
+    Desenhista compartilhado pelos scripts, criado no primeiro uso.
+
+    Returns:
+        HistogramRenderer: desenhista padrão.
+    """
+    return HistogramRenderer()
@@ -0,0 +1,96 @@
+"""
+Alargamento de contraste (Y = aX + b) com limites tirados do histograma.
+
+Os limites de cada canal são percentis do histograma, calculado em uma única
+passada para todos os canais (0% e 100% equivalem ao mínimo e ao máximo; 1% e
+99% ignoram pixels isolados muito claros ou escuros). A transformação de cada
+canal é uma tabela de `point_ops`, e todos os canais são aplicados em uma única
+consulta, opcionalmente sobre o próprio array de entrada.
+"""
+
+import numpy as np
+
+from histogram.hist import HistogramAccumulator
+from manipulation.point_ops import point_lut
+
+
+def stretch_bounds(pixels: np.ndarray, maxval: int, low: float = 0.0,
+                   high: float = 100.0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula os limites (Xmin, Xmax) de cada canal como percentis do histograma.
+
+    Args:
+        pixels (np.ndarray): imagem (altura x largura [x canais]).
+        maxval (int): intensidade máxima da imagem.
+        low (float): percentil do limite inferior.
+        high (float): percentil do limite superior.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: limites inferior e superior, um por canal.
+    """
+    channels = pixels.shape[2] if pixels.ndim == 3 else 1
+    accumulator = HistogramAccumulator(maxval, channels).update(pixels)
+    bounds = accumulator.percentile([low, high])
+    return bounds[0], bounds[1]
+
+
+def stretch_luts(lower: np.ndarray, upper: np.ndarray, maxval: int, out_max: int) -> np.ndarray:
+    """
+    Monta a tabela do alargamento de cada canal.
+
+    Um canal plano (Xmax == Xmin) não tem o que alargar e fica inalterado.
+
+    Args:
+        lower (np.ndarray): Xmin de cada canal.
+        upper (np.ndarray): Xmax de cada canal.
+        maxval (int): intensidade máxima da entrada.
+        out_max (int): intensidade máxima da saída.
+
+    Returns:
+        np.ndarray: tabelas (canais x (maxval + 1)).
+    """
+    luts = []
+    for x_min, x_max in zip(lower.tolist(), upper.tolist()):
+        if x_max > x_min:
+            a = out_max / (x_max - x_min)
+            # As tabelas de point_ops têm 256 ou 65536 entradas; só maxval + 1 são usadas
+            luts.append(point_lut("linear", maxval, a=a, b=-a * x_min, max_value=out_max)[:maxval + 1])
+        else:
+            luts.append(np.minimum(np.arange(maxval + 1), out_max))
+    return np.stack(luts).astype(np.uint8 if out_max < 256 else np.uint16)
+
+
+def contrast_stretch(pixels: np.ndarray, maxval: int, low: float = 0.0, high: float = 100.0,
+                     out_max: int | None = None, in_place: bool = False) -> np.ndarray:
+    """
+    Alarga o contraste de cada canal para 0-out_max.
+
+    Args:
+        pixels (np.ndarray): imagem (altura x largura [x canais]).
+        maxval (int): intensidade máxima da imagem.
+        low (float): percentil mapeado para 0 (0 = mínimo).
+        high (float): percentil mapeado para out_max (100 = máximo).
+        out_max (int | None): intensidade máxima da saída (padrão: maxval).
+        in_place (bool): escreve o resultado no próprio `pixels`, sem cópias.
+
+    Returns:
+        np.ndarray: imagem alargada (o próprio `pixels` se in_place).
+    """
+    out_max = maxval if out_max is None else out_max
+    lower, upper = stretch_bounds(pixels, maxval, low, high)
+    luts = stretch_luts(lower, upper, maxval, out_max)
+
+    if in_place:
+        if out_max > np.iinfo(pixels.dtype).max:
+            raise ValueError(f"O tipo {pixels.dtype} não comporta a intensidade {out_max}.")
+        if pixels.ndim == 2:
+            np.take(luts[0].astype(pixels.dtype), pixels, out=pixels)
+        else:
+            for c in range(pixels.shape[2]):
+                np.take(luts[c].astype(pixels.dtype), pixels[..., c], out=pixels[..., c])
+        return pixels
+
+    if pixels.ndim == 2:
+        return np.take(luts[0], pixels)
+    offset = np.arange(pixels.shape[2], dtype=np.intp) * (maxval + 1)
+    return np.take(luts.ravel(), pixels + offset)
@@ -1,53 +1,25 @@
+import numpy as np
 
-def read_image(filename: str) -> tuple[int, int, int, list[int]]:
-    """
-    Lê uma imagem PGM e retorna sua largura, altura, valor máximo (intensidade) e os dados da imagem.
-    
-    Args:
-        filename (str): nome do arquivo.
-    
-    Returns:
-        tuple[int, int, int, list[int]]: (largura, altura, valor máximo, dados da imagem).
-    """
-    
-    with open(filename, 'r') as f:
-        # Lê o cabeçalho
-        if f.readline().strip() != 'P2':
-            raise ValueError("Este não é um arquivo PGM ASCII (P2).")
+from manipulation.point_ops import apply_point_ops
+from netpbm import read_pgm, write_pgm
 
-        # Lê as dimensões
-        dimensions = f.readline().strip()
-        while dimensions.startswith("#"):
-            dimensions = f.readline().strip()        
-        width, height = map(int, dimensions.split())
-        
-        # Lê o valor máximo de intensidade
-        bits = int(f.readline().strip())
-        
-        # Lê os dados da imagem
-        data = []
-        for line in f:
-            data.extend(map(int, line.split()))
-        
-        # Retorna a largura, altura, valor máximo e os dados da imagem
-        return width, height, bits, data
 
-def apply_brightness_gain(pixels: list[int], gain: float, max_value: int) -> list[int]:
+def apply_brightness_gain(pixels: np.ndarray, gain: float, max_value: int) -> np.ndarray:
     """
     Aplica um ganho de brilho aos pixels.
     
     Args:
-        pixels (list[int]): lista de pixels.
+        pixels (np.ndarray): pixels da imagem.
         gain (float): fator de ganho de brilho.
         max_value (int): valor máximo de intensidade.
     
     Returns:
-        list[int]: lista de pixels com o ganho de brilho aplicado.
+        np.ndarray: pixels com o ganho de brilho aplicado.
     """
-    return [min(int(p * gain), max_value) for p in pixels]
+    return apply_point_ops(pixels, [("gain", {"gain": gain, "max_value": max_value})], max_value)
 
 
-def save_image(width: int, height: int, bits: int, data: list[int]) -> None:
+def save_image(width: int, height: int, bits: int, data: np.ndarray) -> None:
     """
     Salva uma imagem PGM.
     
@@ -55,18 +27,17 @@ def save_image(width: int, height: int, bits: int, data: list[int]) -> None:
         width (int): largura.
         height (int): altura.
         bits (int): valor máximo (intensidade).
-        data (list[int]): dados da imagem.
+        data (np.ndarray): dados da imagem.
     """
-    with open(f"image_{width}x{height}_{bits}_brightness_gain.pgm", 'w') as f:
-        f.write(f"P2\n{width} {height}\n{bits}\n")
-        for i in range(height):
-            f.write(" ".join(map(str, data[i * width:(i + 1) * width])) + "\n")
+    write_pgm(f"image_{width}x{height}_{bits}_brightness_gain.pgm", data, bits)
+
 
-# Lê a imagem original
-width, height, bits, pixels = read_image("src/main/resources/image_800x800_31.pgm")
+if __name__ == "__main__":
+    # Lê a imagem original
+    width, height, bits, pixels = read_pgm("src/main/resources/image_800x800_31.pgm")
 
-# Aplica ganho de brilho de 20%
-bright_pixels = apply_brightness_gain(pixels, gain=1.2, max_value=bits)
+    # Aplica ganho de brilho de 20%
+    bright_pixels = apply_brightness_gain(pixels, gain=1.2, max_value=bits)
 
-# Salva a imagem processada
-save_image(width, height, bits, bright_pixels)
+    # Salva a imagem processada
+    save_image(width, height, bits, bright_pixels)
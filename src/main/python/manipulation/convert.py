@@ -1,50 +1,22 @@
+import numpy as np
 
-def read_image(filename: str) -> tuple[int, int, int, list[int]]:
-    """
-    Lê uma imagem PGM e retorna sua largura, altura, valor máximo (intensidade) e os dados da imagem.
-    
-    Args:
-        filename (str): nome do arquivo.
-    
-    Returns:
-        tuple[int, int, int, list[int]]: (largura, altura, valor máximo, dados da imagem).
-    """
-    
-    with open(filename, 'r') as f:
-        # Lê o cabeçalho
-        if f.readline().strip() != 'P2':
-            raise ValueError("Este não é um arquivo PGM ASCII (P2).")
+from manipulation.point_ops import apply_point_ops
+from netpbm import read_pgm, write_pgm
 
-        # Lê as dimensões
-        dimensions = f.readline().strip()
-        while dimensions.startswith("#"):
-            dimensions = f.readline().strip()        
-        width, height = map(int, dimensions.split())
-        
-        # Lê o valor máximo de intensidade
-        bits = int(f.readline().strip())
-        
-        # Lê os dados da imagem
-        data = []
-        for line in f:
-            data.extend(map(int, line.split()))
-        
-        # Retorna a largura, altura, valor máximo e os dados da imagem
-        return width, height, bits, data
 
-def convert_to_5_bits(pixels: list[int]) -> list[int]:
+def convert_to_5_bits(pixels: np.ndarray) -> np.ndarray:
     """
     Fator de conversão de 8 bits (0-255) para 5 bits (0-31)
 
     Args:
-        pixels (list[int]): pixels de entrada em 8 bits.
+        pixels (np.ndarray): pixels de entrada em 8 bits.
 
     Returns:
-        list[int]: pixels em 5 bits.
+        np.ndarray: pixels em 5 bits.
     """
-    return [(p * 31) // 255 for p in pixels]
+    return apply_point_ops(pixels, [("requantize", {"old_max": 255, "new_max": 31})], 255)
 
-def save_image(width: int, height: int, bits: int, data: list[int]) -> None:
+def save_image(width: int, height: int, bits: int, data: np.ndarray) -> None:
     """
     Salva uma imagem PGM.
     
@@ -52,16 +24,14 @@ def save_image(width: int, height: int, bits: int, data: list[int]) -> None:
         width (int): largura.
         height (int): altura.
         bits (int): valor máximo (intensidade).
-        data (list[int]): dados da imagem.
+        data (np.ndarray): dados da imagem.
     """
-    
-    with open(f"image_{width}x{height}_{bits}.pgm", 'w') as f:
-        f.write(f"P2\n{width} {height}\n{bits}\n")
-        for i in range(height):
-            f.write(" ".join(map(str, data[i * width:(i + 1) * width])) + "\n")
+    write_pgm(f"image_{width}x{height}_{bits}.pgm", data, bits)
 
-width, height, bits, pixels = read_image("src/main/resources/Entrada_EscalaCinza.pgm")
-    
-if bits == 255:
-    converted_pixels = convert_to_5_bits(pixels)
-    save_image(width, height, 31, converted_pixels)
+
+if __name__ == "__main__":
+    width, height, bits, pixels = read_pgm("src/main/resources/Entrada_EscalaCinza.pgm")
+
+    if bits == 255:
+        converted_pixels = convert_to_5_bits(pixels)
+        save_image(width, height, 31, converted_pixels)
@@ -0,0 +1,35 @@
+"""
+Leitura e escrita de imagens Netpbm (PBM, PGM e PPM) como arrays NumPy.
+
+Os leitores devolvem a mesma tupla usada pelos scripts do projeto,
+(largura, altura, valor máximo, pixels), mas com os pixels em um
+`np.ndarray` contíguo (uint8 ou uint16, conforme o valor máximo).
+
+Os formatos binários (P4, P5 e P6) são mapeados em memória com `np.memmap`:
+abrir a imagem não lê os dados, e só as linhas acessadas são carregadas.
+Para imagens maiores que a memória, `netpbm.stream` lê e escreve blocos de
+linhas com memória constante.
+"""
+
+from netpbm.header import NetpbmHeader, dtype_for_maxval, read_header
+from netpbm.reader import read_image, read_pbm, read_pgm, read_ppm
+from netpbm.stream import read_bands, read_rows, transform_bands, write_bands, write_rows
+from netpbm.writer import write_pbm, write_pgm, write_ppm
+
+__all__ = [
+    "NetpbmHeader",
+    "dtype_for_maxval",
+    "read_bands",
+    "read_header",
+    "read_image",
+    "read_pbm",
+    "read_pgm",
+    "read_ppm",
+    "read_rows",
+    "transform_bands",
+    "write_bands",
+    "write_pbm",
+    "write_pgm",
+    "write_ppm",
+    "write_rows",
+]
@@ -0,0 +1,143 @@
+from typing import BinaryIO, NamedTuple
+
+import numpy as np
+
+# Número de canais e presença de valor máximo para cada formato
+CHANNELS = {"P1": 1, "P2": 1, "P3": 3, "P4": 1, "P5": 1, "P6": 3}
+HAS_MAXVAL = {"P1": False, "P2": True, "P3": True, "P4": False, "P5": True, "P6": True}
+
+# Formatos binários (raw) e o equivalente binário de cada formato ASCII
+BINARY = {"P4", "P5", "P6"}
+RAW_MAGIC = {"P1": "P4", "P2": "P5", "P3": "P6"}
+
+
+class NetpbmHeader(NamedTuple):
+    """
+    Cabeçalho de um arquivo Netpbm.
+
+    Attributes:
+        magic (str): número mágico ("P1", "P2", ...).
+        width (int): largura.
+        height (int): altura.
+        maxval (int): valor máximo de intensidade (1 para PBM).
+        offset (int): posição, em bytes, do início dos dados da imagem.
+    """
+    magic: str
+    width: int
+    height: int
+    maxval: int
+    offset: int
+
+    @property
+    def channels(self) -> int:
+        """Número de amostras por pixel."""
+        return CHANNELS[self.magic]
+
+    @property
+    def binary(self) -> bool:
+        """Indica se os dados estão no formato binário (P4, P5 ou P6)."""
+        return self.magic in BINARY
+
+
+def dtype_for_maxval(maxval: int) -> np.dtype:
+    """
+    Retorna o menor tipo inteiro sem sinal capaz de representar o valor máximo.
+
+    Args:
+        maxval (int): valor máximo de intensidade.
+
+    Returns:
+        np.dtype: uint8 até 255, uint16 até 65535.
+    """
+    if not 0 < maxval < 65536:
+        raise ValueError(f"Valor máximo inválido: {maxval}.")
+    return np.dtype(np.uint8) if maxval < 256 else np.dtype(np.uint16)
+
+
+def raw_dtype(maxval: int) -> np.dtype:
+    """
+    Retorna o tipo das amostras gravadas em um arquivo Netpbm binário.
+
+    Amostras de 16 bits são armazenadas em big-endian, conforme a especificação.
+
+    Args:
+        maxval (int): valor máximo de intensidade.
+
+    Returns:
+        np.dtype: uint8 ou uint16 big-endian.
+    """
+    return dtype_for_maxval(maxval).newbyteorder(">")
+
+
+def _read_token(f: BinaryIO) -> bytes:
+    """
+    Lê o próximo token do cabeçalho, ignorando espaços e comentários.
+
+    Args:
+        f (BinaryIO): arquivo aberto em modo binário.
+
+    Returns:
+        bytes: token lido.
+    """
+    token = b""
+    while True:
+        c = f.read(1)
+        if not c:
+            if token:
+                return token
+            raise ValueError("Cabeçalho Netpbm incompleto.")
+        if c == b"#":
+            # Comentários vão até o fim da linha
+            while c not in (b"\n", b"\r", b""):
+                c = f.read(1)
+            if token:
+                return token
+        elif c.isspace():
+            if token:
+                return token
+        else:
+            token += c
+
+
+def read_header(f: BinaryIO) -> NetpbmHeader:
+    """
+    Lê o cabeçalho de um arquivo Netpbm e deixa o arquivo posicionado no
+    início dos dados da imagem.
+
+    Args:
+        f (BinaryIO): arquivo aberto em modo binário.
+
+    Returns:
+        NetpbmHeader: cabeçalho lido.
+    """
+    magic = f.read(2).decode("ascii", errors="replace")
+    if magic not in CHANNELS:
+        raise ValueError(f"Formato Netpbm não suportado: {magic!r}.")
+
+    width = int(_read_token(f))
+    height = int(_read_token(f))
+    maxval = int(_read_token(f)) if HAS_MAXVAL[magic] else 1
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Dimensões inválidas: {width}x{height}.")
+    dtype_for_maxval(maxval)
+
+    # O último token termina com um único caractere de espaço
+    return NetpbmHeader(magic, width, height, maxval, f.tell())
+
+
+def format_header(magic: str, width: int, height: int, maxval: int) -> bytes:
+    """
+    Monta o cabeçalho de um arquivo Netpbm.
+
+    Args:
+        magic (str): número mágico.
+        width (int): largura.
+        height (int): altura.
+        maxval (int): valor máximo de intensidade (ignorado para PBM).
+
+    Returns:
+        bytes: cabeçalho pronto para ser escrito.
+    """
+    if HAS_MAXVAL[magic]:
+        return f"{magic}\n{width} {height}\n{maxval}\n".encode("ascii")
+    return f"{magic}\n{width} {height}\n".encode("ascii")
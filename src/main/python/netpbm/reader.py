@@ -0,0 +1,147 @@
+import numpy as np
+
+from netpbm.header import NetpbmHeader, dtype_for_maxval, raw_dtype, read_header
+
+
+def parse_ascii(data: bytes, header: NetpbmHeader, count: int | None = None) -> np.ndarray:
+    """
+    Converte um trecho ASCII de dados Netpbm em um array, em uma única passada.
+
+    Args:
+        data (bytes): texto com as amostras.
+        header (NetpbmHeader): cabeçalho da imagem.
+        count (int | None): número de amostras esperado; None aceita qualquer quantidade.
+
+    Returns:
+        np.ndarray: amostras em um array 1D do tipo adequado ao valor máximo.
+    """
+    if header.magic == "P1":
+        # No PBM ASCII os dígitos podem vir sem separadores ("0110")
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        samples = buffer[(buffer == ord("0")) | (buffer == ord("1"))] - ord("0")
+    elif data.strip():
+        samples = np.fromstring(data, dtype=np.uint32, sep=" ")
+    else:
+        # fromstring devolveria [0] para um trecho só com espaços
+        samples = np.empty(0, dtype=np.uint32)
+
+    if count is not None:
+        if samples.size < count:
+            raise ValueError(f"Dados insuficientes: esperado {count}, lido {samples.size}.")
+        samples = samples[:count]
+    if samples.size and samples.max() > header.maxval:
+        raise ValueError(f"Amostra acima do valor máximo ({header.maxval}).")
+    return samples.astype(dtype_for_maxval(header.maxval))
+
+
+def map_raster(filename: str, header: NetpbmHeader) -> np.ndarray:
+    """
+    Mapeia em memória os dados de um arquivo Netpbm binário, sem copiá-los.
+
+    As páginas do arquivo só são carregadas quando acessadas, e o mapeamento é
+    copy-on-write: alterações no array não são gravadas no arquivo.
+
+    Args:
+        filename (str): nome do arquivo.
+        header (NetpbmHeader): cabeçalho da imagem.
+
+    Returns:
+        np.ndarray: pixels (altura x largura x canais); para P4, os bytes
+        compactados (altura x bytes por linha).
+    """
+    if header.magic == "P4":
+        # Cada linha ocupa um número inteiro de bytes, 8 pixels por byte
+        shape = (header.height, (header.width + 7) // 8)
+        dtype = np.dtype(np.uint8)
+    else:
+        shape = (header.height, header.width, header.channels)
+        dtype = raw_dtype(header.maxval)
+    return np.memmap(filename, dtype=dtype, mode="c", offset=header.offset, shape=shape)
+
+
+def read_netpbm(filename: str, formats: tuple[str, ...]) -> tuple[NetpbmHeader, np.ndarray]:
+    """
+    Lê um arquivo Netpbm de um dos formatos aceitos.
+
+    Formatos ASCII são convertidos para um array em memória; formatos binários
+    são mapeados diretamente do arquivo (veja `map_raster`).
+
+    Args:
+        filename (str): nome do arquivo.
+        formats (tuple[str, ...]): números mágicos aceitos.
+
+    Returns:
+        tuple[NetpbmHeader, np.ndarray]: cabeçalho e pixels (altura x largura [x 3]).
+    """
+    with open(filename, "rb") as f:
+        header = read_header(f)
+        if header.magic not in formats:
+            raise ValueError(f"Formato {header.magic} não suportado aqui (esperado {'/'.join(formats)}).")
+        if not header.binary:
+            count = header.height * header.width * header.channels
+            pixels = parse_ascii(f.read(), header, count)
+            pixels = pixels.reshape(header.height, header.width, header.channels)
+
+    if header.magic == "P4":
+        # O PBM binário precisa ser descompactado para um pixel por byte
+        packed = map_raster(filename, header)
+        return header, np.unpackbits(packed, axis=1, count=header.width)
+    if header.binary:
+        pixels = map_raster(filename, header)
+    return header, pixels[:, :, 0] if header.channels == 1 else pixels
+
+
+def read_pbm(filename: str) -> tuple[int, int, int, np.ndarray]:
+    """
+    Lê uma imagem PBM (P1 ASCII ou P4 binário).
+
+    Args:
+        filename (str): nome do arquivo.
+
+    Returns:
+        tuple[int, int, int, np.ndarray]: (largura, altura, 1, pixels 0/1 altura x largura).
+    """
+    header, pixels = read_netpbm(filename, ("P1", "P4"))
+    return header.width, header.height, header.maxval, pixels
+
+
+def read_pgm(filename: str) -> tuple[int, int, int, np.ndarray]:
+    """
+    Lê uma imagem PGM (P2 ASCII ou P5 binário).
+
+    Args:
+        filename (str): nome do arquivo.
+
+    Returns:
+        tuple[int, int, int, np.ndarray]: (largura, altura, valor máximo, pixels altura x largura).
+    """
+    header, pixels = read_netpbm(filename, ("P2", "P5"))
+    return header.width, header.height, header.maxval, pixels
+
+
+def read_ppm(filename: str) -> tuple[int, int, int, np.ndarray]:
+    """
+    Lê uma imagem PPM (P3 ASCII ou P6 binário).
+
+    Args:
+        filename (str): nome do arquivo.
+
+    Returns:
+        tuple[int, int, int, np.ndarray]: (largura, altura, valor máximo, pixels altura x largura x 3).
+    """
+    header, pixels = read_netpbm(filename, ("P3", "P6"))
+    return header.width, header.height, header.maxval, pixels
+
+
+def read_image(filename: str) -> tuple[int, int, int, np.ndarray]:
+    """
+    Lê uma imagem Netpbm de qualquer formato suportado.
+
+    Args:
+        filename (str): nome do arquivo.
+
+    Returns:
+        tuple[int, int, int, np.ndarray]: (largura, altura, valor máximo, pixels).
+    """
+    header, pixels = read_netpbm(filename, ("P1", "P2", "P3", "P4", "P5", "P6"))
+    return header.width, header.height, header.maxval, pixels
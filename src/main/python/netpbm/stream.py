@@ -0,0 +1,197 @@
+from collections.abc import Callable, Iterable, Iterator
+from typing import BinaryIO
+
+import numpy as np
+
+from netpbm.header import CHANNELS, NetpbmHeader, dtype_for_maxval, format_header, raw_dtype, read_header
+from netpbm.reader import parse_ascii
+from netpbm.writer import write_raster
+
+# Quantidade de texto lida por vez nos formatos ASCII
+CHUNK_SIZE = 1 << 20
+
+
+def _binary_bands(f: BinaryIO, header: NetpbmHeader, rows: int) -> Iterator[np.ndarray]:
+    """
+    Lê os dados de um arquivo binário em blocos de linhas.
+
+    Args:
+        f (BinaryIO): arquivo posicionado no início dos dados.
+        header (NetpbmHeader): cabeçalho da imagem.
+        rows (int): número de linhas por bloco.
+
+    Yields:
+        np.ndarray: bloco de linhas (linhas x largura x canais).
+    """
+    if header.magic == "P4":
+        row_bytes = (header.width + 7) // 8
+        dtype = np.dtype(np.uint8)
+    else:
+        dtype = raw_dtype(header.maxval)
+        row_bytes = header.width * header.channels * dtype.itemsize
+
+    remaining = header.height
+    while remaining > 0:
+        n = min(rows, remaining)
+        data = f.read(n * row_bytes)
+        if len(data) < n * row_bytes:
+            raise ValueError("Arquivo Netpbm truncado.")
+        band = np.frombuffer(data, dtype=dtype).reshape(n, -1)
+        if header.magic == "P4":
+            band = np.unpackbits(band, axis=1, count=header.width)
+        yield band.reshape(n, header.width, header.channels)
+        remaining -= n
+
+
+def _ascii_bands(f: BinaryIO, header: NetpbmHeader, rows: int) -> Iterator[np.ndarray]:
+    """
+    Lê os dados de um arquivo ASCII em blocos de linhas, com memória constante.
+
+    Args:
+        f (BinaryIO): arquivo posicionado no início dos dados.
+        header (NetpbmHeader): cabeçalho da imagem.
+        rows (int): número de linhas por bloco.
+
+    Yields:
+        np.ndarray: bloco de linhas (linhas x largura x canais).
+    """
+    row_samples = header.width * header.channels
+    pending = np.empty(0, dtype=dtype_for_maxval(header.maxval))
+    carry = b""
+    remaining = header.height
+
+    while remaining > 0:
+        chunk = f.read(CHUNK_SIZE)
+        if chunk:
+            data = carry + chunk
+            if header.magic == "P1":
+                # Cada dígito do PBM é uma amostra, qualquer corte é válido
+                cut = len(data)
+            else:
+                # Corta no último espaço para não partir um número entre dois blocos
+                cut = max(data.rfind(c) for c in (b" ", b"\t", b"\n", b"\r")) + 1
+            data, carry = data[:cut], data[cut:]
+        else:
+            data, carry = carry, b""
+        pending = np.concatenate((pending, parse_ascii(data, header)))
+
+        while remaining > 0:
+            n = min(rows, remaining)
+            if pending.size < n * row_samples:
+                break
+            yield pending[:n * row_samples].reshape(n, header.width, header.channels)
+            pending = pending[n * row_samples:]
+            remaining -= n
+
+        if not chunk and remaining > 0:
+            raise ValueError("Arquivo Netpbm truncado.")
+
+
+def read_bands(filename: str, rows: int = 1) -> tuple[NetpbmHeader, Iterator[np.ndarray]]:
+    """
+    Abre uma imagem Netpbm para leitura em blocos de linhas.
+
+    Apenas um bloco fica em memória por vez, o que permite processar imagens
+    maiores que a memória disponível. Imagens de um canal (PBM/PGM) produzem
+    blocos linhas x largura; PPM produz linhas x largura x 3.
+
+    Args:
+        filename (str): nome do arquivo.
+        rows (int): número de linhas por bloco (o último pode ser menor).
+
+    Returns:
+        tuple[NetpbmHeader, Iterator[np.ndarray]]: cabeçalho e gerador de blocos.
+    """
+    if rows < 1:
+        raise ValueError("O bloco deve ter pelo menos uma linha.")
+    with open(filename, "rb") as f:
+        header = read_header(f)
+
+    def bands() -> Iterator[np.ndarray]:
+        with open(filename, "rb") as f:
+            f.seek(header.offset)
+            reader = _binary_bands if header.binary else _ascii_bands
+            for band in reader(f, header, rows):
+                yield band[:, :, 0] if header.channels == 1 else band
+
+    return header, bands()
+
+
+def read_rows(filename: str) -> tuple[NetpbmHeader, Iterator[np.ndarray]]:
+    """
+    Abre uma imagem Netpbm para leitura linha a linha.
+
+    Args:
+        filename (str): nome do arquivo.
+
+    Returns:
+        tuple[NetpbmHeader, Iterator[np.ndarray]]: cabeçalho e gerador de linhas
+        (largura ou largura x 3).
+    """
+    header, bands = read_bands(filename, rows=1)
+    return header, (band[0] for band in bands)
+
+
+def write_bands(filename: str, magic: str, width: int, height: int, maxval: int,
+                bands: Iterable[np.ndarray]) -> None:
+    """
+    Escreve uma imagem Netpbm a partir de um iterador de blocos de linhas.
+
+    Args:
+        filename (str): nome do arquivo.
+        magic (str): número mágico.
+        width (int): largura.
+        height (int): altura.
+        maxval (int): valor máximo de intensidade.
+        bands (Iterable[np.ndarray]): blocos de linhas (linhas x largura [x 3]).
+    """
+    written = 0
+    with open(filename, "wb") as f:
+        f.write(format_header(magic, width, height, maxval))
+        for band in bands:
+            band = np.asarray(band)
+            if band.shape[1:] != ((width,) if CHANNELS[magic] == 1 else (width, 3)):
+                raise ValueError(f"Bloco com formato inválido: {band.shape}.")
+            write_raster(f, magic, band, maxval)
+            written += band.shape[0]
+    if written != height:
+        raise ValueError(f"Foram escritas {written} linhas, esperado {height}.")
+
+
+def write_rows(filename: str, magic: str, width: int, height: int, maxval: int,
+               rows: Iterable[np.ndarray]) -> None:
+    """
+    Escreve uma imagem Netpbm a partir de um iterador de linhas.
+
+    Args:
+        filename (str): nome do arquivo.
+        magic (str): número mágico.
+        width (int): largura.
+        height (int): altura.
+        maxval (int): valor máximo de intensidade.
+        rows (Iterable[np.ndarray]): linhas (largura ou largura x 3).
+    """
+    write_bands(filename, magic, width, height, maxval, (row[np.newaxis] for row in rows))
+
+
+def transform_bands(input_filename: str, output_filename: str,
+                    func: Callable[[np.ndarray], np.ndarray], maxval: int | None = None,
+                    magic: str | None = None, rows: int = 256) -> NetpbmHeader:
+    """
+    Aplica uma operação pontual a uma imagem, bloco a bloco, com memória constante.
+
+    Args:
+        input_filename (str): imagem de entrada.
+        output_filename (str): imagem de saída.
+        func (Callable[[np.ndarray], np.ndarray]): operação aplicada a cada bloco.
+        maxval (int | None): valor máximo da saída (padrão: o da entrada).
+        magic (str | None): formato da saída (padrão: o da entrada).
+        rows (int): número de linhas por bloco.
+
+    Returns:
+        NetpbmHeader: cabeçalho da imagem de entrada.
+    """
+    header, bands = read_bands(input_filename, rows)
+    write_bands(output_filename, magic or header.magic, header.width, header.height,
+                header.maxval if maxval is None else maxval, (func(band) for band in bands))
+    return header
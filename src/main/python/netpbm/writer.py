@@ -0,0 +1,168 @@
+from functools import lru_cache
+from typing import BinaryIO
+
+import numpy as np
+
+from netpbm.header import BINARY, CHANNELS, RAW_MAGIC, format_header, raw_dtype
+
+# A especificação Netpbm limita as linhas dos formatos ASCII a 70 caracteres
+MAX_LINE_LENGTH = 70
+
+# Quantidade aproximada de bytes de texto montados antes de cada escrita
+WRITE_CHUNK_SIZE = 1 << 22
+
+
+@lru_cache(maxsize=8)
+def ascii_table(maxval: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pré-calcula a representação decimal de todos os valores de 0 a maxval.
+
+    Args:
+        maxval (int): valor máximo de intensidade.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: tabela de caracteres (valores x dígitos + 1),
+        alinhada à esquerda com uma coluna livre para o separador, e a máscara das
+        posições válidas de cada valor.
+    """
+    digits = len(str(maxval))
+    values = np.arange(maxval + 1)
+    lengths = np.ones(maxval + 1, dtype=np.int64)
+    for k in range(1, digits):
+        lengths += values >= 10 ** k
+
+    # Dígito j de cada valor, contado a partir da esquerda
+    position = np.arange(digits)
+    power = 10 ** np.maximum(lengths[:, np.newaxis] - 1 - position, 0)
+    table = np.zeros((maxval + 1, digits + 1), dtype=np.uint8)
+    table[:, :digits] = (values[:, np.newaxis] // power) % 10 + ord("0")
+
+    mask = np.zeros((maxval + 1, digits + 1), dtype=bool)
+    mask[:, :digits] = position < lengths[:, np.newaxis]
+    mask[:, digits] = True
+    table.flags.writeable = False
+    mask.flags.writeable = False
+    return table, mask
+
+
+def format_ascii(pixels: np.ndarray, maxval: int, channels: int = 1) -> bytes:
+    """
+    Formata linhas de pixels como texto Netpbm, sem laços por pixel.
+
+    Cada linha da imagem começa em uma nova linha de texto, quebrada de modo que
+    nenhuma linha passe de `MAX_LINE_LENGTH` caracteres; os pixels de uma mesma
+    cor (R, G, B) não são separados entre linhas.
+
+    Args:
+        pixels (np.ndarray): linhas de pixels (linhas x largura [x 3]).
+        maxval (int): valor máximo de intensidade.
+        channels (int): amostras por pixel.
+
+    Returns:
+        bytes: texto das amostras.
+    """
+    table, mask = ascii_table(maxval)
+    # Converte para índices: um array bool seria tratado como máscara
+    samples = pixels.reshape(pixels.shape[0], -1).astype(np.intp, copy=False)
+    row_samples = samples.shape[1]
+
+    # Quantas amostras cabem em uma linha de texto (a última perde o separador)
+    per_line = (MAX_LINE_LENGTH + 1) // table.shape[1]
+    per_line = max(per_line - per_line % channels, 1)
+    separators = np.full(row_samples, ord(" "), dtype=np.uint8)
+    separators[per_line - 1::per_line] = ord("\n")
+    separators[-1] = ord("\n")
+
+    chars = table[samples]
+    chars[:, :, -1] = separators
+    return chars[mask[samples]].tobytes()
+
+
+def _write_ascii(f: BinaryIO, pixels: np.ndarray, maxval: int, channels: int) -> None:
+    """
+    Escreve linhas de pixels em ASCII, montando o texto em blocos grandes.
+
+    Args:
+        f (BinaryIO): arquivo aberto em modo binário.
+        pixels (np.ndarray): linhas de pixels (linhas x largura [x 3]).
+        maxval (int): valor máximo de intensidade.
+        channels (int): amostras por pixel.
+    """
+    row_bytes = pixels[0].size * (len(str(maxval)) + 1) if len(pixels) else 1
+    rows = max(WRITE_CHUNK_SIZE // row_bytes, 1)
+    for start in range(0, len(pixels), rows):
+        f.write(format_ascii(pixels[start:start + rows], maxval, channels))
+
+
+def write_raster(f: BinaryIO, magic: str, pixels: np.ndarray, maxval: int) -> None:
+    """
+    Escreve um bloco de linhas de pixels, sem cabeçalho.
+
+    Args:
+        f (BinaryIO): arquivo aberto em modo binário.
+        magic (str): número mágico.
+        pixels (np.ndarray): linhas de pixels (linhas x largura [x 3]).
+        maxval (int): valor máximo de intensidade.
+    """
+    if magic == "P4":
+        # 8 pixels por byte, cada linha completada até o próximo byte
+        f.write(np.packbits(pixels.astype(np.uint8, copy=False), axis=1).tobytes())
+    elif magic in BINARY:
+        f.write(pixels.astype(raw_dtype(maxval), copy=False).tobytes())
+    else:
+        _write_ascii(f, pixels, maxval, CHANNELS[magic])
+
+
+def write_netpbm(filename: str, magic: str, pixels: np.ndarray, maxval: int) -> None:
+    """
+    Escreve uma imagem Netpbm, ASCII (P1-P3) ou binária (P4-P6).
+
+    Args:
+        filename (str): nome do arquivo.
+        magic (str): número mágico.
+        pixels (np.ndarray): pixels (altura x largura [x 3]).
+        maxval (int): valor máximo de intensidade.
+    """
+    pixels = np.asarray(pixels)
+    height, width = pixels.shape[:2]
+    with open(filename, "wb") as f:
+        f.write(format_header(magic, width, height, maxval))
+        write_raster(f, magic, pixels, maxval)
+
+
+def write_pbm(filename: str, pixels: np.ndarray, binary: bool = False) -> None:
+    """
+    Salva uma imagem PBM (P1 ASCII ou P4 binário).
+
+    Args:
+        filename (str): nome do arquivo.
+        pixels (np.ndarray): pixels binários (0 ou 1), altura x largura.
+        binary (bool): grava no formato binário P4.
+    """
+    write_netpbm(filename, RAW_MAGIC["P1"] if binary else "P1", pixels, 1)
+
+
+def write_pgm(filename: str, pixels: np.ndarray, maxval: int, binary: bool = False) -> None:
+    """
+    Salva uma imagem PGM (P2 ASCII ou P5 binário).
+
+    Args:
+        filename (str): nome do arquivo.
+        pixels (np.ndarray): pixels, altura x largura.
+        maxval (int): valor máximo de intensidade.
+        binary (bool): grava no formato binário P5.
+    """
+    write_netpbm(filename, RAW_MAGIC["P2"] if binary else "P2", pixels, maxval)
+
+
+def write_ppm(filename: str, pixels: np.ndarray, maxval: int, binary: bool = False) -> None:
+    """
+    Salva uma imagem PPM (P3 ASCII ou P6 binário).
+
+    Args:
+        filename (str): nome do arquivo.
+        pixels (np.ndarray): pixels, altura x largura x 3.
+        maxval (int): valor máximo de intensidade.
+        binary (bool): grava no formato binário P6.
+    """
+    write_netpbm(filename, RAW_MAGIC["P3"] if binary else "P3", pixels, maxval)
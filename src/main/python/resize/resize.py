@@ -1,38 +1,14 @@
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
 
-def read_image(filename: str) -> tuple[int, int, int, list[int]]:
-    """
-    Lê uma imagem PGM e retorna sua largura, altura, valor máximo (intensidade) e os dados da imagem.
-    
-    Args:
-        filename (str): nome do arquivo.
-    
-    Returns:
-        tuple[int, int, int, list[int]]: (largura, altura, valor máximo, dados da imagem).
-    """
-    
-    with open(filename, 'r') as f:
-        # Lê o cabeçalho
-        if f.readline().strip() != 'P2':
-            raise ValueError("Este não é um arquivo PGM ASCII (P2).")
-
-        # Lê as dimensões
-        dimensions = f.readline().strip()
-        while dimensions.startswith("#"):
-            dimensions = f.readline().strip()        
-        width, height = map(int, dimensions.split())
-        
-        # Lê o valor máximo de intensidade
-        bits = int(f.readline().strip())
-        
-        # Lê os dados da imagem
-        data = []
-        for line in f:
-            data.extend(map(int, line.split()))
-        
-        # Retorna a largura, altura, valor máximo e os dados da imagem
-        return width, height, bits, data
-    
-def save_image(width: int, height: int, bits: int, data: list[int]) -> None:
+import numpy as np
+
+from netpbm import read_pgm, write_pgm
+
+
+def save_image(width: int, height: int, bits: int, data: np.ndarray) -> None:
     """
     Salva uma imagem PGM.
     
@@ -40,69 +16,314 @@ def save_image(width: int, height: int, bits: int, data: list[int]) -> None:
         width (int): largura.
         height (int): altura.
         bits (int): valor máximo (intensidade).
-        data (list[int]): dados da imagem.
+        data (np.ndarray): dados da imagem.
     """
-    
-    with open(f"image_{width}x{height}_{bits}.pgm", 'w') as f:
-        f.write(f"P2\n{width} {height}\n{bits}\n")
-        for i in range(height):
-            f.write(" ".join(map(str, data[i * width:(i + 1) * width])) + "\n")
+    write_pgm(f"image_{width}x{height}_{bits}.pgm", data, bits)
+
+@lru_cache(maxsize=64)
+def nearest_indices(original_size: int, new_size: int) -> np.ndarray:
+    """
+    Calcula, para cada posição da saída, o índice do pixel mais próximo na origem.
+
+    As tabelas ficam em cache e são compartilhadas entre saídas com a mesma
+    largura ou altura.
+
+    Args:
+        original_size (int): tamanho original do eixo.
+        new_size (int): novo tamanho do eixo.
+
+    Returns:
+        np.ndarray: índices na imagem original.
+    """
+    scale = original_size / new_size
+    indices = (np.arange(new_size) * scale).astype(np.intp)
+    indices.flags.writeable = False
+    return indices
+
+
+def _resize_nearest(data: np.ndarray, new_width: int, new_height: int,
+                    start: int = 0, stop: int | None = None) -> np.ndarray:
+    original_height, original_width = data.shape[:2]
+    src_y = nearest_indices(original_height, new_height)[start:stop]
+    src_x = nearest_indices(original_width, new_width)
+    return data.take(src_y, axis=0).take(src_x, axis=1)
+
+
+def _bilinear_axis(data: np.ndarray, new_size: int, axis: int,
+                   start: int = 0, stop: int | None = None) -> np.ndarray:
+    size = data.shape[axis]
+    stop = new_size if stop is None else stop
+    # Centros dos pixels da saída projetados na origem
+    coords = (np.arange(start, stop) + 0.5) * (size / new_size) - 0.5
+    coords = np.clip(coords, 0, size - 1)
+    lower = np.floor(coords).astype(np.intp)
+    upper = np.minimum(lower + 1, size - 1)
+
+    shape = [1] * data.ndim
+    shape[axis] = stop - start
+    weight = (coords - lower).astype(np.float32).reshape(shape)
+    a = data.take(lower, axis=axis)
+    b = data.take(upper, axis=axis)
+    return a + (b - a) * weight
+
+
+def _area_axis(data: np.ndarray, new_size: int, axis: int,
+               start: int = 0, stop: int | None = None) -> np.ndarray:
+    size = data.shape[axis]
+    stop = new_size if stop is None else stop
+    data = np.moveaxis(data, axis, 0)
+    if size % new_size == 0:
+        # Redução por fator inteiro: média de blocos
+        factor = size // new_size
+        block = data[start * factor:stop * factor]
+        block = block.reshape((stop - start, factor) + data.shape[1:]).mean(axis=1)
+        return np.moveaxis(block, 0, axis)
+
+    # Caso geral: integral da imagem avaliada nas bordas de cada caixa,
+    # restrita às linhas de origem cobertas pelas saídas pedidas
+    scale = size / new_size
+    edges = np.arange(start, stop + 1) * scale
+    lower = int(edges[0])
+    upper = min(int(edges[-1]) + 1, size)
+    data = data[lower:upper]
+    # Com dados inteiros a integral é exata, e o resultado não depende do trecho
+    accumulator = np.int64 if np.issubdtype(data.dtype, np.integer) else np.float64
+    integral = np.concatenate((np.zeros_like(data[:1], dtype=accumulator),
+                               np.cumsum(data, axis=0, dtype=accumulator)))
+    index = np.minimum(np.floor(edges).astype(np.intp), size - 1) - lower
+    frac = (edges - lower - index).reshape((-1,) + (1,) * (data.ndim - 1))
+    partial = frac * data[index]
+    area = (integral[index[1:]] - integral[index[:-1]]) + (partial[1:] - partial[:-1])
+    return np.moveaxis(area / scale, 0, axis)
+
+
+def _interpolate(data: np.ndarray, new_width: int, new_height: int, mode: str,
+                 start: int = 0, stop: int | None = None) -> np.ndarray:
+    if mode == "bilinear":
+        resized = _bilinear_axis(data.astype(np.float32), new_height, 0, start, stop)
+        return _bilinear_axis(resized, new_width, axis=1)
+    if mode == "area":
+        resized = _area_axis(data, new_height, 0, start, stop)
+        return _area_axis(resized, new_width, axis=1)
+    raise ValueError(f"Modo de redimensionamento desconhecido: {mode}.")
+
+
+def _to_dtype(resized: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    info = np.iinfo(dtype)
+    return np.clip(np.rint(resized), info.min, info.max).astype(dtype)
+
+
+def _resize_rows(data: np.ndarray, new_width: int, new_height: int, mode: str,
+                 start: int = 0, stop: int | None = None) -> np.ndarray:
+    """
+    Calcula as linhas [start, stop) da imagem redimensionada.
+
+    Args:
+        data (np.ndarray): dados da imagem original.
+        new_width (int): largura da imagem redimensionada.
+        new_height (int): altura da imagem redimensionada.
+        mode (str): método de interpolação.
+        start (int): primeira linha da saída.
+        stop (int | None): linha final (exclusiva) da saída.
 
-def resize_image(data: list[int], original_width: int, original_height: int, new_width: int, new_height: int) -> list[int]:
+    Returns:
+        np.ndarray: linhas da imagem redimensionada.
+    """
+    if mode == "nearest":
+        return _resize_nearest(data, new_width, new_height, start, stop)
+    return _to_dtype(_interpolate(data, new_width, new_height, mode, start, stop), data.dtype)
+
+
+def _resize_tile(source_name: str, source_shape: tuple[int, ...], output_name: str,
+                 output_shape: tuple[int, ...], dtype: str, mode: str, start: int, stop: int) -> None:
+    """
+    Calcula uma faixa horizontal da saída em um processo de trabalho, lendo a
+    origem e escrevendo o resultado diretamente na memória compartilhada.
+    """
+    source_memory = SharedMemory(name=source_name)
+    output_memory = SharedMemory(name=output_name)
+    try:
+        source = np.ndarray(source_shape, dtype=dtype, buffer=source_memory.buf)
+        output = np.ndarray(output_shape, dtype=dtype, buffer=output_memory.buf)
+        new_height, new_width = output_shape[:2]
+        output[start:stop] = _resize_rows(source, new_width, new_height, mode, start, stop)
+        # As views precisam ser liberadas antes de fechar a memória
+        del source, output
+    finally:
+        source_memory.close()
+        output_memory.close()
+
+
+def _resize_parallel(data: np.ndarray, new_width: int, new_height: int, mode: str,
+                     workers: int) -> np.ndarray:
+    """
+    Redimensiona em faixas horizontais distribuídas entre processos.
+
+    A origem é copiada uma única vez para memória compartilhada, e cada processo
+    escreve sua faixa diretamente na saída, sem serializar imagens.
+    """
+    dtype = data.dtype
+    output_shape = (new_height, new_width) + data.shape[2:]
+    source_memory = SharedMemory(create=True, size=max(data.nbytes, 1))
+    output_memory = SharedMemory(create=True, size=max(int(np.prod(output_shape)) * dtype.itemsize, 1))
+    try:
+        np.ndarray(data.shape, dtype=dtype, buffer=source_memory.buf)[...] = data
+
+        # Mais faixas que processos, para equilibrar a carga
+        bounds = np.linspace(0, new_height, min(new_height, workers * 4) + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_resize_tile, source_memory.name, data.shape, output_memory.name,
+                                output_shape, dtype.str, mode, int(start), int(stop))
+                for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start
+            ]
+            for future in futures:
+                future.result()
+
+        output = np.ndarray(output_shape, dtype=dtype, buffer=output_memory.buf)
+        result = output.copy()
+        del output
+        return result
+    finally:
+        source_memory.close()
+        source_memory.unlink()
+        output_memory.close()
+        output_memory.unlink()
+
+
+def resize_image(data: np.ndarray, new_width: int, new_height: int, mode: str = "nearest",
+                 workers: int = 1) -> np.ndarray:
     """ 
     Redimensiona uma imagem PGM.
+
+    Os modos disponíveis são "nearest" (vizinho mais próximo), "bilinear" e
+    "area" (média das caixas de origem, indicado para reduções). Todos operam
+    sobre a imagem inteira, de forma separável (primeiro linhas, depois colunas).
+    Com `workers` > 1, a saída é dividida em faixas horizontais calculadas em
+    paralelo por processos que compartilham a imagem de origem.
     
     Args:
-        data (list[int]): dados da imagem.
-        original_width (int): largura da imagem original.
-        original_height (int): altura da imagem original.
+        data (np.ndarray): dados da imagem (altura x largura [x canais]).
         new_width (int): largura da imagem redimensionada.
         new_height (int): altura da imagem redimensionada.
+        mode (str): método de interpolação.
+        workers (int): número de processos.
     
     Returns:
-        list[int]: dados da imagem redimensionada.
+        np.ndarray: dados da imagem redimensionada.
     """
-    
-    resized_image = []
-    
-    # Calcular a taxa de escala
-    x_scale = original_width / new_width
-    y_scale = original_height / new_height
-    
-    for y in range(new_height):
-        for x in range(new_width):
-            # Encontrar o pixel mais próximo na imagem original
-            src_x = int(x * x_scale)
-            src_y = int(y * y_scale)
-            resized_image.append(data[src_y * original_width + src_x])
-    
-    return resized_image
+    if new_width <= 0 or new_height <= 0:
+        raise ValueError(f"Dimensões inválidas: {new_width}x{new_height}.")
+    if mode not in ("nearest", "bilinear", "area"):
+        raise ValueError(f"Modo de redimensionamento desconhecido: {mode}.")
+
+    if workers > 1:
+        return _resize_parallel(data, new_width, new_height, mode, workers)
+    return _resize_rows(data, new_width, new_height, mode)
+
+
+def _pyramid_level(levels: list[np.ndarray], width: int, height: int) -> np.ndarray:
+    """
+    Escolhe o nível da pirâmide a partir do qual uma redução por média deve ser
+    calculada, construindo novos níveis (reduções de 2x por média) quando necessário.
 
-# Ler a imagem original
-original_width, original_height, bits, data = read_image("src/main/resources/Entrada_EscalaCinza.pgm")
+    Só servem níveis cujas dimensões são múltiplas do tamanho pedido: cada caixa
+    da saída é então a união de caixas inteiras do nível, e a média das médias é
+    igual à média calculada a partir da imagem original. Pelo mesmo motivo, um
+    nível só é reduzido à metade se as suas dimensões forem pares. Quando nenhum
+    nível serve, a saída parte da imagem original.
+
+    Args:
+        levels (list[np.ndarray]): níveis já calculados, a partir da imagem original.
+        width (int): largura pedida.
+        height (int): altura pedida.
+
+    Returns:
+        np.ndarray: nível a partir do qual a saída deve ser calculada.
+    """
+    while True:
+        top_height, top_width = levels[-1].shape[:2]
+        if top_width % 2 or top_height % 2 or top_width // 2 < width or top_height // 2 < height:
+            break
+        level = _area_axis(levels[-1], top_height // 2, axis=0)
+        levels.append(_area_axis(level, top_width // 2, axis=1))
 
-# a) 10x menor que a original
-new_width = original_width // 10
-new_height = original_height // 10
-resized_image = resize_image(data, original_width, original_height, new_width, new_height)
-save_image(new_width, new_height, bits, resized_image)
+    for level in reversed(levels):
+        level_height, level_width = level.shape[:2]
+        if level_height % height == 0 and level_width % width == 0:
+            return level
+    return levels[0]
+
+
+def resize_many(data: np.ndarray, sizes: Sequence[tuple[int, int]], mode: str = "nearest",
+                writer: Callable[[int, int, np.ndarray], None] | None = None,
+                workers: int = 2) -> dict[tuple[int, int], np.ndarray]:
+    """
+    Redimensiona a mesma imagem para vários tamanhos em uma única chamada.
+
+    As tabelas de índices do modo "nearest" são compartilhadas entre as saídas.
+    No modo "area", as reduções por fator inteiro partem de uma pirâmide de
+    reduções de 2x (mip) calculada uma única vez, quando um nível divide o
+    tamanho pedido; o resultado é o mesmo de `resize_image`. As demais saídas,
+    e todas as do modo "bilinear", são calculadas a partir da imagem original.
+    Se `writer` for informado, cada saída é entregue a ele assim que fica
+    pronta, em uma thread separada, enquanto as próximas são calculadas.
+
+    Args:
+        data (np.ndarray): dados da imagem (altura x largura [x canais]).
+        sizes (Sequence[tuple[int, int]]): tamanhos (largura, altura) desejados.
+        mode (str): método de interpolação (veja `resize_image`).
+        writer (Callable[[int, int, np.ndarray], None] | None): função chamada com
+            (largura, altura, imagem) para cada saída.
+        workers (int): número de threads de escrita.
+
+    Returns:
+        dict[tuple[int, int], np.ndarray]: imagens redimensionadas por (largura, altura).
+    """
+    results = {}
+    levels = [data]
+    executor = ThreadPoolExecutor(max_workers=workers) if writer else None
+    try:
+        futures = []
+        for width, height in sizes:
+            if width <= 0 or height <= 0:
+                raise ValueError(f"Dimensões inválidas: {width}x{height}.")
+            if mode == "area":
+                source = _pyramid_level(levels, width, height)
+                resized = _to_dtype(_interpolate(source, width, height, mode), data.dtype)
+            else:
+                resized = _resize_rows(data, width, height, mode)
+            results[(width, height)] = resized
+            if executor:
+                futures.append(executor.submit(writer, width, height, resized))
+        # Propaga eventuais erros de escrita
+        for future in futures:
+            future.result()
+    finally:
+        if executor:
+            executor.shutdown()
+    return results
 
-# b) Padrão 480x320
-resized_image = resize_image(data, original_width, original_height, 480, 320)
-save_image(480, 320, bits, resized_image)
 
-# c) Padrão 720p (1280x720)
-resized_image = resize_image(data, original_width, original_height, 1280, 720)
-save_image(1280, 720, bits, resized_image)
+if __name__ == "__main__":
+    # Ler a imagem original
+    original_width, original_height, bits, data = read_pgm("src/main/resources/Entrada_EscalaCinza.pgm")
 
-# d) Padrão 1080p Full HD (1920x1080)
-resized_image = resize_image(data, original_width, original_height, 1920, 1080)
-save_image(1920, 1080, bits, resized_image)
+    def save(width: int, height: int, image: np.ndarray) -> None:
+        save_image(width, height, bits, image)
 
-# e) Padrão 4k (3840x2160)
-resized_image = resize_image(data, original_width, original_height, 3840, 2160)
-save_image(3840, 2160, bits, resized_image)
+    # Reduções, calculadas por média a partir da pirâmide
+    reductions = [
+        (original_width // 10, original_height // 10),  # a) 10x menor que a original
+        (480, 320),                                     # b) Padrão 480x320
+    ]
+    resize_many(data, reductions, mode="area", writer=save)
 
-# Padrão 8k (7680x4320)
-resized_image = resize_image(data, original_width, original_height, 7680, 4320)
-save_image(7680, 4320, bits, resized_image)
+    # Ampliações, pelo vizinho mais próximo
+    enlargements = [
+        (1280, 720),   # c) Padrão 720p
+        (1920, 1080),  # d) Padrão 1080p Full HD
+        (3840, 2160),  # e) Padrão 4k
+        (7680, 4320),  # Padrão 8k
+    ]
+    resize_many(data, enlargements, writer=save, workers=4)
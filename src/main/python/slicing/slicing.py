@@ -1,9 +1,113 @@
-from PIL import Image
-import numpy as np
+"""
+Fatiamento de uma imagem em planos de bits.
+
+Os planos são extraídos em uma única passada por bloco de linhas: cada amostra
+é expandida nos seus bits com `np.unpackbits` e cada plano é compactado de
+volta com `np.packbits`, 8 pixels por byte. Todos os planos juntos ocupam o
+mesmo espaço da imagem original (1/8 de um array de bytes por plano).
+
+Um plano (`BitPlane`) é uma vista sobre os bytes compactados e só é expandido
+em pixels quando convertido em array, por exemplo ao ser salvo.
+
+A reconstrução com um subconjunto de planos é uma máscara aplicada à imagem
+original com um único E bit a bit. Os planos também podem ser gerados em código
+de Gray e transmitidos do mais para o menos significativo, com uma prévia da
+imagem a cada plano recebido.
+"""
+
 import os
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+import numpy as np
+
+# Linhas expandidas em bits a cada passada (limita a memória extra)
+ROWS_PER_PASS = 256
+
+
+class BitPlane(NamedTuple):
+    """
+    Vista preguiçosa de um plano de bits.
+
+    Attributes:
+        packed (np.ndarray): bits do plano, 8 pixels por byte (altura x ceil(largura / 8)).
+        width (int): largura da imagem, em pixels.
+        bit (int): posição do bit (0 = menos significativo).
+        scale (int): valor de um pixel com o bit ligado ao expandir o plano.
+    """
+    packed: np.ndarray
+    width: int
+    bit: int
+    scale: int = 1
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.packed.shape[0], self.width
+
+    def unpack(self) -> np.ndarray:
+        """
+        Expande o plano em pixels.
+
+        Returns:
+            np.ndarray: pixels 0 ou `scale` (altura x largura).
+        """
+        bits = np.unpackbits(self.packed, axis=-1, count=self.width)
+        if self.scale == 1:
+            return bits
+        return bits * np.array(self.scale, dtype=np.uint8 if self.scale < 256 else np.uint16)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        pixels = self.unpack()
+        return pixels if dtype is None else pixels.astype(dtype)
+
+
+class BitPlanes:
+    """
+    Planos de bits de uma imagem em escala de cinza, guardados compactados.
+
+    Args:
+        image (np.ndarray): imagem (altura x largura), de 8 ou 16 bits.
+    """
+
+    def __init__(self, image: np.ndarray):
+        image = np.asarray(image)
+        if image.ndim != 2 or image.dtype.kind not in "ui" or image.dtype.itemsize > 2:
+            raise ValueError(f"Imagem em escala de cinza de 8 ou 16 bits esperada, não {image.dtype} {image.shape}.")
+        height, width = image.shape
+        self.width = width
+        self.depth = image.dtype.itemsize * 8
+        self.packed = np.empty((self.depth, height, -(-width // 8)), dtype=np.uint8)
+
+        # Bytes de cada amostra em ordem little-endian: bit k da amostra = bit k da expansão
+        # (contíguos: `view` não reinterpreta os bytes de um recorte ou de um canal de uma imagem RGB)
+        samples = np.ascontiguousarray(image.astype(image.dtype.newbyteorder("<"), copy=False)).view(np.uint8)
+        for start in range(0, height, ROWS_PER_PASS):
+            block = samples[start:start + ROWS_PER_PASS].reshape(-1, width, self.depth // 8)
+            bits = np.unpackbits(block, axis=-1, bitorder="little")
+            self.packed[:, start:start + ROWS_PER_PASS] = np.packbits(np.moveaxis(bits, -1, 0), axis=-1)
 
-# Função para gerar os planos de bits
-def generate_bit_planes(image_array: np.ndarray) -> list[np.ndarray]:
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.packed.shape[1], self.width
+
+    @property
+    def nbytes(self) -> int:
+        return self.packed.nbytes
+
+    def __len__(self) -> int:
+        return self.depth
+
+    def __getitem__(self, bit: int) -> BitPlane:
+        if not -self.depth <= bit < self.depth:
+            raise IndexError(f"Plano {bit} fora de 0-{self.depth - 1}.")
+        bit %= self.depth
+        return BitPlane(self.packed[bit], self.width, bit)
+
+    def __iter__(self) -> Iterator[BitPlane]:
+        return (self[bit] for bit in range(self.depth))
+
+
+def generate_bit_planes(image_array: np.ndarray) -> BitPlanes:
     """
     Gera os planos de bits a partir da imagem.
 
@@ -11,75 +115,214 @@ def generate_bit_planes(image_array: np.ndarray) -> list[np.ndarray]:
         image_array (np.ndarray): Matriz da imagem.
 
     Returns:
-        list[np.ndarray]: Planos de bits.
+        BitPlanes: Planos de bits, do menos para o mais significativo.
     """
-    bit_planes = []
-    for i in range(8):
-        bit_plane = (image_array >> i) & 1 
-        bit_planes.append(bit_plane)
-    return bit_planes
+    return BitPlanes(image_array)
+
 
-def generate_gray_planes(bit_planes: list[np.ndarray]) -> list[np.ndarray]:
+def generate_gray_planes(bit_planes: BitPlanes) -> list[BitPlane]:
     """
     Gera os planos de cinza a partir dos planos de bits.
 
+    Os planos de cinza são as mesmas vistas com o valor posicional do bit, sem
+    cópias dos dados.
+
     Args:
-        bit_planes (list[np.ndarray]): planos de bits.
+        bit_planes (BitPlanes): planos de bits.
 
     Returns:
-        list[np.ndarray]: planos de cinza.
+        list[BitPlane]: planos de cinza.
     """
-    gray_planes = []
-    for i, bit_plane in enumerate(bit_planes):
-        gray_plane = bit_plane * (2**i)  # Multiplicar pelo valor posicional
-        gray_planes.append(gray_plane)
-    return gray_planes
+    return [plane._replace(scale=1 << plane.bit) for plane in bit_planes]
+
 
-def reconstruct_image_from_msb(bit_planes: list[np.ndarray]) -> np.ndarray:
+def plane_mask(planes: Iterable[int], depth: int = 8) -> int:
     """
-    Reconstruir a imagem com os 3 bits mais significativos (MSB).
+    Monta a máscara com os bits dos planos escolhidos.
 
-    Args:   
-        bit_planes (list[np.ndarray]): Planos de bits.
+    Args:
+        planes (Iterable[int]): planos a manter (0 = menos significativo).
+        depth (int): número de bits da imagem.
+
+    Returns:
+        int: máscara de bits.
+    """
+    mask = 0
+    for bit in planes:
+        if not 0 <= bit < depth:
+            raise ValueError(f"Plano {bit} fora de 0-{depth - 1}.")
+        mask |= 1 << bit
+    return mask
+
+
+def reconstruct(image_array: np.ndarray, planes: Iterable[int]) -> np.ndarray:
+    """
+    Reconstrói a imagem só com os planos escolhidos, com um único E bit a bit.
+
+    Args:
+        image_array (np.ndarray): Matriz da imagem.
+        planes (Iterable[int]): planos a manter (0 = menos significativo).
 
     Returns:
         np.ndarray: Imagem reconstruida.
     """
-    msb_planes = bit_planes[-3:]  # Planos 6, 7 e 8 (3 mais significativos)
-    reconstructed_image = sum(plane * (2**(5 + i)) for i, plane in enumerate(msb_planes))
-    return reconstructed_image
+    image_array = np.asarray(image_array)
+    mask = plane_mask(planes, image_array.dtype.itemsize * 8)
+    return np.bitwise_and(image_array, np.array(mask, dtype=image_array.dtype))
 
-image_path = 'src/main/resources/Fig0314(a)(100-dollars).tif'
-image = Image.open(image_path).convert('L') 
-image_array = np.array(image)
 
-bit_planes = generate_bit_planes(image_array)
+def reconstruct_image_from_msb(image_array: np.ndarray, count: int = 3) -> np.ndarray:
+    """
+    Reconstruir a imagem com os bits mais significativos (MSB).
+
+    Args:
+        image_array (np.ndarray): Matriz da imagem.
+        count (int): número de planos mais significativos a manter.
 
-gray_planes = generate_gray_planes(bit_planes)
+    Returns:
+        np.ndarray: Imagem reconstruida.
+    """
+    depth = np.asarray(image_array).dtype.itemsize * 8
+    return reconstruct(image_array, range(depth - count, depth))
+
+
+def gray_encode(image_array: np.ndarray) -> np.ndarray:
+    """
+    Converte as intensidades para o código de Gray (g = b xor (b >> 1)).
+
+    Intensidades vizinhas diferem em um único bit no código de Gray, então os
+    planos de bits têm menos transições e comprimem bem melhor com RLE.
+
+    Args:
+        image_array (np.ndarray): Matriz da imagem.
+
+    Returns:
+        np.ndarray: Intensidades em código de Gray.
+    """
+    return image_array ^ (image_array >> 1)
+
+
+def gray_decode(code: np.ndarray) -> np.ndarray:
+    """
+    Converte intensidades em código de Gray de volta para binário.
+
+    Cada bit binário é o xor de todos os bits de Gray de mesma posição ou
+    acima, calculado com log2(bits) deslocamentos.
+
+    Args:
+        code (np.ndarray): Intensidades em código de Gray.
+
+    Returns:
+        np.ndarray: Intensidades em binário.
+    """
+    binary = np.array(code, copy=True)
+    shift = 1
+    while shift < binary.dtype.itemsize * 8:
+        binary ^= binary >> shift
+        shift <<= 1
+    return binary
+
+
+def generate_gray_code_planes(image_array: np.ndarray) -> BitPlanes:
+    """
+    Gera os planos de bits da imagem em código de Gray.
+
+    Args:
+        image_array (np.ndarray): Matriz da imagem.
+
+    Returns:
+        BitPlanes: Planos de bits do código de Gray.
+    """
+    return BitPlanes(gray_encode(np.asarray(image_array)))
+
+
+class ProgressiveReconstruction:
+    """
+    Reconstrução progressiva de uma imagem a partir de planos recebidos do
+    mais para o menos significativo.
+
+    Depois de cada plano há uma prévia com todos os bits recebidos até então.
+    Com planos em código de Gray, os k planos mais significativos determinam
+    exatamente os k bits binários mais significativos, então as prévias são
+    iguais às dos planos binários.
+
+    Args:
+        shape (tuple[int, int]): altura e largura da imagem.
+        depth (int): número de bits da imagem (8 ou 16).
+        gray (bool): os planos estão em código de Gray.
+    """
+
+    def __init__(self, shape: tuple[int, int], depth: int = 8, gray: bool = False):
+        self.code = np.zeros(shape, dtype=np.uint8 if depth == 8 else np.uint16)
+        self.depth = depth
+        self.gray = gray
+        self.mask = 0
+
+    def add(self, plane: BitPlane) -> np.ndarray:
+        """
+        Acrescenta um plano e devolve a prévia da imagem.
+
+        Args:
+            plane (BitPlane): plano recebido (com qualquer `scale`).
+
+        Returns:
+            np.ndarray: prévia com os planos recebidos até agora.
+        """
+        # Bits crus (0 ou 1) do plano: `unpack` já multiplicaria planos de cinza pelo valor posicional
+        bits = np.unpackbits(plane.packed, axis=-1, count=plane.width)
+        self.code |= bits.astype(self.code.dtype) << plane.bit
+        self.mask |= 1 << plane.bit
+        return self.preview()
+
+    def preview(self) -> np.ndarray:
+        """
+        Prévia da imagem com os planos recebidos até agora.
+
+        Returns:
+            np.ndarray: imagem com os bits ausentes zerados.
+        """
+        if not self.gray:
+            return self.code.copy()
+        return gray_decode(self.code) & np.array(self.mask, dtype=self.code.dtype)
+
+
+def progressive_previews(bit_planes: BitPlanes, gray: bool = False) -> Iterator[np.ndarray]:
+    """
+    Transmite os planos do mais para o menos significativo, gerando uma prévia
+    depois de cada um.
+
+    Args:
+        bit_planes (BitPlanes): planos de bits (binários ou em código de Gray).
+        gray (bool): os planos estão em código de Gray.
+
+    Yields:
+        np.ndarray: prévia após cada plano.
+    """
+    receiver = ProgressiveReconstruction(bit_planes.shape, len(bit_planes), gray)
+    for bit in reversed(range(len(bit_planes))):
+        yield receiver.add(bit_planes[bit])
 
-reconstructed_image = reconstruct_image_from_msb(bit_planes)
 
-output_dir = "src/main/resources/"
-os.makedirs(output_dir, exist_ok=True)
+if __name__ == "__main__":
+    from PIL import Image
 
-bit_plane_paths = []
-gray_plane_paths = []
+    from export.exporter import ExportQueue
 
-for i, (bit_plane, gray_plane) in enumerate(zip(bit_planes, gray_planes)):
-    bit_plane_image = Image.fromarray((bit_plane * 255).astype(np.uint8))
-    gray_plane_image = Image.fromarray(gray_plane.astype(np.uint8))
+    image_path = 'src/main/resources/Fig0314(a)(100-dollars).tif'
+    image_array = np.array(Image.open(image_path).convert('L'))
 
-    bit_plane_path = os.path.join(output_dir, f"bit_plane_{i+1}.png")
-    gray_plane_path = os.path.join(output_dir, f"gray_plane_{i+1}.png")
-    
-    bit_plane_image.save(bit_plane_path)
-    gray_plane_image.save(gray_plane_path)
+    bit_planes = generate_bit_planes(image_array)
+    gray_planes = generate_gray_planes(bit_planes)
 
-    bit_plane_paths.append(bit_plane_path)
-    gray_plane_paths.append(gray_plane_path)
+    output_dir = "src/main/resources/"
+    os.makedirs(output_dir, exist_ok=True)
 
-# Salvar a imagem reconstruída
-reconstructed_path = os.path.join(output_dir, "reconstructed_image_3_msb.png")
-Image.fromarray(reconstructed_image.astype(np.uint8)).save(reconstructed_path)
+    # Os PNGs são codificados em paralelo; cada plano só é expandido na thread que o salva
+    with ExportQueue() as exports:
+        for i, (bit_plane, gray_plane) in enumerate(zip(bit_planes, gray_planes)):
+            exports.submit_image(os.path.join(output_dir, f"bit_plane_{i+1}.png"), bit_plane._replace(scale=255))
+            exports.submit_image(os.path.join(output_dir, f"gray_plane_{i+1}.png"), gray_plane)
 
-bit_plane_paths, gray_plane_paths, reconstructed_path
+        # Salvar a imagem reconstruída
+        reconstructed_path = os.path.join(output_dir, "reconstructed_image_3_msb.png")
+        exports.submit_image(reconstructed_path, reconstruct_image_from_msb(image_array))
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Os testes importam os módulos de src/main/python, como os scripts (PYTHONPATH=src/main/python)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "python"))
@@ -0,0 +1,125 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from compress.band_codecs import (CODECS, HUFFMAN_MAX_LENGTH, PREDICTORS, band_codecs, canonical_codes, compress,
+                                  decompress, huffman_decode, huffman_encode, huffman_lengths, lz77_decode, lz77_encode,
+                                  register_codec)
+
+
+def reference_predict(band: np.ndarray, kind: str) -> np.ndarray:
+    """Preditores do PNG amostra a amostra (a = esquerda, b = acima, c = diagonal)."""
+    rows, channels, width = band.shape
+    modulus = 1 << (8 * band.dtype.itemsize)
+    residual = np.zeros(band.shape, dtype=np.int64)
+    for y in range(rows):
+        for ch in range(channels):
+            for x in range(width):
+                a = int(band[y, ch, x - 1]) if x else 0
+                b = int(band[y - 1, ch, x]) if y else 0
+                c = int(band[y - 1, ch, x - 1]) if x and y else 0
+                if kind == "sub":
+                    prediction = a
+                elif kind == "up":
+                    prediction = b
+                else:
+                    p = a + b - c
+                    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                    prediction = a if pa <= pb and pa <= pc else b if pb <= pc else c
+                residual[y, ch, x] = (int(band[y, ch, x]) - prediction) % modulus
+    return residual.astype(band.dtype)
+
+
+def sample_image(shape: tuple[int, ...], maxval: int, seed: int = 0) -> np.ndarray:
+    """Gradiente com ruído e blocos repetidos: exercita todos os codificadores."""
+    rng = np.random.default_rng(seed)
+    height, width = shape[:2]
+    base = np.add.outer(np.arange(height), np.arange(width)) * (maxval // max(height + width, 1))
+    if len(shape) == 3:
+        base = np.repeat(base[:, :, np.newaxis], shape[2], axis=2)
+    pixels = np.clip(base + rng.integers(-2, 3, base.shape), 0, maxval)
+    pixels[height // 2:, : width // 3] = maxval // 3
+    return pixels.astype(np.uint8 if maxval < 256 else np.uint16)
+
+
+@pytest.mark.parametrize("kind", ["sub", "up", "paeth"])
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+def test_predictors_match_reference(kind, dtype):
+    band = np.random.default_rng(0).integers(0, np.iinfo(dtype).max, (6, 2, 11), endpoint=True).astype(dtype)
+    predict, unpredict = PREDICTORS[kind]
+    residual = predict(band)
+    assert np.array_equal(residual, reference_predict(band, kind))
+    assert np.array_equal(unpredict(residual), band)
+
+
+@pytest.mark.parametrize("codec", sorted(CODECS))
+@pytest.mark.parametrize("shape, maxval", [((37, 29), 255), ((20, 13, 3), 255), ((9, 70, 3), 65535),
+                                           ((1, 1), 1), ((130, 5), 4095)])
+def test_codec_round_trip(codec, shape, maxval):
+    pixels = sample_image(shape, maxval)
+    data = compress(pixels, codec, maxval, rows=16)
+    width, height, decoded_maxval, decoded = decompress(data)
+    assert (width, height, decoded_maxval) == (shape[1], shape[0], maxval)
+    assert np.array_equal(decoded, pixels)
+    assert set(band_codecs(data)) == {codec}
+
+
+def test_auto_picks_a_codec_per_band():
+    pixels = sample_image((128, 64, 3), 255)
+    pixels[64:] = np.random.default_rng(1).integers(0, 256, (64, 64, 3))
+    data = compress(pixels, "auto", rows=32)
+    assert np.array_equal(decompress(data)[3], pixels)
+    assert len(band_codecs(data)) == 4
+    assert all(codec in CODECS for codec in band_codecs(data))
+    # A escolha nunca deve ser pior que os dados sem compressão, com folga para os cabeçalhos
+    assert len(data) <= len(compress(pixels, "raw", rows=32))
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 1000, 70000])
+def test_huffman_and_lz77_round_trip(size):
+    rng = np.random.default_rng(size)
+    data = np.repeat(rng.integers(0, 256, size), rng.integers(1, 6, size))[:size].astype(np.uint8)
+    assert np.array_equal(huffman_decode(huffman_encode(data), size), data)
+    assert np.array_equal(lz77_decode(lz77_encode(data), size), data)
+
+
+def test_lz77_long_repeats():
+    data = np.tile(np.arange(10, dtype=np.uint8), 5000)
+    encoded = lz77_encode(data)
+    assert len(encoded) < data.size // 20
+    assert np.array_equal(lz77_decode(encoded, data.size), data)
+
+
+def test_huffman_lengths_are_limited_and_prefix_free():
+    # Frequências de Fibonacci levam à árvore mais profunda possível
+    counts = np.zeros(256, dtype=np.int64)
+    fibonacci = [1, 1]
+    while len(fibonacci) < 40:
+        fibonacci.append(fibonacci[-1] + fibonacci[-2])
+    counts[:40] = fibonacci
+    lengths = huffman_lengths(counts)
+    assert lengths.max() <= HUFFMAN_MAX_LENGTH
+    assert (lengths[:40] > 0).all() and (lengths[40:] == 0).all()
+    # Desigualdade de Kraft: um código de prefixo com esses comprimentos existe
+    assert sum(2.0 ** -int(length) for length in lengths if length) <= 1.0
+
+    codes = canonical_codes(lengths)
+    words = [format(int(codes[s]), f"0{int(lengths[s])}b") for s in np.flatnonzero(lengths)]
+    assert not any(u != v and v.startswith(u) for u in words for v in words)
+
+
+def test_register_codec_rejects_duplicates():
+    existing = next(iter(CODECS))
+    with pytest.raises(ValueError):
+        register_codec(existing, 250, CODECS[existing].encode, CODECS[existing].decode)
+    with pytest.raises(ValueError):
+        register_codec("novo", CODECS[existing].codec_id, CODECS[existing].encode, CODECS[existing].decode)
+
+
+def test_no_module_shadows_the_standard_library():
+    # Os scripts rodam com o próprio diretório no sys.path: um módulo local esconderia o da biblioteca
+    root = os.path.join(os.path.dirname(__file__), os.pardir, "python")
+    names = {os.path.splitext(name)[0] for _, _, files in os.walk(root) for name in files if name.endswith(".py")}
+    assert not names & sys.stdlib_module_names
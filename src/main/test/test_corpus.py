@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from generators.corpus import PATTERNS, corpus, synthetic_image, write_corpus
+from netpbm import read_image
+
+SIZES = [(1, 1), (3, 5), (10, 1024), (1024, 10), (2, 300), (300, 2), (33, 47)]
+
+
+@pytest.mark.parametrize("pattern", list(PATTERNS))
+@pytest.mark.parametrize("width, height", SIZES)
+def test_every_pattern_and_size(pattern, width, height):
+    for channels in (1, 3):
+        for maxval in (1, 255, 65535):
+            pixels = synthetic_image(pattern, width, height, maxval, channels)
+            assert pixels.shape == ((height, width) if channels == 1 else (height, width, 3))
+            assert pixels.dtype == (np.uint8 if maxval < 256 else np.uint16)
+            assert pixels.max() <= maxval
+
+
+@pytest.mark.parametrize("pattern", list(PATTERNS))
+def test_reproducible(pattern):
+    first = synthetic_image(pattern, 40, 30, 255, 3, seed=7)
+    assert np.array_equal(first, synthetic_image(pattern, 40, 30, 255, 3, seed=7))
+    if pattern not in ("gradiente", "tabuleiro"):
+        assert not np.array_equal(first, synthetic_image(pattern, 40, 30, 255, 3, seed=8))
+
+
+def test_pattern_independent_of_generation_order():
+    images = {name: pixels for name, pixels, _ in corpus(24, 16, 255, "P5", 1)}
+    for name, pixels, _ in corpus(24, 16, 255, "P5", 1, ["texto", "blocos"]):
+        assert np.array_equal(images[name], pixels)
+
+
+def test_text_has_dark_words_on_light_page():
+    pixels = synthetic_image("texto", 256, 256)
+    assert pixels.max() == 255 and pixels.min() < 64
+    assert (pixels == 255).mean() > 0.5
+
+
+def test_invalid_arguments():
+    for args in (("nada", 4, 4), ("blocos", 0, 4), ("blocos", 4, 4, 0), ("blocos", 4, 4, 65536),
+                 ("blocos", 4, 4, 255, 2)):
+        with pytest.raises(ValueError):
+            synthetic_image(*args)
+
+
+def test_write_corpus_round_trip(tmp_path):
+    paths = write_corpus(str(tmp_path), 9, 5, 1000, ["P1", "P5", "P6"], patterns=["texto", "gradiente"])
+    assert len(paths) == 6
+    for path in paths:
+        width, height, maxval, pixels = read_image(path)
+        assert (width, height) == (9, 5)
+        assert maxval == (1 if path.endswith(".pbm") else 1000)
+        assert np.asarray(pixels).max() <= maxval
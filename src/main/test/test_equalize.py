@@ -0,0 +1,100 @@
+import glob
+import os
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from generators.corpus import synthetic_image  # noqa: E402
+from histogram.equalize_histogram import clahe, equalization_lut, equalize_histogram  # noqa: E402
+from histogram.hist import compute_histogram  # noqa: E402
+
+RESOURCES = os.path.join(os.path.dirname(__file__), os.pardir, "resources")
+
+
+def legacy_equalize(image: np.ndarray) -> np.ndarray:
+    """Equalização original de equalize_histogram.py (laço sobre os pixels)."""
+    height, width = image.shape
+    MN = height * width
+    L = 256
+    p_r = compute_histogram(image, L - 1)[:, 0] / MN
+    s_k = np.cumsum(p_r) * (L - 1)
+    s_k = np.round(s_k).astype(int)
+    return np.array([s_k[p] for p in image.flatten()], dtype=np.uint8).reshape(height, width)
+
+
+def sample_images() -> list[np.ndarray]:
+    images = [cv2.imread(path, cv2.IMREAD_GRAYSCALE) for path in sorted(glob.glob(os.path.join(RESOURCES, "Fig0316*")))]
+    images += [synthetic_image(pattern, 131, 97) for pattern in ("baixo_contraste", "escura", "ruido_snr20", "blocos")]
+    return images
+
+
+@pytest.mark.parametrize("index", range(8))
+def test_equalization_matches_legacy(index):
+    images = sample_images()
+    if index >= len(images):
+        pytest.skip("imagem de exemplo ausente")
+    assert np.array_equal(equalize_histogram(images[index]), legacy_equalize(images[index]))
+
+
+@pytest.mark.parametrize("maxval", [1, 31, 1000, 65535])
+def test_equalization_lut_formula(maxval):
+    pixels = synthetic_image("baixo_contraste", 64, 48, maxval)
+    hist = compute_histogram(pixels, maxval)
+    lut = equalization_lut(hist, maxval)
+    # Fórmula do script original, com L - 1 = maxval
+    cdf = np.cumsum(hist[:, 0] / pixels.size)
+    assert lut.dtype == (np.uint8 if maxval < 256 else np.uint16)
+    assert np.array_equal(lut, np.round(cdf * maxval))
+    assert np.array_equal(equalize_histogram(pixels, maxval), lut[pixels])
+
+
+@pytest.mark.parametrize("maxval", [255, 1000])
+def test_flat_image(maxval):
+    image = np.full((40, 30), maxval // 3, dtype=np.uint8 if maxval < 256 else np.uint16)
+    assert (equalize_histogram(image, maxval) == maxval).all()
+    result = clahe(image, maxval, (3, 4))
+    assert (result == result[0, 0]).all() and result.max() <= maxval
+    if maxval == 255:
+        assert np.array_equal(legacy_equalize(image), equalize_histogram(image))
+        assert np.array_equal(result, cv2.createCLAHE(2.0, (4, 3)).apply(image))
+
+
+@pytest.mark.parametrize("index", range(8))
+@pytest.mark.parametrize("tiles", [(8, 8), (7, 7), (3, 5), (6, 9), (1, 1)])
+def test_clahe_matches_cv2(index, tiles):
+    images = sample_images()
+    if index >= len(images):
+        pytest.skip("imagem de exemplo ausente")
+    image = images[index]
+    height, width = image.shape
+    if (height % tiles[0] == 0) != (width % tiles[1] == 0):
+        # O OpenCV completa também o eixo já divisível com um bloco inteiro a mais
+        pytest.skip("blocos divisíveis em um só eixo")
+    expected = cv2.createCLAHE(2.0, (tiles[1], tiles[0])).apply(image)
+    assert np.abs(clahe(image, 255, tiles).astype(np.int64) - expected).max() <= 1
+
+
+@pytest.mark.parametrize("tiles", [(8, 8), (5, 7)])
+def test_clahe_16_bits_matches_cv2(tiles):
+    image = synthetic_image("ruido_snr20", 131, 97, 65535)
+    expected = cv2.createCLAHE(2.0, (tiles[1], tiles[0])).apply(image)
+    result = clahe(image, 65535, tiles)
+    assert result.dtype == np.uint16
+    assert np.abs(result.astype(np.int64) - expected).max() <= 1
+
+
+@pytest.mark.parametrize("maxval", [31, 255, 1000])
+def test_clahe_single_tile_without_clipping_is_equalization(maxval):
+    image = synthetic_image("escura", 45, 33, maxval)
+    result = clahe(image, maxval, (1, 1), clip_limit=1e9)
+    assert np.abs(result.astype(np.int64) - equalize_histogram(image, maxval)).max() <= 1
+
+
+@pytest.mark.parametrize("shape", [(3, 5), (1, 40), (40, 1), (1, 1)])
+def test_clahe_more_tiles_than_pixels(shape):
+    image = synthetic_image("blocos", shape[1], shape[0], 1000)
+    result = clahe(image, 1000, (8, 8))
+    assert result.shape == image.shape and result.dtype == image.dtype
+    assert result.max() <= 1000
@@ -0,0 +1,96 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from export.exporter import ExportQueue
+
+
+class Tracker:
+    """Conta as escritas em andamento e guarda o maior valor observado."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def write(self, path: str, delay: float = 0.01) -> None:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(delay)
+        with self.lock:
+            self.running -= 1
+
+
+@pytest.mark.parametrize("workers, max_pending", [(8, 3), (2, 5), (4, 1)])
+def test_max_pending_bound(workers, max_pending):
+    tracker = Tracker()
+    with ExportQueue(workers, max_pending) as queue:
+        for index in range(20):
+            queue.submit(f"{index}.png", tracker.write, f"{index}.png")
+            # Escritas enviadas e ainda não concluídas nunca passam do limite
+            assert queue.pending <= max_pending
+    assert tracker.peak <= min(workers, max_pending)
+    assert len(queue.completed) == 20
+
+
+def test_on_done_called_for_every_file():
+    done = []
+    paths = [f"{index}.png" for index in range(30)]
+    with ExportQueue(4, 3, on_done=done.append) as queue:
+        for path in paths:
+            queue.submit(path, Tracker().write, path, 0.001)
+        completed = queue.wait()
+    assert sorted(done) == sorted(paths)
+    assert sorted(completed) == sorted(paths)
+
+
+def test_write_error_propagates_through_wait():
+    def fail(path):
+        raise OSError(f"disco cheio: {path}")
+
+    queue = ExportQueue(2, 2)
+    queue.submit("a.png", Tracker().write, "a.png")
+    queue.submit("b.png", fail, "b.png")
+    with pytest.raises(OSError, match="b.png"):
+        queue.wait()
+    queue.close()
+    assert queue.completed == ["a.png"]
+
+    with pytest.raises(OSError):
+        with ExportQueue(2, 2) as queue:
+            queue.submit("c.png", fail, "c.png")
+
+
+def test_on_done_error_propagates_through_wait():
+    def on_done(path):
+        if path == "b.png":
+            raise RuntimeError("relatório falhou")
+
+    queue = ExportQueue(2, 2, on_done=on_done)
+    for path in ("a.png", "b.png", "c.png"):
+        queue.submit(path, Tracker().write, path)
+    with pytest.raises(RuntimeError, match="relatório"):
+        queue.wait()
+    assert sorted(queue.completed) == ["a.png", "c.png"]
+    # O erro é relatado uma só vez
+    assert sorted(queue.wait()) == ["a.png", "c.png"]
+    queue.close()
+
+
+def test_submit_image(tmp_path):
+    from PIL import Image
+
+    pixels = np.random.default_rng(0).integers(0, 255, (12, 9, 3), dtype=np.uint8, endpoint=True)
+    with ExportQueue(2, 2) as queue:
+        queue.submit_image(str(tmp_path / "a.png"), pixels)
+    assert np.array_equal(np.asarray(Image.open(tmp_path / "a.png")), pixels)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ExportQueue(0, 1)
+    with pytest.raises(ValueError):
+        ExportQueue(1, 0)
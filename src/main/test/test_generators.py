@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from generators import _bands, pbm, pgm, ppm
+from netpbm import read_image
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_same_seed_same_file(tmp_path, binary):
+    for name, generate in (("a.pbm", lambda path, seed: pbm.generate_pbm(13, 7, seed, path, binary)),
+                           ("a.pgm", lambda path, seed: pgm.generate_pgm(13, 7, 300, seed, path, binary)),
+                           ("a.ppm", lambda path, seed: ppm.generate_ppm(13, 7, 16, seed, path, binary))):
+        first, second, other = (str(tmp_path / f"{prefix}{name}") for prefix in ("1", "2", "3"))
+        generate(first, 5)
+        generate(second, 5)
+        generate(other, 6)
+        with open(first, "rb") as f, open(second, "rb") as g, open(other, "rb") as h:
+            data = f.read()
+            assert data == g.read()
+            assert data != h.read()
+
+
+def test_file_matches_bands(tmp_path):
+    path = str(tmp_path / "a.ppm")
+    ppm.generate_ppm(21, 9, 256, 3, path, binary=True)
+    _, _, maxval, pixels = read_image(path)
+    assert maxval == 255
+    assert np.array_equal(pixels, np.concatenate(list(ppm.random_bands(21, 9, 255, 3))))
+
+
+@pytest.mark.parametrize("width, height", [(1, 1), (7, 50), (40, 3)])
+def test_bands_cover_image(monkeypatch, width, height):
+    # Blocos pequenos: várias passadas mesmo em imagens minúsculas
+    monkeypatch.setattr(_bands, "BAND_SAMPLES", 20)
+    for bands, shape, maxval in ((pbm.random_bands(width, height, 0), (height, width), 1),
+                                 (pgm.random_bands(width, height, 1000, 0), (height, width), 1000),
+                                 (ppm.random_bands(width, height, 15, 0), (height, width, 3), 15)):
+        bands = list(bands)
+        assert all(band.shape[0] * band[0].size <= max(20, band[0].size) for band in bands)
+        pixels = np.concatenate(bands)
+        assert pixels.shape == shape
+        assert pixels.min() >= 0 and pixels.max() <= maxval
@@ -0,0 +1,165 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from histogram.hist import (HistogramAccumulator, compute_histogram, histogram_file, histogram_files,
+                            load_histogram, load_histogram_records, save_histogram, write_histogram_records)
+from netpbm import write_pgm, write_ppm
+
+
+def legacy_histogram(pixels: np.ndarray, maxval: int) -> np.ndarray:
+    """Contagem original dos scripts (um Counter por canal)."""
+    pixels = pixels.reshape(pixels.shape[0], pixels.shape[1], -1)
+    counters = [Counter(pixels[..., c].ravel().tolist()) for c in range(pixels.shape[2])]
+    return np.array([[counter.get(i, 0) for counter in counters] for i in range(maxval + 1)])
+
+
+def random_pixels(seed: int, shape: tuple[int, ...], maxval: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, maxval, shape, dtype=np.uint8 if maxval < 256 else np.uint16, endpoint=True)
+
+
+@pytest.mark.parametrize("shape, maxval", [((17, 23), 1), ((17, 23), 255), ((9, 31, 3), 255),
+                                           ((5, 8, 3), 1000), ((40, 40), 65535)])
+def test_compute_histogram_matches_counter(shape, maxval):
+    pixels = random_pixels(maxval, shape, maxval)
+    assert np.array_equal(compute_histogram(pixels, maxval), legacy_histogram(pixels, maxval))
+
+
+@pytest.mark.parametrize("channels", [1, 3])
+def test_bands_and_merge_match_whole_image(channels):
+    shape = (50, 37, 3) if channels == 3 else (50, 37)
+    pixels = random_pixels(channels, shape, 255)
+    expected = compute_histogram(pixels, 255)
+
+    streamed = HistogramAccumulator(255, channels).update_many(np.array_split(pixels, 7))
+    assert np.array_equal(streamed.counts, expected)
+
+    top, bottom = HistogramAccumulator(255, channels), HistogramAccumulator(255, channels)
+    top.update(pixels[:20])
+    bottom.update(pixels[20:])
+    top += bottom
+    assert np.array_equal(top.counts, expected)
+
+
+def test_merge_rejects_different_shapes():
+    with pytest.raises(ValueError):
+        HistogramAccumulator(255, 1).merge(HistogramAccumulator(255, 3))
+    with pytest.raises(ValueError):
+        HistogramAccumulator(255, 1).update(np.zeros((2, 2, 3), dtype=np.uint8))
+
+
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize("rows", [1, 7, 256])
+def test_histogram_file_matches_whole_image(tmp_path, binary, rows):
+    gray, rgb = random_pixels(1, (45, 19), 255), random_pixels(2, (45, 19, 3), 65535)
+    write_pgm(tmp_path / "a.pgm", gray, 255, binary=binary)
+    write_ppm(tmp_path / "a.ppm", rgb, 65535, binary=binary)
+
+    assert np.array_equal(histogram_file(tmp_path / "a.pgm", rows).counts, compute_histogram(gray, 255))
+    assert np.array_equal(histogram_file(tmp_path / "a.ppm", rows).counts, compute_histogram(rgb, 65535))
+
+
+def test_histogram_files_parallel_matches_serial(tmp_path):
+    filenames = []
+    for seed in range(4):
+        filenames.append(tmp_path / f"{seed}.pgm")
+        write_pgm(filenames[-1], random_pixels(seed, (30, 30), 255), 255, binary=True)
+
+    serial = histogram_files(filenames)
+    parallel = histogram_files(filenames, workers=2)
+    assert np.array_equal(serial.counts, parallel.counts)
+    assert serial.total.tolist() == [4 * 30 * 30]
+    with pytest.raises(ValueError):
+        histogram_files([])
+
+
+@pytest.mark.parametrize("maxval, channels", [(1, 1), (255, 3), (65535, 1)])
+def test_serialization_round_trip(maxval, channels):
+    shape = (12, 13, channels) if channels == 3 else (12, 13)
+    accumulator = HistogramAccumulator(maxval, channels).update(random_pixels(3, shape, maxval))
+    restored = HistogramAccumulator.from_bytes(accumulator.to_bytes())
+    assert (restored.maxval, restored.channels) == (maxval, channels)
+    assert np.array_equal(restored.counts, accumulator.counts)
+
+    with pytest.raises(ValueError):
+        HistogramAccumulator.from_bytes(accumulator.to_bytes()[:-1])
+    with pytest.raises(ValueError):
+        HistogramAccumulator.from_bytes(b"XXXX" + accumulator.to_bytes()[4:])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_statistics_match_numpy(seed):
+    pixels = random_pixels(seed, (21, 34, 3), 255) // 3 + 40
+    accumulator = HistogramAccumulator(255, 3).update(pixels)
+    samples = pixels.reshape(-1, 3)
+
+    assert np.array_equal(accumulator.min(), samples.min(axis=0))
+    assert np.array_equal(accumulator.max(), samples.max(axis=0))
+    q = [0, 0.5, 1, 2.5, 25, 50, 75, 99, 99.5, 100]
+    assert np.array_equal(accumulator.percentile(q), np.percentile(samples, q, axis=0, method="inverted_cdf"))
+    assert np.array_equal(accumulator.percentile(50), np.percentile(samples, 50, axis=0, method="inverted_cdf"))
+    cdf = accumulator.cdf()
+    assert np.allclose(cdf[100], (samples <= 100).mean(axis=0))
+    assert np.allclose(cdf[-1], 1)
+
+
+def test_empty_histogram_statistics():
+    with pytest.raises(ValueError):
+        HistogramAccumulator(255).percentile(50)
+    with pytest.raises(ValueError):
+        HistogramAccumulator(255, 1).update(np.zeros((1, 1), dtype=np.uint8)).percentile(101)
+
+
+@pytest.mark.parametrize("extension", ["csv", "npy"])
+def test_save_load_round_trip(tmp_path, extension):
+    hist = compute_histogram(random_pixels(4, (10, 10, 3), 255), 255)
+    save_histogram(hist, str(tmp_path / f"h.{extension}"))
+    assert np.array_equal(load_histogram(str(tmp_path / f"h.{extension}")), hist)
+    # Caminhos como objetos Path também são aceitos
+    save_histogram(hist, tmp_path / f"p.{extension}")
+    assert np.array_equal(load_histogram(tmp_path / f"p.{extension}"), hist)
+
+
+def test_save_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        save_histogram(np.zeros((2, 1)), tmp_path / "h.txt")
+    with pytest.raises(ValueError):
+        load_histogram(tmp_path / "h.txt")
+
+
+def write_images(tmp_path, count: int, maxval: int = 255) -> list:
+    filenames = []
+    for seed in range(count):
+        filenames.append(tmp_path / f"{seed}.pgm")
+        write_pgm(filenames[-1], random_pixels(seed, (11 + seed, 9), maxval), maxval, binary=True)
+    return filenames
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_histogram_records_round_trip(tmp_path, workers):
+    filenames = write_images(tmp_path, 4)
+    output = tmp_path / "registros.npy"
+    records = write_histogram_records(filenames, output, workers)
+    assert records.shape == (4, 256, 1) and records.dtype == np.uint64
+    assert not records.flags.writeable
+    for record, filename in zip(records, filenames):
+        assert np.array_equal(record, histogram_file(filename).counts)
+    assert np.array_equal(load_histogram_records(output), records)
+    assert np.array_equal(records.sum(axis=0), histogram_files(filenames).counts)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_histogram_records_mismatch_removes_output(tmp_path, workers):
+    filenames = write_images(tmp_path, 2)
+    filenames.append(tmp_path / "outro.pgm")
+    write_pgm(filenames[-1], random_pixels(9, (5, 5), 1000), 1000, binary=True)
+    output = tmp_path / "registros.npy"
+    with pytest.raises(ValueError):
+        write_histogram_records(filenames, output, workers)
+    assert not output.exists()
+
+    with pytest.raises(OSError):
+        write_histogram_records([*filenames[:2], tmp_path / "inexistente.pgm"], output, workers)
+    assert not output.exists()
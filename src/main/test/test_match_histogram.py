@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from histogram.hist import compute_histogram, save_histogram_csv
+from histogram.match_histogram import histogram_cdf, match_histogram, matching_lut, reference_cdf
+from netpbm import write_pgm, write_ppm
+
+
+def legacy_match(pixels: np.ndarray, maxval: int, target_cdf: np.ndarray) -> np.ndarray:
+    """Especificação com laços escalares: menor z com CDF_ref(z) >= CDF_img(k), por canal."""
+    pixels = pixels.reshape(pixels.shape[0], pixels.shape[1], -1)
+    matched = np.empty_like(pixels, dtype=np.int64)
+    for c in range(pixels.shape[2]):
+        counts = [0] * (maxval + 1)
+        for value in pixels[..., c].ravel().tolist():
+            counts[value] += 1
+        total, running, source = sum(counts), 0, []
+        for count in counts:
+            running += count
+            source.append(running / total)
+        target = target_cdf[:, c if target_cdf.shape[1] > 1 else 0].tolist()
+        lut = []
+        for level in source:
+            z = 0
+            while z < len(target) - 1 and target[z] < level - 1e-12:
+                z += 1
+            lut.append(z)
+        for y in range(pixels.shape[0]):
+            for x in range(pixels.shape[1]):
+                matched[y, x, c] = lut[pixels[y, x, c]]
+    return matched.reshape(matched.shape[:2] if matched.shape[2] == 1 else matched.shape)
+
+
+def random_pixels(seed: int, shape: tuple[int, ...], maxval: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, maxval, shape, dtype=np.uint8 if maxval < 256 else np.uint16, endpoint=True)
+
+
+@pytest.mark.parametrize("shape, maxval", [((16, 16), 255), ((9, 11, 3), 255), ((20, 7), 31), ((8, 8), 1000)])
+def test_match_to_own_histogram_is_identity(shape, maxval):
+    pixels = random_pixels(0, shape, maxval)
+    target = histogram_cdf(compute_histogram(pixels, maxval))
+    assert np.array_equal(match_histogram(pixels, maxval, target), pixels)
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("shape", [(12, 15), (6, 10, 3)])
+def test_matches_scalar_reference(seed, shape):
+    pixels = random_pixels(seed, shape, 63) // 2 + 10
+    reference = random_pixels(seed + 10, (30, 30), 255) // 4 + 100
+    target = histogram_cdf(compute_histogram(reference, 255))
+
+    matched = match_histogram(pixels, 63, target)
+    assert np.array_equal(matched, legacy_match(pixels, 63, target))
+    assert matched.shape == pixels.shape
+    assert matched.min() >= 100
+
+
+def test_per_channel_reference():
+    pixels = random_pixels(5, (10, 10, 3), 255)
+    reference = random_pixels(6, (20, 20, 3), 255)
+    target = histogram_cdf(compute_histogram(reference, 255))
+    assert np.array_equal(match_histogram(pixels, 255, target), legacy_match(pixels, 255, target))
+
+    with pytest.raises(ValueError):
+        matching_lut(compute_histogram(pixels, 255), np.zeros((256, 2)))
+
+
+def test_csv_reference_matches_image_reference(tmp_path):
+    for magic, channels in (("pgm", 1), ("ppm", 3)):
+        shape = (25, 18, 3) if channels == 3 else (25, 18)
+        reference = random_pixels(channels, shape, 255) // 3 + 60
+        image_path, csv_path = str(tmp_path / f"ref.{magic}"), str(tmp_path / f"ref_{magic}.csv")
+        (write_ppm if channels == 3 else write_pgm)(image_path, reference, 255, binary=True)
+        save_histogram_csv(compute_histogram(reference, 255), csv_path)
+
+        assert np.array_equal(reference_cdf(image_path), reference_cdf(csv_path))
+        pixels = random_pixels(9, shape, 255)
+        assert np.array_equal(match_histogram(pixels, 255, reference_cdf(image_path)),
+                              match_histogram(pixels, 255, reference_cdf(csv_path)))
+
+
+def test_reference_cdf_is_cached_and_read_only(tmp_path):
+    path = str(tmp_path / "ref.pgm")
+    write_pgm(path, random_pixels(1, (4, 4), 15), 15)
+    cdf = reference_cdf(path)
+    assert reference_cdf(path) is cdf
+    assert not cdf.flags.writeable
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from netpbm import read_image, read_pbm, read_pgm, read_ppm, write_pbm, write_pgm, write_ppm
+
+
+def legacy_read(filename: str) -> tuple[int, int, int, list[int]]:
+    """Leitura ASCII original dos scripts (uma lista de inteiros)."""
+    with open(filename) as f:
+        magic = f.readline().strip()
+        width, height = map(int, f.readline().split())
+        maxval = 1 if magic == "P1" else int(f.readline())
+        data = []
+        for line in f:
+            data.extend(map(int, line.split()))
+    return width, height, maxval, data
+
+
+@pytest.mark.parametrize("maxval", [1, 15, 255, 256, 65535])
+def test_pgm_binary_matches_ascii(tmp_path, maxval):
+    pixels = np.random.default_rng(maxval).integers(0, maxval, (13, 21), endpoint=True)
+    write_pgm(tmp_path / "a.pgm", pixels, maxval)
+    write_pgm(tmp_path / "b.pgm", pixels, maxval, binary=True)
+
+    ascii_image, binary_image = read_pgm(tmp_path / "a.pgm"), read_pgm(tmp_path / "b.pgm")
+    assert ascii_image[:3] == binary_image[:3] == (21, 13, maxval)
+    assert np.array_equal(ascii_image[3], pixels)
+    assert np.array_equal(binary_image[3], pixels)
+    assert legacy_read(tmp_path / "a.pgm")[3] == pixels.ravel().tolist()
+
+
+@pytest.mark.parametrize("maxval", [255, 65535])
+def test_ppm_binary_matches_ascii(tmp_path, maxval):
+    pixels = np.random.default_rng(1).integers(0, maxval, (7, 9, 3), endpoint=True)
+    write_ppm(tmp_path / "a.ppm", pixels, maxval)
+    write_ppm(tmp_path / "b.ppm", pixels, maxval, binary=True)
+
+    assert np.array_equal(read_ppm(tmp_path / "a.ppm")[3], pixels)
+    assert np.array_equal(read_ppm(tmp_path / "b.ppm")[3], pixels)
+    assert legacy_read(tmp_path / "a.ppm")[3] == pixels.ravel().tolist()
+
+
+@pytest.mark.parametrize("width", [1, 7, 8, 9, 17])
+def test_pbm_binary_matches_ascii(tmp_path, width):
+    pixels = np.random.default_rng(width).integers(0, 1, (5, width), endpoint=True)
+    write_pbm(tmp_path / "a.pbm", pixels)
+    write_pbm(tmp_path / "b.pbm", pixels, binary=True)
+
+    assert np.array_equal(read_pbm(tmp_path / "a.pbm")[3], pixels)
+    assert np.array_equal(read_pbm(tmp_path / "b.pbm")[3], pixels)
+    # Cada linha do P4 ocupa um número inteiro de bytes
+    header_size = len(f"P4\n{width} 5\n")
+    assert (tmp_path / "b.pbm").stat().st_size == header_size + 5 * -(-width // 8)
+
+
+def test_binary_read_is_memory_mapped(tmp_path):
+    pixels = np.arange(64 * 32, dtype=np.uint16).reshape(64, 32)
+    write_pgm(tmp_path / "a.pgm", pixels, 65535, binary=True)
+
+    image = read_image(tmp_path / "a.pgm")[3]
+    assert isinstance(image.base, np.memmap) or isinstance(image, np.memmap)
+    # Mapeamento copy-on-write: alterar o array não altera o arquivo
+    image[0, 0] = 7
+    assert read_image(tmp_path / "a.pgm")[3][0, 0] == 0
+
+
+def test_header_comments_and_bad_magic(tmp_path):
+    (tmp_path / "c.pgm").write_bytes(b"P5\n# comentario\n3 1\n# outro\n255\n\x01\x02\x03")
+    assert np.array_equal(read_pgm(tmp_path / "c.pgm")[3], [[1, 2, 3]])
+
+    (tmp_path / "d.pgm").write_bytes(b"P7\n1 1\n255\n\x00")
+    with pytest.raises(ValueError):
+        read_image(tmp_path / "d.pgm")
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_pbm_accepts_bool_pixels(tmp_path, binary):
+    pixels = np.random.default_rng(3).random((6, 11)) < 0.5
+    write_pbm(tmp_path / "a.pbm", pixels, binary=binary)
+    assert np.array_equal(read_pbm(tmp_path / "a.pbm")[3], pixels)
+
+
+@pytest.mark.parametrize("maxval", [1, 9, 10, 255, 65535])
+def test_ascii_writer_matches_legacy_text(tmp_path, maxval):
+    pixels = np.random.default_rng(maxval).integers(0, maxval, (4, 40, 3), endpoint=True)
+    write_ppm(tmp_path / "a.ppm", pixels, maxval)
+
+    lines = (tmp_path / "a.ppm").read_text().splitlines()
+    # A especificação limita as linhas a 70 caracteres
+    assert max(len(line) for line in lines) <= 70
+    assert " ".join(lines[3:]).split() == [str(value) for value in pixels.ravel()]
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from manipulation.point_ops import (POINT_OPS, apply_lut, apply_point_ops, chain_lut, clear_lut_cache,
+                                    point_lut)
+
+# Versões escalares das operações (uma intensidade por vez)
+SCALAR_OPS = {
+    "gain": lambda x, gain, max_value: min(int(x * gain), max_value),
+    "requantize": lambda x, old_max, new_max: x * new_max // old_max,
+    "threshold": lambda x, threshold: int(x > threshold),
+    "invert": lambda x, max_value: max_value - min(x, max_value),
+    "linear": lambda x, a, b, max_value: min(max(int(a * x + b), 0), max_value),
+}
+
+STEPS = [
+    [("gain", {"gain": 1.7, "max_value": 255})],
+    [("invert", {"max_value": 255}), ("threshold", {"threshold": 100})],
+    [("requantize", {"old_max": 255, "new_max": 31}), ("gain", {"gain": 3.0, "max_value": 80}),
+     ("invert", {"max_value": 80})],
+    [("linear", {"a": 2.5, "b": -40.0, "max_value": 255}), ("requantize", {"old_max": 255, "new_max": 15})],
+    [("gain", {"gain": 200.0, "max_value": 65535}), ("invert", {"max_value": 65535})],
+]
+
+
+def random_pixels(seed: int, maxval: int) -> np.ndarray:
+    dtype = np.uint8 if maxval < 256 else np.uint16
+    return np.random.default_rng(seed).integers(0, maxval, (17, 23), dtype=dtype, endpoint=True)
+
+
+def scalar_apply(pixels: np.ndarray, steps: list[tuple[str, dict]]) -> np.ndarray:
+    values = pixels.ravel().tolist()
+    for op, params in steps:
+        values = [SCALAR_OPS[op](x, **params) for x in values]
+    return np.array(values).reshape(pixels.shape)
+
+
+def test_every_op_has_scalar_reference():
+    assert set(SCALAR_OPS) == set(POINT_OPS)
+
+
+@pytest.mark.parametrize("steps", STEPS)
+def test_chain_equals_ops_one_after_another(steps):
+    pixels = random_pixels(0, 255)
+    sequential = pixels
+    for op, params in steps:
+        maxval = 255 if sequential.max() < 256 else 65535
+        sequential = apply_lut(sequential, point_lut(op, maxval, **params))
+    chained = apply_lut(pixels, chain_lut(steps, 255))
+    assert np.array_equal(chained, sequential)
+    assert np.array_equal(chained, scalar_apply(pixels, steps))
+    assert np.array_equal(apply_point_ops(pixels, steps), chained)
+
+
+@pytest.mark.parametrize("maxval", [255, 65535])
+def test_clipping_at_maxval(maxval):
+    pixels = random_pixels(1, maxval)
+    pixels.flat[:2] = (0, maxval)
+    brightened = apply_point_ops(pixels, [("gain", {"gain": 3.0, "max_value": maxval})], maxval)
+    assert brightened.max() == maxval
+    assert np.array_equal(brightened, np.minimum(pixels.astype(np.int64) * 3, maxval))
+
+    stretched = apply_point_ops(pixels, [("linear", {"a": 4.0, "b": -maxval, "max_value": maxval})], maxval)
+    assert stretched.min() == 0 and stretched.max() == maxval
+    assert np.array_equal(stretched, np.clip(pixels.astype(np.int64) * 4 - maxval, 0, maxval))
+
+    assert np.array_equal(apply_point_ops(pixels, [("invert", {"max_value": maxval})], maxval), maxval - pixels)
+
+
+@pytest.mark.parametrize("maxval, size", [(1, 256), (255, 256), (256, 65536), (65535, 65536)])
+def test_table_size_and_dtype(maxval, size):
+    table = point_lut("invert", maxval, max_value=maxval)
+    assert table.shape == (size,)
+    assert table.dtype == (np.uint8 if maxval < 256 else np.uint16)
+
+
+def test_cached_tables_are_read_only():
+    clear_lut_cache()
+    table = point_lut("gain", 255, gain=2.0, max_value=255)
+    chain = chain_lut(STEPS[1], 255)
+    assert point_lut("gain", 255, max_value=255, gain=2.0) is table
+    assert chain_lut(STEPS[1], 255) is chain
+    for cached in (table, chain):
+        assert not cached.flags.writeable
+        with pytest.raises(ValueError):
+            cached[0] = 1
+    # O resultado de aplicar a tabela é um array novo, que pode ser alterado
+    result = apply_lut(random_pixels(2, 255), table)
+    result[0, 0] = 0
+    assert point_lut("gain", 255, gain=2.0, max_value=255)[128] == 255
+
+
+def test_invalid_operations():
+    with pytest.raises(ValueError):
+        point_lut("nada", 255)
+    with pytest.raises(ValueError):
+        point_lut("linear", 255, a=1.0, b=70000.0, max_value=100000)
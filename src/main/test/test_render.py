@@ -0,0 +1,69 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from histogram import hist as hist_module  # noqa: E402
+from histogram.hist import CHANNEL_COLORS, compute_histogram, plot_histogram  # noqa: E402
+from histogram.render import HistogramPlot, HistogramRenderer  # noqa: E402
+
+
+def channel_plots(channels: int) -> list[HistogramPlot]:
+    shape = (20, 30, channels) if channels == 3 else (20, 30)
+    pixels = np.random.default_rng(channels).integers(0, 255, shape, endpoint=True)
+    hist = compute_histogram(pixels, 255)
+    return [HistogramPlot(hist[:, c], f"Canal {c}", color) for c, color in enumerate(CHANNEL_COLORS[channels])]
+
+
+@pytest.mark.parametrize("channels", [1, 3])
+def test_save_png(tmp_path, channels):
+    renderer = HistogramRenderer()
+    for index, plot in enumerate(channel_plots(channels)):
+        path = tmp_path / f"histograma_{index}.png"
+        renderer.save(plot, str(path))
+        assert path.stat().st_size > 0
+        assert path.read_bytes()[:8] == b"\x89PNG\r\n\x1a\n"
+
+
+def test_to_array_and_reuse():
+    renderer = HistogramRenderer(size=(3, 2), dpi=50)
+    first, second = (renderer.to_array(plot) for plot in channel_plots(3)[:2])
+    assert first.shape == second.shape == (100, 150, 4)
+    assert not np.array_equal(first, second)
+    # A figura é reutilizada: um único histograma desenhado por vez
+    assert len(renderer.axes.patches) == 1
+    assert np.array_equal(renderer.to_array(channel_plots(3)[0]), first)
+
+
+def test_sprite_and_pages(tmp_path):
+    renderer = HistogramRenderer(size=(3, 2), dpi=50)
+    plots = channel_plots(3) + channel_plots(1)
+    renderer.save_sprite(plots, str(tmp_path / "sprite.png"), columns=3)
+    renderer.save_pages(plots, str(tmp_path / "paginas.pdf"))
+    assert (tmp_path / "sprite.png").stat().st_size > 0
+    assert (tmp_path / "paginas.pdf").read_bytes()[:4] == b"%PDF"
+    with pytest.raises(ValueError):
+        renderer.save_sprite([], str(tmp_path / "vazio.png"))
+
+
+def test_concurrent_saves(tmp_path):
+    renderer = HistogramRenderer(size=(3, 2), dpi=50)
+    paths = [str(tmp_path / f"{index}.png") for index in range(8)]
+    plots = (channel_plots(3) * 3)[:8]
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(renderer.save, plots, paths))
+    assert all((tmp_path / f"{index}.png").stat().st_size > 0 for index in range(8))
+
+
+def test_plots_disabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(hist_module, "PLOTS_ENABLED", False)
+    plot_histogram(np.ones(256), "Desligado", str(tmp_path / "nada.png"))
+    assert not (tmp_path / "nada.png").exists()
+
+
+def test_plot_histogram_saves_with_default_renderer(tmp_path, monkeypatch):
+    monkeypatch.setattr(hist_module, "PLOTS_ENABLED", True)
+    plot_histogram(np.arange(256), "Padrão", str(tmp_path / "padrao.png"))
+    assert (tmp_path / "padrao.png").stat().st_size > 0
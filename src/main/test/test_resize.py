@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+
+from resize import resize as resize_module
+
+from resize.resize import resize_image, resize_many
+
+SHAPES = [(97, 131), (97, 131, 3), (1, 50), (50, 1), (1, 1)]
+SIZES = [(13, 9), (40, 30), (65, 97), (200, 150), (1, 1), (7, 1), (1, 7)]
+
+
+def legacy_resize(data: list[int], original_width: int, original_height: int, new_width: int,
+                  new_height: int) -> list[int]:
+    """Laço original de resize.py (vizinho mais próximo, imagem em lista)."""
+    resized_image = []
+    x_scale = original_width / new_width
+    y_scale = original_height / new_height
+    for y in range(new_height):
+        for x in range(new_width):
+            src_x = int(x * x_scale)
+            src_y = int(y * y_scale)
+            resized_image.append(data[src_y * original_width + src_x])
+    return resized_image
+
+
+def box_average_axis(data: np.ndarray, new_size: int, axis: int) -> np.ndarray:
+    """Média de cada caixa de origem, ponderada pela fração coberta de cada pixel."""
+    data = np.moveaxis(data.astype(np.float64), axis, 0)
+    scale = data.shape[0] / new_size
+    output = []
+    for i in range(new_size):
+        left, right = i * scale, (i + 1) * scale
+        total = np.zeros(data.shape[1:])
+        for k in range(int(left), min(int(np.ceil(right)), data.shape[0])):
+            total += (min(right, k + 1) - max(left, k)) * data[k]
+        output.append(total / scale)
+    return np.moveaxis(np.array(output), 0, axis)
+
+
+def reference_area(data: np.ndarray, new_width: int, new_height: int) -> np.ndarray:
+    return box_average_axis(box_average_axis(data, new_height, 0), new_width, 1)
+
+
+def random_image(seed: int, shape: tuple[int, ...], dtype: type = np.uint8) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, np.iinfo(dtype).max, shape, dtype=dtype, endpoint=True)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("size", SIZES)
+def test_nearest_matches_legacy_loop(shape, size):
+    image = random_image(0, shape, np.uint16)
+    resized = resize_image(image, *size)
+    assert resized.shape == (size[1], size[0]) + shape[2:]
+    assert resized.dtype == image.dtype
+    for c in range(image.shape[2] if image.ndim == 3 else 1):
+        channel = image[..., c] if image.ndim == 3 else image
+        expected = legacy_resize(channel.ravel().tolist(), shape[1], shape[0], *size)
+        assert (resized[..., c] if image.ndim == 3 else resized).ravel().tolist() == expected
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("size", SIZES)
+def test_bilinear_matches_cv2(dtype, shape, size):
+    cv2 = pytest.importorskip("cv2")
+    image = random_image(1, shape, dtype)
+    resized = resize_image(image, *size, mode="bilinear")
+    expected = cv2.resize(image, size, interpolation=cv2.INTER_LINEAR).reshape(resized.shape)
+    assert resized.dtype == image.dtype
+    # O OpenCV interpola em ponto fixo: diferenças de arredondamento de até 1 nível
+    assert np.abs(resized.astype(np.int64) - expected).max() <= 1
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+@pytest.mark.parametrize("shape", SHAPES)
+@pytest.mark.parametrize("size", SIZES)
+def test_area_matches_box_average(dtype, shape, size):
+    image = random_image(2, shape, dtype)
+    resized = resize_image(image, *size, mode="area")
+    expected = reference_area(image, *size)
+    assert resized.shape == expected.shape and resized.dtype == image.dtype
+    assert np.abs(resized - expected).max() <= 0.5 + 1e-6
+
+
+@pytest.mark.parametrize("shape", [(97, 131), (97, 131, 3), (64, 48)])
+@pytest.mark.parametrize("size", [(13, 9), (40, 30), (24, 16), (1, 1)])
+def test_area_reduction_matches_cv2(shape, size):
+    # Em ampliações o INTER_AREA do OpenCV passa a interpolar; em reduções é a média das caixas
+    cv2 = pytest.importorskip("cv2")
+    image = random_image(3, shape)
+    resized = resize_image(image, *size, mode="area")
+    expected = cv2.resize(image, size, interpolation=cv2.INTER_AREA).reshape(resized.shape)
+    assert np.abs(resized.astype(np.int64) - expected).max() <= 1
+
+
+@pytest.mark.parametrize("mode", ["nearest", "bilinear", "area"])
+def test_flat_image_stays_flat(mode):
+    image = np.full((30, 20, 3), 65000, dtype=np.uint16)
+    assert (resize_image(image, 7, 45, mode) == 65000).all()
+
+
+@pytest.mark.parametrize("size", [(0, 5), (5, 0), (-1, 3)])
+def test_invalid_sizes(size):
+    with pytest.raises(ValueError):
+        resize_image(random_image(4, (5, 5)), *size)
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        resize_image(random_image(4, (5, 5)), 2, 2, "bicubic")
+
+
+@pytest.mark.parametrize("mode", ["nearest", "bilinear", "area"])
+@pytest.mark.parametrize("shape, dtype", [((97, 131), np.uint8), ((256, 192, 3), np.uint8), ((128, 96), np.uint16)])
+def test_resize_many_matches_resize_image(mode, shape, dtype):
+    image = random_image(5, shape, dtype)
+    # Inclui tamanhos que partem de níveis da pirâmide (256x192 -> 64x48, 32x24, 16x12)
+    sizes = [(13, 9), (96, 64), (64, 48), (32, 24), (16, 12), (12, 8), (3, 1), (1, 1), (200, 150), (131, 97)]
+    written = {}
+    results = resize_many(image, sizes, mode, writer=lambda w, h, pixels: written.update({(w, h): pixels}))
+    assert list(results) == sizes and written.keys() == results.keys()
+    for size, resized in results.items():
+        assert np.array_equal(resized, resize_image(image, *size, mode)), size
+
+
+def test_resize_many_errors():
+    with pytest.raises(ValueError):
+        resize_many(random_image(6, (8, 8)), [(4, 4), (0, 2)])
+
+    def fail(width, height, pixels):
+        raise OSError("disco cheio")
+
+    with pytest.raises(OSError):
+        resize_many(random_image(6, (8, 8)), [(4, 4)], writer=fail)
+
+
+@pytest.mark.parametrize("mode", ["nearest", "bilinear", "area"])
+@pytest.mark.parametrize("shape, size", [((97, 131, 3), (50, 37)), ((64, 48), (200, 151)), ((30, 41), (7, 3))])
+def test_parallel_matches_serial(mode, shape, size):
+    # Alturas que não se dividem igualmente entre as faixas, e menos linhas que faixas
+    image = random_image(7, shape, np.uint16)
+    serial = resize_image(image, *size, mode)
+    assert np.array_equal(resize_image(image, *size, mode, workers=3), serial)
+
+
+def test_parallel_releases_shared_memory_on_error(monkeypatch):
+    created = []
+
+    class RecordingSharedMemory(resize_module.SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            if kwargs.get("create"):
+                created.append(self.name)
+
+    monkeypatch.setattr(resize_module, "SharedMemory", RecordingSharedMemory)
+    # Um modo desconhecido só falha dentro dos processos de trabalho
+    with pytest.raises(ValueError):
+        resize_module._resize_parallel(random_image(8, (40, 30)), 20, 15, "bicubic", 2)
+    assert len(created) == 2
+    for name in created:
+        with pytest.raises(FileNotFoundError):
+            resize_module.SharedMemory(name=name)
@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+
+from compress.compress import MAX_PACKET, rle_compress, rle_decode, rle_decompress, rle_encode
+
+
+def legacy_rle_compress(image: np.ndarray) -> list[int]:
+    """Codificador original de compress.py (laços por amostra, saída em lista)."""
+    compressed_data = []
+    for row in image.tolist():
+        for channel in zip(*row):
+            i = 0
+            while i < len(channel):
+                run_length = 1
+                while (i + run_length < len(channel) and channel[i] == channel[i + run_length]
+                       and run_length < 127):
+                    run_length += 1
+                if run_length > 1:
+                    compressed_data += [run_length, channel[i]]
+                    i += run_length
+                else:
+                    start = i
+                    while (i < len(channel) and (i + 1 == len(channel) or channel[i] != channel[i + 1])
+                           and i - start < 127):
+                        i += 1
+                    compressed_data.append(-(i - start))
+                    compressed_data.extend(channel[start:i])
+    return compressed_data
+
+
+def legacy_rle_decompress(width: int, height: int, compressed_data: list[int]) -> np.ndarray:
+    """Decodificador original de compress.py."""
+    rows, i = [], 0
+    for _ in range(height):
+        row = []
+        for _ in range(3):
+            channel = []
+            while len(channel) < width:
+                count = compressed_data[i]
+                if count > 0:
+                    channel.extend([compressed_data[i + 1]] * count)
+                    i += 2
+                else:
+                    channel.extend(compressed_data[i + 1:i + 1 - count])
+                    i += 1 - count
+            row.append(channel)
+        rows.append(list(zip(*row)))
+    return np.array(rows).reshape(height, width, 3)
+
+
+def as_tokens(data: bytes) -> list[int]:
+    """Lê um fluxo de 8 bits como a lista de inteiros do formato original."""
+    stream, tokens, i = np.frombuffer(data, dtype=np.uint8), [], 0
+    while i < stream.size:
+        control = int(stream[i].astype(np.int8))
+        size = 1 if control > 0 else -control
+        tokens += [control, *stream[i + 1:i + 1 + size].tolist()]
+        i += 1 + size
+    return tokens
+
+
+def random_image(rng: np.random.Generator) -> tuple[np.ndarray, int]:
+    """Imagem RGB aleatória com poucos níveis, para gerar sequências curtas e longas."""
+    height = int(rng.integers(1, 8))
+    width = int(rng.integers(1, 600))
+    maxval = int(rng.choice([1, 15, 255, 65535]))
+    levels = int(rng.integers(1, 5))
+    image = rng.integers(0, levels, (height, width, 3)) * (maxval // max(levels - 1, 1))
+    image = np.repeat(image, rng.integers(1, 300, width), axis=1)[:, :width]
+    return image.astype(np.uint8 if maxval < 256 else np.uint16), maxval
+
+
+def round_trip(image: np.ndarray, maxval: int = 255) -> bytes:
+    height, width = image.shape[:2]
+    compressed = rle_compress(width, height, image, maxval)[2]
+    assert np.array_equal(rle_decompress(width, height, compressed, maxval, image.shape[2]), image)
+    return compressed
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_round_trip_random(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(100):
+        round_trip(*random_image(rng))
+
+
+@pytest.mark.parametrize("shape", [(0, 5, 3), (3, 0, 3), (0, 0, 1)])
+def test_empty_input(shape):
+    assert round_trip(np.empty(shape, dtype=np.uint8)) == b""
+    assert rle_encode(np.empty(0, dtype=np.uint8), 1) == b""
+    assert rle_decode(b"", 0).size == 0
+
+
+@pytest.mark.parametrize("length", [1, 2, 126, 127, 128, 129, 254, 255, 256, 1000])
+def test_run_lengths(length):
+    image = np.full((1, length, 1), 9, dtype=np.uint8)
+    compressed = round_trip(image)
+    # Repetições de até 127 amostras por pacote (controle + amostra)
+    packets = -(-length // MAX_PACKET)
+    if length % MAX_PACKET != 1:
+        assert len(compressed) == 2 * packets
+
+
+@pytest.mark.parametrize("length", [1, 2, 127, 128, 129, 300])
+def test_literal_lengths(length):
+    image = (np.arange(length, dtype=np.uint16) % 256).astype(np.uint8).reshape(1, length, 1)
+    compressed = round_trip(image)
+    assert len(compressed) == length + -(-length // MAX_PACKET)
+
+
+@pytest.mark.parametrize("samples", [
+    [1, 2, 2],
+    [2, 2, 1],
+    [1, 2, 2, 3],
+    [1, 1, 2, 3, 3],
+    [1, 2, 3, 3, 3, 4, 5],
+    [7] * 127 + [8],
+    [8] + [7] * 128 + [9, 10],
+    list(range(127)) + [200, 200],
+])
+def test_literal_run_boundaries(samples):
+    round_trip(np.array(samples, dtype=np.uint8).reshape(1, -1, 1))
+
+
+def test_runs_do_not_cross_rows_or_channels():
+    image = np.zeros((3, 4, 3), dtype=np.uint8)
+    compressed = round_trip(image)
+    # Um pacote por linha de cada canal
+    assert len(compressed) == 2 * 3 * 3
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_legacy_codec(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(30):
+        image, _ = random_image(rng)
+        image = (image.astype(np.int64) % 256).astype(np.uint8)
+        height, width = image.shape[:2]
+        compressed = rle_compress(width, height, image)[2]
+        # O fluxo novo é legível pelo decodificador original e vice-versa
+        assert np.array_equal(legacy_rle_decompress(width, height, as_tokens(compressed)), image)
+        legacy = np.array(legacy_rle_compress(image), dtype=np.int64).astype(np.uint8).tobytes()
+        assert np.array_equal(rle_decompress(width, height, legacy), image)
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from compress.compress import RLE_HEADER, compress_file, read_rle, rle_compress, write_rle
+from netpbm import write_pgm, write_ppm
+
+
+def image(shape: tuple[int, ...], maxval: int, seed: int = 0) -> np.ndarray:
+    """Imagem com sequências longas e curtas."""
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, maxval, shape, endpoint=True)
+    pixels[::3] = pixels[::3, :1]
+    return pixels.astype(np.uint8 if maxval < 256 else np.uint16)
+
+
+@pytest.mark.parametrize("shape, maxval", [((40, 33, 3), 255), ((25, 17), 65535), ((1, 1, 3), 1)])
+@pytest.mark.parametrize("rows", [1, 7, 256])
+def test_round_trip(tmp_path, shape, maxval, rows):
+    pixels = image(shape, maxval)
+    write_rle(tmp_path / "a.rle", pixels, maxval, rows=rows)
+
+    width, height, file_maxval, decoded = read_rle(tmp_path / "a.rle")
+    assert (width, height, file_maxval) == (shape[1], shape[0], maxval)
+    assert np.array_equal(decoded, pixels)
+
+
+def test_row_ranges(tmp_path):
+    pixels = image((50, 20, 3), 255)
+    write_rle(tmp_path / "a.rle", pixels, rows=8)
+    for start, stop in [(0, 1), (7, 9), (13, 50), (49, 50), (20, 20)]:
+        assert np.array_equal(read_rle(tmp_path / "a.rle", start, stop)[3], pixels[start:stop])
+    with pytest.raises(ValueError):
+        read_rle(tmp_path / "a.rle", 10, 51)
+
+
+def test_stream_matches_single_band_codec(tmp_path):
+    pixels = image((30, 12, 3), 255)
+    write_rle(tmp_path / "a.rle", pixels, rows=4)
+    # Blocos independentes não mudam o fluxo: cada linha já é codificada à parte
+    stream = (tmp_path / "a.rle").read_bytes()[-len(rle_compress(12, 30, pixels)[2]):]
+    assert stream == rle_compress(12, 30, pixels)[2]
+
+
+def test_parallel_matches_serial(tmp_path):
+    pixels = image((64, 40, 3), 255)
+    write_rle(tmp_path / "a.rle", pixels, rows=8)
+    write_rle(tmp_path / "b.rle", pixels, rows=8, workers=2)
+    assert (tmp_path / "a.rle").read_bytes() == (tmp_path / "b.rle").read_bytes()
+
+
+def test_detects_corruption(tmp_path):
+    pixels = image((10, 10, 3), 255)
+    write_rle(tmp_path / "a.rle", pixels)
+    data = bytearray((tmp_path / "a.rle").read_bytes())
+
+    damaged = data.copy()
+    damaged[-1] ^= 0xFF
+    (tmp_path / "b.rle").write_bytes(damaged)
+    with pytest.raises(ValueError):
+        read_rle(tmp_path / "b.rle")
+    # Só a última linha foi danificada: as demais continuam legíveis
+    assert np.array_equal(read_rle(tmp_path / "b.rle", 0, 9)[3], pixels[:9])
+
+    damaged = data.copy()
+    damaged[RLE_HEADER.size] ^= 0xFF
+    (tmp_path / "c.rle").write_bytes(damaged)
+    with pytest.raises(ValueError):
+        read_rle(tmp_path / "c.rle")
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_compress_file(tmp_path, binary):
+    gray, color = image((21, 13), 255, 1), image((9, 31, 3), 65535, 2)
+    write_pgm(tmp_path / "a.pgm", gray, 255, binary=binary)
+    write_ppm(tmp_path / "a.ppm", color, 65535, binary=binary)
+
+    compress_file(tmp_path / "a.pgm", tmp_path / "a.rle", rows=4)
+    compress_file(tmp_path / "a.ppm", tmp_path / "b.rle", rows=4)
+    assert np.array_equal(read_rle(tmp_path / "a.rle")[3], gray)
+    assert np.array_equal(read_rle(tmp_path / "b.rle")[3], color)
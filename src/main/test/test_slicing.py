@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from slicing.slicing import (ROWS_PER_PASS, BitPlanes, ProgressiveReconstruction, generate_bit_planes,
+                             generate_gray_code_planes, generate_gray_planes, gray_decode, gray_encode, plane_mask,
+                             progressive_previews, reconstruct, reconstruct_image_from_msb)
+
+
+def legacy_planes(image: np.ndarray) -> list[np.ndarray]:
+    """Planos originais de slicing.py: um array (im >> i) & 1 por bit."""
+    return [(image >> i) & 1 for i in range(image.dtype.itemsize * 8)]
+
+
+def legacy_msb(image: np.ndarray) -> np.ndarray:
+    """Reconstrução original: soma dos 3 planos mais significativos com o seu valor posicional."""
+    msb_planes = legacy_planes(image)[-3:]
+    return sum(plane * (2**(5 + i)) for i, plane in enumerate(msb_planes))
+
+
+def random_image(seed: int, shape: tuple[int, ...], dtype: type = np.uint8) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, np.iinfo(dtype).max, shape, dtype=dtype, endpoint=True)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.dtype(">u2"), np.int16])
+@pytest.mark.parametrize("shape", [(1, 1), (7, 13), (ROWS_PER_PASS + 3, 17), (5, 64)])
+def test_planes_match_shifts(dtype, shape):
+    image = random_image(0, shape, np.dtype(dtype).newbyteorder("=").type).astype(dtype)
+    planes = generate_bit_planes(image)
+    assert len(planes) == image.dtype.itemsize * 8
+    assert planes.shape == shape
+    for plane, expected in zip(planes, legacy_planes(image)):
+        assert np.array_equal(np.asarray(plane), expected)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+def test_non_contiguous_input(dtype):
+    rgb = random_image(1, (40, 30, 3), dtype)
+    for view in (rgb[..., 1], rgb[5:30, 3:27, 0], rgb[::2, ::3, 2], rgb[..., 0].T):
+        assert not view.flags.c_contiguous
+        for plane, expected in zip(BitPlanes(view), legacy_planes(view)):
+            assert np.array_equal(np.asarray(plane), expected)
+
+
+def test_gray_planes_have_place_value():
+    image = random_image(2, (9, 11))
+    for plane, expected in zip(generate_gray_planes(generate_bit_planes(image)), legacy_planes(image)):
+        assert np.array_equal(np.asarray(plane), expected * (1 << plane.bit))
+
+
+def test_packed_size_and_indexing():
+    image = random_image(3, (10, 20), np.uint16)
+    planes = BitPlanes(image)
+    assert planes.nbytes == 16 * 10 * 3
+    assert np.array_equal(np.asarray(planes[-1]), np.asarray(planes[15]))
+    with pytest.raises(IndexError):
+        planes[16]
+    with pytest.raises(ValueError):
+        BitPlanes(np.zeros((2, 2, 3), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        BitPlanes(np.zeros((2, 2), dtype=np.uint32))
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+def test_reconstruct_matches_plane_sum(dtype):
+    image = random_image(4, (12, 19), dtype)
+    planes = legacy_planes(image)
+    for chosen in ([], [0], [1, 3, 5], list(range(len(planes))), [len(planes) - 1]):
+        expected = sum((planes[bit].astype(np.int64) << bit for bit in chosen), np.zeros(image.shape, np.int64))
+        reconstructed = reconstruct(image, chosen)
+        assert reconstructed.dtype == image.dtype
+        assert np.array_equal(reconstructed, expected)
+    with pytest.raises(ValueError):
+        plane_mask([8], 8)
+
+
+def test_msb_matches_legacy():
+    image = random_image(5, (16, 16))
+    assert np.array_equal(reconstruct_image_from_msb(image), legacy_msb(image))
+    assert np.array_equal(reconstruct_image_from_msb(image, 8), image)
+    assert not reconstruct_image_from_msb(image, 0).any()
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+def test_gray_code_round_trip(dtype):
+    levels = np.arange(np.iinfo(dtype).max + 1, dtype=dtype)
+    code = gray_encode(levels)
+    assert np.array_equal(gray_decode(code), levels)
+    # Níveis vizinhos diferem em um único bit
+    assert all(bin(change).count("1") == 1 for change in (code[1:] ^ code[:-1]).tolist())
+    assert len(np.unique(code)) == levels.size
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+@pytest.mark.parametrize("gray", [False, True])
+def test_progressive_previews_match_msb(dtype, gray):
+    image = random_image(6, (21, 10), dtype)
+    planes = generate_gray_code_planes(image) if gray else generate_bit_planes(image)
+    previews = list(progressive_previews(planes, gray))
+    assert len(previews) == len(planes)
+    for count, preview in enumerate(previews, 1):
+        assert np.array_equal(preview, reconstruct_image_from_msb(image, count))
+    assert np.array_equal(previews[-1], image)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16])
+@pytest.mark.parametrize("gray", [False, True])
+def test_previews_from_positional_planes(dtype, gray):
+    image = random_image(7, (13, 21), dtype)
+    planes = generate_gray_code_planes(image) if gray else generate_bit_planes(image)
+    # Planos de cinza: cada plano já vem multiplicado pelo seu valor posicional
+    positional = generate_gray_planes(planes)
+    receiver = ProgressiveReconstruction(image.shape, len(planes), gray)
+    for count, plane in enumerate(reversed(positional), 1):
+        assert plane.scale == 1 << plane.bit
+        assert np.array_equal(receiver.add(plane), reconstruct_image_from_msb(image, count))
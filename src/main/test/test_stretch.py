@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from histogram.stretch import contrast_stretch, stretch_bounds, stretch_luts
+
+
+def legacy_stretch(pixels: np.ndarray, out_max: int = 255) -> np.ndarray:
+    """Alargamento original de enhance_histogram_ppm (Y = aX + b com mínimo e máximo de cada canal)."""
+    samples = pixels.reshape(-1, pixels.shape[2] if pixels.ndim == 3 else 1)
+    x_min, x_max = samples.min(axis=0), samples.max(axis=0)
+    a = out_max / (x_max - x_min)
+    return (a * pixels.reshape(samples.shape) - a * x_min).astype(pixels.dtype).reshape(pixels.shape)
+
+
+def random_pixels(seed: int, shape: tuple[int, ...], low: int, high: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(low, high, shape, dtype=np.uint8 if high < 256 else np.uint16, endpoint=True)
+
+
+@pytest.mark.parametrize("shape", [(20, 30), (15, 12, 3)])
+def test_matches_legacy_formula(shape):
+    pixels = random_pixels(0, shape, 40, 180)
+    assert np.array_equal(contrast_stretch(pixels, 255), legacy_stretch(pixels))
+
+
+@pytest.mark.parametrize("maxval", [1, 100, 255, 1000, 65535])
+@pytest.mark.parametrize("shape", [(11, 13), (9, 7, 3)])
+def test_in_place_matches_copy(maxval, shape):
+    pixels = random_pixels(maxval, shape, maxval // 4, maxval * 3 // 4 or 1)
+    stretched = contrast_stretch(pixels, maxval, 1, 99)
+    assert stretched is not pixels
+
+    in_place = pixels.copy()
+    assert contrast_stretch(in_place, maxval, 1, 99, in_place=True) is in_place
+    assert np.array_equal(in_place, stretched)
+
+
+@pytest.mark.parametrize("maxval", [100, 255, 65535])
+def test_flat_channel_is_unchanged(maxval):
+    pixels = random_pixels(1, (10, 10, 3), 10, maxval // 2)
+    pixels[..., 1] = maxval // 3
+    stretched = contrast_stretch(pixels, maxval)
+    assert np.array_equal(stretched[..., 1], pixels[..., 1])
+    assert np.array_equal(stretched[..., ::2], legacy_stretch(pixels[..., ::2], maxval))
+
+    in_place = pixels.copy()
+    contrast_stretch(in_place, maxval, in_place=True)
+    assert np.array_equal(in_place, stretched)
+
+
+def test_luts_have_one_entry_per_level():
+    for maxval in (1, 100, 255, 1000, 65535):
+        luts = stretch_luts(np.array([0, 5]), np.array([maxval, 5]), maxval, maxval)
+        assert luts.shape == (2, maxval + 1)
+        assert luts[0, -1] == maxval
+
+
+def test_maxval_100_stretches_to_full_range():
+    pixels = random_pixels(2, (8, 9, 3), 20, 60)
+    stretched = contrast_stretch(pixels, 100)
+    samples = stretched.reshape(-1, 3)
+    assert samples.min(axis=0).tolist() == [0, 0, 0]
+    assert samples.max(axis=0).tolist() == [100, 100, 100]
+    assert np.array_equal(stretched, legacy_stretch(pixels, 100))
+
+
+def test_bounds_are_percentiles():
+    pixels = random_pixels(3, (30, 30), 0, 255)
+    lower, upper = stretch_bounds(pixels, 255, 5, 95)
+    expected = np.percentile(pixels.ravel(), [5, 95], method="inverted_cdf")
+    assert [lower[0], upper[0]] == expected.tolist()
+
+
+def test_out_max_and_in_place_dtype():
+    pixels = random_pixels(4, (5, 5), 0, 15)
+    assert contrast_stretch(pixels, 15, out_max=255).max() == 255
+    with pytest.raises(ValueError):
+        contrast_stretch(pixels, 15, out_max=65535, in_place=True)